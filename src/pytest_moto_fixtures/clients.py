@@ -0,0 +1,79 @@
+"""Cache of AWS clients."""
+
+import os
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import boto3
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from botocore.config import Config
+
+
+class ClientCache:
+    """Cache of boto3 session and clients.
+
+    Creating a client loads the service model and builds a connection pool, so reusing clients avoids this cost on
+    each test. Clients are shared by service, region and config, and clients created with the same instance of config
+    are shared.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._lock = Lock()
+        self._session: boto3.Session | None = None
+        self._clients: dict[tuple[str, str | None, Config | None], BaseClient] = {}
+
+    def __len__(self) -> int:
+        """Number of clients in cache.
+
+        Returns:
+            Number of clients.
+        """
+        return len(self._clients)
+
+    @property
+    def session(self) -> boto3.Session:
+        """Session used to create the clients."""
+        with self._lock:
+            if self._session is None:
+                self._session = boto3.Session()
+            return self._session
+
+    def client(
+        self, service_name: str, *, region_name: str | None = None, config: 'Config | None' = None
+    ) -> 'BaseClient':
+        """Get a client from the cache, creating it on first use.
+
+        Args:
+            service_name: Name of AWS service.
+            region_name: Region of client. If it is ``None`` the region of ``AWS_DEFAULT_REGION`` environment variable
+                will be used.
+            config: Advanced configuration of client.
+
+        Returns:
+            Client of AWS service.
+        """
+        if region_name is None:
+            region_name = os.environ.get('AWS_DEFAULT_REGION')
+        key = (service_name, region_name, config)
+        client = self._clients.get(key)
+        if client is None:
+            session = self.session
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = session.client(service_name, region_name=region_name, config=config)  # type: ignore[call-overload]
+                    self._clients[key] = client
+        return client
+
+    def clear(self) -> None:
+        """Discard the session and all clients in cache."""
+        with self._lock:
+            self._session = None
+            self._clients.clear()
+
+
+client_cache = ClientCache()
+"""Cache of clients shared by the process."""
@@ -0,0 +1,122 @@
+"""Durations of setup and teardown of fixtures."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any
+
+
+@dataclass(kw_only=True, frozen=True)
+class FixtureDuration:
+    """Durations accumulated by a fixture."""
+
+    name: str
+    """Fixture name."""
+    calls: int
+    """Number of times the fixture was set up."""
+    setup: float
+    """Seconds spent in setup, excluding the setup of fixtures requested by it."""
+    teardown: float
+    """Seconds spent in teardown, excluding the teardown of fixtures requested by it."""
+
+    @property
+    def total(self) -> float:
+        """Seconds spent in setup and teardown."""
+        return self.setup + self.teardown
+
+
+class FixtureDurations:
+    """Recorder of durations of setup and teardown of fixtures.
+
+    Setups of fixtures are nested, because a fixture sets up the fixtures requested by it, so the time of nested setups
+    is discounted from the fixture that requested them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty recorder."""
+        self._calls: dict[str, int] = {}
+        self._setup: dict[str, float] = {}
+        self._teardown: dict[str, float] = {}
+        self._stack: list[_Setup] = []
+        self._teardown_start: dict[int, float] = {}
+
+    def start_setup(self) -> None:
+        """Mark the start of setup of a fixture."""
+        self._stack.append(_Setup(start=perf_counter()))
+
+    def stop_setup(self, name: str | None) -> None:
+        """Mark the end of setup of the fixture started last.
+
+        Args:
+            name: Name of fixture, or ``None`` to only discount its duration from the fixture that requested it.
+        """
+        setup = self._stack.pop()
+        elapsed = perf_counter() - setup.start
+        if self._stack:
+            self._stack[-1].nested += elapsed
+        if name is not None:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._setup[name] = self._setup.get(name, 0.0) + elapsed - setup.nested
+
+    def start_teardown(self, key: int) -> None:
+        """Mark the start of teardown of a fixture.
+
+        Args:
+            key: Identifier of fixture instance.
+        """
+        self._teardown_start[key] = perf_counter()
+
+    def stop_teardown(self, key: int, name: str) -> None:
+        """Mark the end of teardown of a fixture.
+
+        Args:
+            key: Identifier of fixture instance, the same used in :meth:`start_teardown`.
+            name: Name of fixture.
+        """
+        start = self._teardown_start.pop(key, None)
+        if start is not None:
+            self._teardown[name] = self._teardown.get(name, 0.0) + perf_counter() - start
+
+    def merge(self, durations: Iterable[Mapping[str, Any]]) -> None:
+        """Add durations recorded elsewhere, like in pytest-xdist workers.
+
+        Args:
+            durations: Durations in the format of :meth:`to_list`.
+        """
+        for duration in durations:
+            name = duration['name']
+            self._calls[name] = self._calls.get(name, 0) + duration['calls']
+            self._setup[name] = self._setup.get(name, 0.0) + duration['setup']
+            self._teardown[name] = self._teardown.get(name, 0.0) + duration['teardown']
+
+    def summary(self) -> list[FixtureDuration]:
+        """Durations by fixture, slowest first.
+
+        Returns:
+            Durations of each fixture.
+        """
+        durations = [
+            FixtureDuration(
+                name=name, calls=calls, setup=self._setup.get(name, 0.0), teardown=self._teardown.get(name, 0.0)
+            )
+            for name, calls in self._calls.items()
+        ]
+        return sorted(durations, key=lambda duration: (-duration.total, duration.name))
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Durations by fixture as JSON serializable values, slowest first.
+
+        Returns:
+            Durations of each fixture.
+        """
+        return [asdict(duration) for duration in self.summary()]
+
+
+@dataclass(kw_only=True)
+class _Setup:
+    """Setup of fixture in progress."""
+
+    start: float
+    """Time of start of setup."""
+    nested: float = 0.0
+    """Seconds spent in setups of fixtures requested by it."""
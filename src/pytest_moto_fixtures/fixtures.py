@@ -1,97 +1,582 @@
-"""Fixtures for pytest."""
+"""Fixtures for pytest.
 
-from collections.abc import Iterator
-from typing import TYPE_CHECKING
-from unittest.mock import patch
+Modules of boto3, moto and services are imported when a fixture is first requested, so loading the plugin does not add
+their import time to test runs that do not use AWS fixtures. By default, moto is still imported on pytest
+configuration, because clients created before its import are not mocked. Enable the ``moto_lazy_import`` ini option
+to defer it too.
+"""
+
+import json
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import AbstractContextManager
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
-import boto3
 import pytest
-from moto import mock_aws
 
-from pytest_moto_fixtures.services.eventbridge import EventBridgeBus, eventbridge_create_bus
-from pytest_moto_fixtures.services.s3 import S3Bucket, s3_create_bucket
-from pytest_moto_fixtures.services.sns import SNSTopic, sns_create_fifo_topic, sns_create_topic
-from pytest_moto_fixtures.services.sqs import SQSQueue, sqs_create_fifo_queue, sqs_create_queue
+from pytest_moto_fixtures.durations import FixtureDurations
+from pytest_moto_fixtures.utils import skip_resource_removal, xdist_worker_number
 
 if TYPE_CHECKING:
+    from botocore.client import BaseClient
     from types_boto3_events import EventBridgeClient
     from types_boto3_s3 import S3Client
     from types_boto3_sns import SNSClient
     from types_boto3_sqs import SQSClient
 
+    from pytest_moto_fixtures.services.aio import AsyncEventBridgeBus, AsyncS3Bucket, AsyncSNSTopic, AsyncSQSQueue
+    from pytest_moto_fixtures.services.eventbridge import EventBridgeBus
+    from pytest_moto_fixtures.services.s3 import S3Bucket
+    from pytest_moto_fixtures.services.sns import SNSTopic
+    from pytest_moto_fixtures.services.sqs import SQSQueue, SQSQueuePool
+
+
+AWS_ENVIRON = {
+    'AWS_IGNORE_CONFIGURED_ENDPOINT_URLS': 'true',
+    'AWS_DEFAULT_REGION': 'us-east-1',
+}
+"""Environment variables configured for AWS mock."""
+
+_DURATIONS_KEY = pytest.StashKey[FixtureDurations]()
+_MOCKED_FIXTURES_KEY = pytest.StashKey[set[str]]()
+_SKIPPED_REMOVALS_KEY = pytest.StashKey[dict[int, AbstractContextManager[None]]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register options of plugin.
+
+    Args:
+        parser: Parser of pytest options.
+    """
+    parser.addoption(
+        '--moto-durations',
+        type=int,
+        metavar='N',
+        default=None,
+        help='Show N slowest setup/teardown durations of moto fixtures (N=0 for all).',
+    )
+    parser.addoption(
+        '--moto-durations-json',
+        metavar='PATH',
+        default=None,
+        help='Write setup/teardown durations of moto fixtures to PATH in JSON format.',
+    )
+    parser.addini(
+        'moto_lazy_import',
+        type='bool',
+        default=False,
+        help='Import moto only when a fixture is first requested. Clients created before it are not mocked.',
+    )
+    parser.addini(
+        'moto_session_mock',
+        type='bool',
+        default=False,
+        help='Start the AWS mock once per session and reset the state of used backends after each test.',
+    )
+    parser.addini(
+        'moto_sqs_queue_pool',
+        type='bool',
+        default=False,
+        help='Reuse the queues of sqs_queue and sqs_fifo_queue fixtures between tests. Requires moto_session_mock.',
+    )
+    parser.addini(
+        'moto_client_cache',
+        type='bool',
+        default=False,
+        help='Reuse the clients of sqs_client, sns_client, s3_client and eventbridge_client fixtures between tests.',
+    )
+    parser.addini(
+        'moto_fast_transport',
+        type='bool',
+        default=False,
+        help='Send supported calls of client fixtures directly to moto backends, skipping the HTTP serialization.',
+    )
+    parser.addini(
+        'moto_lazy_resources',
+        type='bool',
+        default=False,
+        help='Create the queues of sns_topic, sns_fifo_topic and eventbridge_bus fixtures only on first use.',
+    )
+    parser.addini(
+        'moto_sns_raw_message_delivery',
+        type='bool',
+        default=False,
+        help='Subscribe the queues of sns_topic and sns_fifo_topic fixtures with raw message delivery.',
+    )
+    parser.addini(
+        'moto_fast_teardown',
+        type='bool',
+        default=False,
+        help='Skip the removal of resources on teardown of fixtures using the AWS mock, as its state is discarded.',
+    )
+    parser.addini(
+        'moto_xdist_isolation',
+        type='bool',
+        default=False,
+        help='Use a different AWS account in each pytest-xdist worker.',
+    )
+    parser.addini(
+        'moto_xdist_regions',
+        type='linelist',
+        default=[],
+        help='AWS regions distributed between pytest-xdist workers. Requires moto_xdist_isolation.',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Check options of plugin and import moto, unless the ``moto_lazy_import`` ini option is enabled.
+
+    Args:
+        config: Pytest config.
+    """
+    if config.getini('moto_sqs_queue_pool') and not config.getini('moto_session_mock'):
+        msg = 'moto_sqs_queue_pool option requires moto_session_mock option'
+        raise pytest.UsageError(msg)
+    if not config.getini('moto_lazy_import'):
+        import moto
+    if config.getoption('moto_durations') is not None or config.getoption('moto_durations_json') is not None:
+        config.stash[_DURATIONS_KEY] = FixtureDurations()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_fixture_setup(
+    fixturedef: pytest.FixtureDef[Any], request: pytest.FixtureRequest
+) -> Generator[None, Any, Any]:
+    """Record the duration of setup of fixtures, and skip the removal of resources on their teardown.
+
+    The duration is recorded if the ``--moto-durations`` option is used, and the removal of resources is skipped for
+    fixtures using the in-process AWS mock if the ``moto_fast_teardown`` ini option is enabled.
+
+    Args:
+        fixturedef: Definition of fixture.
+        request: Request of fixture.
+    """
+    result = yield from _record_setup_duration(fixturedef, request)
+    if _uses_process_mock(fixturedef, request):
+        fixturedef.addfinalizer(partial(_skip_resource_removal, request.config, fixturedef))
+    return result
+
+
+def pytest_fixture_post_finalizer(fixturedef: pytest.FixtureDef[Any], request: pytest.FixtureRequest) -> None:
+    """Restore the removal of resources after teardown of fixture, and record the duration of teardown.
+
+    The removal of resources is restored if it was skipped by the ``moto_fast_teardown`` ini option, and the duration
+    of teardown is recorded if the ``--moto-durations`` option is used.
+
+    Args:
+        fixturedef: Definition of fixture.
+        request: Request of fixture.
+    """
+    skip = request.config.stash.get(_SKIPPED_REMOVALS_KEY, {}).pop(id(fixturedef), None)
+    if skip is not None:
+        skip.__exit__(None, None, None)
+    durations = request.config.stash.get(_DURATIONS_KEY, None)
+    if durations is not None and _is_moto_fixture(fixturedef):
+        durations.stop_teardown(id(fixturedef), fixturedef.argname)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: object) -> None:  # noqa: ANN401
+    """Collect the durations of fixtures recorded by a pytest-xdist worker.
+
+    Args:
+        node: Worker node.
+        error: Error of worker, if it failed.
+    """
+    durations = node.config.stash.get(_DURATIONS_KEY, None)
+    output = getattr(node, 'workeroutput', {})
+    if durations is not None and 'moto_durations' in output:
+        durations.merge(output['moto_durations'])
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Send the durations of fixtures to pytest-xdist controller, or write them in JSON format.
+
+    Args:
+        session: Pytest session.
+    """
+    durations = session.config.stash.get(_DURATIONS_KEY, None)
+    if durations is None:
+        return
+    if hasattr(session.config, 'workeroutput'):
+        session.config.workeroutput['moto_durations'] = durations.to_list()
+        return
+    path = session.config.getoption('moto_durations_json')
+    if path is not None:
+        Path(path).write_text(json.dumps({'fixtures': durations.to_list()}, indent=2))
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    """Show the durations of fixtures if the ``--moto-durations`` option is used.
+
+    Args:
+        terminalreporter: Terminal reporter of pytest.
+        config: Pytest config.
+    """
+    durations = config.stash.get(_DURATIONS_KEY, None)
+    count = config.getoption('moto_durations')
+    if durations is None or count is None or hasattr(config, 'workeroutput'):
+        return
+    summary = durations.summary()
+    if count:
+        terminalreporter.write_sep('=', f'slowest {count} moto fixture durations')
+        summary = summary[:count]
+    else:
+        terminalreporter.write_sep('=', 'moto fixture durations')
+    terminalreporter.write_line(f'{"total":>9} {"setup":>9} {"teardown":>9} {"calls":>6}  fixture')
+    for duration in summary:
+        terminalreporter.write_line(
+            f'{duration.total:>8.3f}s {duration.setup:>8.3f}s {duration.teardown:>8.3f}s {duration.calls:>6}  '
+            f'{duration.name}'
+        )
+
+
+@pytest.fixture(scope='session')
+def aws_environ(pytestconfig: pytest.Config) -> dict[str, str]:
+    """Environment variables for AWS mock.
+
+    If the ``moto_xdist_isolation`` ini option is enabled and the tests run in a pytest-xdist worker, each worker uses
+    its own AWS account, and its own region if regions are listed in the ``moto_xdist_regions`` ini option.
+    """
+    from moto.core.models import DEFAULT_ACCOUNT_ID
+
+    environ = dict(AWS_ENVIRON)
+    worker = xdist_worker_number()
+    if worker is not None and pytestconfig.getini('moto_xdist_isolation'):
+        environ['MOTO_ACCOUNT_ID'] = str(int(DEFAULT_ACCOUNT_ID) + worker)
+        regions = pytestconfig.getini('moto_xdist_regions')
+        if regions:
+            environ['AWS_DEFAULT_REGION'] = regions[worker % len(regions)]
+    return environ
+
+
+@pytest.fixture(scope='session')
+def aws_session_mock(aws_environ: dict[str, str]) -> Iterator[None]:
+    """AWS mock shared by all tests of session."""
+    from unittest.mock import patch
+
+    from moto import mock_aws
+
+    with patch.dict('os.environ', aws_environ), mock_aws():
+        yield
+
 
 @pytest.fixture
-def aws_config() -> Iterator[None]:
-    """Configure AWS mock."""
-    config = {
-        'AWS_IGNORE_CONFIGURED_ENDPOINT_URLS': 'true',
-        'AWS_DEFAULT_REGION': 'us-east-1',
-    }
-    with patch.dict('os.environ', config), mock_aws():
+def aws_config(request: pytest.FixtureRequest, aws_environ: dict[str, str]) -> Iterator[None]:
+    """Configure AWS mock.
+
+    If the ``moto_session_mock`` ini option is enabled, the mock is shared with the whole session and only the
+    backends used by the test are reset after it.
+    """
+    from unittest.mock import patch
+
+    from moto import mock_aws
+
+    if not request.config.getini('moto_session_mock'):
+        with patch.dict('os.environ', aws_environ), mock_aws():
+            yield
+        return
+
+    request.getfixturevalue('aws_session_mock')
+    pool: Iterable[SQSQueue] = ()
+    if request.config.getini('moto_sqs_queue_pool'):
+        pool = request.getfixturevalue('sqs_queue_pool')
+    with patch.dict('os.environ', aws_environ):
         yield
+    _reset_backends(preserved_queues=pool)
 
 
 @pytest.fixture
-def sqs_client(aws_config: None) -> 'SQSClient':
+def sqs_client(request: pytest.FixtureRequest, aws_config: None) -> 'SQSClient':
     """SQS Client."""
-    return boto3.client('sqs')
+    return cast('SQSClient', _client(request, 'sqs'))
+
+
+@pytest.fixture(scope='session')
+def sqs_queue_pool(aws_session_mock: None) -> Iterator['SQSQueuePool']:
+    """Pool of queues in the SQS service shared by all tests of session."""
+    from pytest_moto_fixtures.services.sqs import SQSQueuePool
+
+    pool = SQSQueuePool()
+    yield pool
+    pool.close()
 
 
 @pytest.fixture
-def sqs_queue(sqs_client: 'SQSClient') -> Iterator[SQSQueue]:
+def sqs_queue(request: pytest.FixtureRequest, sqs_client: 'SQSClient') -> Iterator['SQSQueue']:
     """A queue in the SQS service."""
+    from pytest_moto_fixtures.services.sqs import sqs_create_queue
+
+    if request.config.getini('moto_sqs_queue_pool'):
+        pool: SQSQueuePool = request.getfixturevalue('sqs_queue_pool')
+        with pool.lease(sqs_client=sqs_client) as queue:
+            yield queue
+        return
     with sqs_create_queue(sqs_client=sqs_client) as queue:
         yield queue
 
 
 @pytest.fixture
-def sqs_fifo_queue(sqs_client: 'SQSClient') -> Iterator[SQSQueue]:
+def sqs_fifo_queue(request: pytest.FixtureRequest, sqs_client: 'SQSClient') -> Iterator['SQSQueue']:
     """A fifo queue in the SQS service."""
+    from pytest_moto_fixtures.services.sqs import sqs_create_fifo_queue
+
+    if request.config.getini('moto_sqs_queue_pool'):
+        pool: SQSQueuePool = request.getfixturevalue('sqs_queue_pool')
+        with pool.lease(sqs_client=sqs_client, attributes={'FifoQueue': 'true'}) as queue:
+            yield queue
+        return
     with sqs_create_fifo_queue(sqs_client=sqs_client) as queue:
         yield queue
 
 
 @pytest.fixture
-def sns_client(aws_config: None) -> 'SNSClient':
+def sns_client(request: pytest.FixtureRequest, aws_config: None) -> 'SNSClient':
     """SNS Client."""
-    return boto3.client('sns')
+    return cast('SNSClient', _client(request, 'sns'))
 
 
 @pytest.fixture
-def sns_topic(sns_client: 'SNSClient', sqs_client: 'SQSClient') -> Iterator[SNSTopic]:
-    """A topic in the SNS service."""
-    with sns_create_topic(sns_client=sns_client, sqs_client=sqs_client) as topic:
+def sns_topic(
+    request: pytest.FixtureRequest, sns_client: 'SNSClient', sqs_client: 'SQSClient'
+) -> Iterator['SNSTopic']:
+    """A topic in the SNS service.
+
+    If the ``moto_lazy_resources`` ini option is enabled, the queue of topic is created on first use. If the
+    ``moto_sns_raw_message_delivery`` ini option is enabled, the queue is subscribed with raw message delivery.
+    """
+    from pytest_moto_fixtures.services.sns import sns_create_topic
+
+    with sns_create_topic(
+        sns_client=sns_client,
+        sqs_client=sqs_client,
+        lazy=request.config.getini('moto_lazy_resources'),
+        raw_message_delivery=request.config.getini('moto_sns_raw_message_delivery'),
+    ) as topic:
         yield topic
 
 
 @pytest.fixture
-def sns_fifo_topic(sns_client: 'SNSClient', sqs_client: 'SQSClient') -> Iterator[SNSTopic]:
-    """A fifo topic in the SNS service."""
-    with sns_create_fifo_topic(sns_client=sns_client, sqs_client=sqs_client) as topic:
+def sns_fifo_topic(
+    request: pytest.FixtureRequest, sns_client: 'SNSClient', sqs_client: 'SQSClient'
+) -> Iterator['SNSTopic']:
+    """A fifo topic in the SNS service.
+
+    If the ``moto_lazy_resources`` ini option is enabled, the queue of topic is created on first use. If the
+    ``moto_sns_raw_message_delivery`` ini option is enabled, the queue is subscribed with raw message delivery.
+    """
+    from pytest_moto_fixtures.services.sns import sns_create_fifo_topic
+
+    with sns_create_fifo_topic(
+        sns_client=sns_client,
+        sqs_client=sqs_client,
+        lazy=request.config.getini('moto_lazy_resources'),
+        raw_message_delivery=request.config.getini('moto_sns_raw_message_delivery'),
+    ) as topic:
         yield topic
 
 
 @pytest.fixture
-def s3_client(aws_config: None) -> 'S3Client':
+def s3_client(request: pytest.FixtureRequest, aws_config: None) -> 'S3Client':
     """S3 Client."""
-    return boto3.client('s3')
+    return cast('S3Client', _client(request, 's3'))
 
 
 @pytest.fixture
-def s3_bucket(s3_client: 'S3Client') -> Iterator[S3Bucket]:
+def s3_bucket(s3_client: 'S3Client') -> Iterator['S3Bucket']:
     """A bucket in S3 service."""
+    from pytest_moto_fixtures.services.s3 import s3_create_bucket
+
     with s3_create_bucket(s3_client=s3_client) as bucket:
         yield bucket
 
 
 @pytest.fixture
-def eventbridge_client(aws_config: None) -> 'EventBridgeClient':
+def eventbridge_client(request: pytest.FixtureRequest, aws_config: None) -> 'EventBridgeClient':
     """Event Bridge client."""
-    return boto3.client('events')
+    return cast('EventBridgeClient', _client(request, 'events'))
 
 
 @pytest.fixture
-def eventbridge_bus(eventbridge_client: 'EventBridgeClient', sqs_client: 'SQSClient') -> Iterator[EventBridgeBus]:
-    """A bus in the Event Bridge service."""
-    with eventbridge_create_bus(eventbridge_client=eventbridge_client, sqs_client=sqs_client) as bus:
+def eventbridge_bus(
+    request: pytest.FixtureRequest, eventbridge_client: 'EventBridgeClient', sqs_client: 'SQSClient'
+) -> Iterator['EventBridgeBus']:
+    """A bus in the Event Bridge service.
+
+    If the ``moto_lazy_resources`` ini option is enabled, the queue of bus is created on first use.
+    """
+    from pytest_moto_fixtures.services.eventbridge import eventbridge_create_bus
+
+    lazy = request.config.getini('moto_lazy_resources')
+    with eventbridge_create_bus(eventbridge_client=eventbridge_client, sqs_client=sqs_client, lazy=lazy) as bus:
         yield bus
+
+
+@pytest.fixture
+def async_sqs_queue(sqs_queue: 'SQSQueue') -> 'AsyncSQSQueue':
+    """The ``sqs_queue`` fixture for asyncio code."""
+    from pytest_moto_fixtures.services.aio import AsyncSQSQueue
+
+    return AsyncSQSQueue(queue=sqs_queue)
+
+
+@pytest.fixture
+def async_sqs_fifo_queue(sqs_fifo_queue: 'SQSQueue') -> 'AsyncSQSQueue':
+    """The ``sqs_fifo_queue`` fixture for asyncio code."""
+    from pytest_moto_fixtures.services.aio import AsyncSQSQueue
+
+    return AsyncSQSQueue(queue=sqs_fifo_queue)
+
+
+@pytest.fixture
+def async_sns_topic(sns_topic: 'SNSTopic') -> 'AsyncSNSTopic':
+    """The ``sns_topic`` fixture for asyncio code."""
+    from pytest_moto_fixtures.services.aio import AsyncSNSTopic
+
+    return AsyncSNSTopic(topic=sns_topic)
+
+
+@pytest.fixture
+def async_sns_fifo_topic(sns_fifo_topic: 'SNSTopic') -> 'AsyncSNSTopic':
+    """The ``sns_fifo_topic`` fixture for asyncio code."""
+    from pytest_moto_fixtures.services.aio import AsyncSNSTopic
+
+    return AsyncSNSTopic(topic=sns_fifo_topic)
+
+
+@pytest.fixture
+def async_s3_bucket(s3_bucket: 'S3Bucket') -> 'AsyncS3Bucket':
+    """The ``s3_bucket`` fixture for asyncio code."""
+    from pytest_moto_fixtures.services.aio import AsyncS3Bucket
+
+    return AsyncS3Bucket(bucket=s3_bucket)
+
+
+@pytest.fixture
+def async_eventbridge_bus(eventbridge_bus: 'EventBridgeBus') -> 'AsyncEventBridgeBus':
+    """The ``eventbridge_bus`` fixture for asyncio code."""
+    from pytest_moto_fixtures.services.aio import AsyncEventBridgeBus
+
+    return AsyncEventBridgeBus(bus=eventbridge_bus)
+
+
+def _client(request: pytest.FixtureRequest, service_name: str) -> 'BaseClient':
+    """Create a client, or get it from the cache if the ``moto_client_cache`` ini option is enabled.
+
+    If the ``moto_fast_transport`` ini option is enabled, the fast transport is enabled in the client.
+
+    Args:
+        request: Request of fixture.
+        service_name: Name of AWS service.
+
+    Returns:
+        Client of AWS service.
+    """
+    import boto3
+
+    from pytest_moto_fixtures.clients import client_cache
+    from pytest_moto_fixtures.transport import enable_fast_transport
+
+    if request.config.getini('moto_client_cache'):
+        client = client_cache.client(service_name)
+    else:
+        client = boto3.client(service_name)  # type: ignore[call-overload]
+    if request.config.getini('moto_fast_transport'):
+        enable_fast_transport(client)
+    return client
+
+
+def _reset_backends(*, preserved_queues: Iterable['SQSQueue'] = ()) -> None:
+    """Discard the state of the backends used since the last reset.
+
+    Args:
+        preserved_queues: Queues that must be kept in the SQS backend after the reset.
+    """
+    from moto.core.base_backend import BackendDict
+    from moto.core.model_instances import reset_model_data
+    from moto.sqs.models import sqs_backends
+
+    preserved = []
+    for queue in preserved_queues:
+        _, _, _, region, account_id, name = queue.arn.split(':')
+        preserved.append((account_id, region, name, sqs_backends[account_id][region].queues[name]))
+    BackendDict.reset()
+    reset_model_data()
+    for account_id, region, name, backend_queue in preserved:
+        sqs_backends[account_id][region].queues[name] = backend_queue
+
+
+def _is_moto_fixture(fixturedef: pytest.FixtureDef[Any]) -> bool:
+    """Check if the fixture is defined by this plugin.
+
+    Args:
+        fixturedef: Definition of fixture.
+
+    Returns:
+        ``True`` if the fixture is defined by this plugin.
+    """
+    return getattr(fixturedef.func, '__module__', None) == __name__
+
+
+def _record_setup_duration(
+    fixturedef: pytest.FixtureDef[Any], request: pytest.FixtureRequest
+) -> Generator[None, Any, Any]:
+    """Record the duration of setup of fixture if the ``--moto-durations`` option is used.
+
+    Args:
+        fixturedef: Definition of fixture.
+        request: Request of fixture.
+    """
+    durations = request.config.stash.get(_DURATIONS_KEY, None)
+    if durations is None:
+        return (yield)
+    name = fixturedef.argname if _is_moto_fixture(fixturedef) else None
+    durations.start_setup()
+    try:
+        return (yield)
+    finally:
+        durations.stop_setup(name)
+        if name is not None:
+            fixturedef.addfinalizer(partial(durations.start_teardown, id(fixturedef)))
+
+
+def _uses_process_mock(fixturedef: pytest.FixtureDef[Any], request: pytest.FixtureRequest) -> bool:
+    """Check if the removal of resources of fixture is skipped by the ``moto_fast_teardown`` ini option.
+
+    Only fixtures that depend on ``aws_config``, directly or through other fixtures, are skipped, and only with the
+    in-process AWS mock, because the mock discards its state after the test, or resets it when the
+    ``moto_session_mock`` ini option is enabled. Resources of a moto server, or of other fixtures as the ones of a
+    longer scope, are removed.
+
+    Args:
+        fixturedef: Definition of fixture set up.
+        request: Request of fixture.
+
+    Returns:
+        ``True`` if the removal of resources on teardown of fixture is skipped.
+    """
+    if not request.config.getini('moto_fast_teardown') or fixturedef.scope != 'function':
+        return False
+
+    from moto import settings
+
+    if settings.TEST_SERVER_MODE:
+        return False
+    mocked = request.node.stash.setdefault(_MOCKED_FIXTURES_KEY, set())
+    if fixturedef.argname != 'aws_config' and mocked.isdisjoint(fixturedef.argnames):
+        return False
+    mocked.add(fixturedef.argname)
+    return True
+
+
+def _skip_resource_removal(config: pytest.Config, fixturedef: pytest.FixtureDef[Any]) -> None:
+    """Skip the removal of resources until the end of teardown of fixture.
+
+    Args:
+        config: Pytest config.
+        fixturedef: Definition of fixture torn down.
+    """
+    skip = skip_resource_removal()
+    skip.__enter__()
+    config.stash.setdefault(_SKIPPED_REMOVALS_KEY, {})[id(fixturedef)] = skip
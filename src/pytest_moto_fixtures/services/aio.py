@@ -0,0 +1,484 @@
+"""Access AWS services from asyncio code.
+
+The classes wrap the resources of services, running their blocking calls in an executor, so they do not stall the event
+loop. If no executor is provided, the default executor of the event loop is used, which limits the number of threads.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pytest_moto_fixtures.utils import NoArgs
+
+from .eventbridge import EventBridgeBatchResult, EventBridgeBus, EventBridgeEvent
+from .s3 import S3Bucket
+from .sns import SNSTopic
+from .sqs import SQSBatchResult, SQSMessage, SQSQueue, SQSQueueDepth
+
+if TYPE_CHECKING:
+    from types_boto3_s3.type_defs import BlobTypeDef, GetObjectOutputTypeDef, ObjectTypeDef
+    from types_boto3_sns.type_defs import MessageAttributeValueTypeDef
+    from types_boto3_sqs.type_defs import MessageTypeDef
+
+    from .eventbridge import EventTypeDef
+    from .sns import MessageTypeDef as SNSMessageTypeDef
+
+_T = TypeVar('_T')
+
+
+async def _run(executor: Executor | None, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:  # noqa: ANN401
+    """Run a blocking function in executor.
+
+    Args:
+        executor: Executor to run the function. If it is ``None`` the default executor of event loop will be used.
+        func: Function to run.
+        args: Positional arguments of function.
+        kwargs: Keyword arguments of function.
+
+    Returns:
+        Value returned by function.
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+@dataclass(kw_only=True, frozen=True)
+class AsyncSQSQueue:
+    """Queue in SQS service for asyncio code.
+
+    Iterating with ``async for`` receives messages as iterating over :class:`SQSQueue`, in batches of up to 10
+    messages.
+    """
+
+    queue: SQSQueue
+    """Queue accessed."""
+    executor: Executor | None = field(default=None, repr=False)
+    """Executor of blocking calls. If it is ``None`` the default executor of event loop will be used."""
+
+    async def depth(self) -> SQSQueueDepth:
+        """Number of messages in queue by state.
+
+        Returns:
+            Number of messages in queue by state.
+        """
+        return await _run(self.executor, self.queue.depth)
+
+    async def send_message(
+        self,
+        *,
+        body: str | dict[Any, Any],
+        delay_seconds: int | NoArgs = NoArgs.NO_ARG,
+        deduplication_id: str | NoArgs = NoArgs.NO_ARG,
+        group_id: str | NoArgs = NoArgs.NO_ARG,
+    ) -> None:
+        """Send message to queue.
+
+        Args:
+            body: Message body. If a dict is received, it will be converted to JSON string.
+            delay_seconds: Message delivery delay in seconds.
+            deduplication_id: Identifier to check for duplicate messages.
+            group_id: Identifier to group messages that should be delivered sequentially.
+        """
+        await _run(
+            self.executor,
+            self.queue.send_message,
+            body=body,
+            delay_seconds=delay_seconds,
+            deduplication_id=deduplication_id,
+            group_id=group_id,
+        )
+
+    async def send_messages(self, messages: Iterable[str | dict[Any, Any] | SQSMessage]) -> SQSBatchResult:
+        """Send messages to queue in batches.
+
+        Args:
+            messages: Messages to send. The iterable is read in the executor.
+
+        Returns:
+            Result of sent messages, with the messages that failed.
+        """
+        return await _run(self.executor, self.queue.send_messages, messages)
+
+    async def receive_message(self) -> 'MessageTypeDef | None':
+        """Receives messages from the queue and removes them.
+
+        Returns:
+            Messages received from the queue, or ``None`` if the queue has no messages.
+        """
+        return await _run(self.executor, self.queue.receive_message)
+
+    async def receive_messages(self, *, max_messages: int = 10) -> list['MessageTypeDef']:
+        """Receives up to ``max_messages`` messages from the queue and removes them.
+
+        Args:
+            max_messages: Maximum number of messages to receive.
+
+        Returns:
+            Messages received from the queue.
+        """
+        return await _run(self.executor, self.queue.receive_messages, max_messages=max_messages)
+
+    async def wait_for(self, count: int, *, timeout: float = 20) -> list['MessageTypeDef']:
+        """Wait until ``count`` messages are received from the queue, and remove them.
+
+        Args:
+            count: Number of messages to receive.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Messages received from the queue.
+
+        Raises:
+            TimeoutError: If fewer messages are received in time.
+        """
+        return await _run(self.executor, self.queue.wait_for, count, timeout=timeout)
+
+    async def wait_for_matching(
+        self, predicate: Callable[['MessageTypeDef'], bool], *, timeout: float = 20
+    ) -> 'MessageTypeDef':
+        """Wait until a message matching ``predicate`` is received from the queue, and remove it.
+
+        Args:
+            predicate: Function that receives a message and returns if it matches. It is called in the executor.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Message received from the queue.
+
+        Raises:
+            TimeoutError: If no message matching is received in time.
+        """
+        return await _run(self.executor, self.queue.wait_for_matching, predicate, timeout=timeout)
+
+    async def purge_queue(self) -> None:
+        """Purge messages in queue."""
+        await _run(self.executor, self.queue.purge_queue)
+
+    def __aiter__(self) -> AsyncIterator['MessageTypeDef']:
+        """Iterates over messages in queue, removing them after they are received.
+
+        Returns:
+            Iterator over messages.
+        """
+        return self
+
+    async def __anext__(self) -> 'MessageTypeDef':
+        """Receive the next message from queue and delete it.
+
+        Returns:
+            Message received from queue.
+        """
+
+        def receive() -> 'MessageTypeDef | None':
+            return next(self.queue, None)
+
+        message = await _run(self.executor, receive)
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+@dataclass(kw_only=True, frozen=True)
+class AsyncSNSTopic:
+    """Topic in SNS service for asyncio code."""
+
+    topic: SNSTopic
+    """Topic accessed."""
+    executor: Executor | None = field(default=None, repr=False)
+    """Executor of blocking calls. If it is ``None`` the default executor of event loop will be used."""
+
+    @cached_property
+    def queue(self) -> AsyncSQSQueue:
+        """Queue to topic messages."""
+        return AsyncSQSQueue(queue=self.topic.queue, executor=self.executor)
+
+    async def publish_message(
+        self,
+        *,
+        message: str | dict[Any, Any],
+        attributes: Mapping[str, 'MessageAttributeValueTypeDef'] | NoArgs = NoArgs.NO_ARG,
+        deduplication_id: str | NoArgs = NoArgs.NO_ARG,
+        group_id: str | NoArgs = NoArgs.NO_ARG,
+    ) -> None:
+        """Send message to topic.
+
+        Args:
+            message: Message body. If a dict is received, it will be converted to JSON string.
+            attributes: Attributes of message.
+            deduplication_id: Identifier to check for duplicate messages.
+            group_id: Identifier to group messages that should be delivered sequentially.
+        """
+        await _run(
+            self.executor,
+            self.topic.publish_message,
+            message=message,
+            attributes=attributes,
+            deduplication_id=deduplication_id,
+            group_id=group_id,
+        )
+
+    async def receive_message(self) -> 'SNSMessageTypeDef | None':
+        """Receive message from the queue of topic and removes them.
+
+        Returns:
+            Message received, or ``None`` if the queue has no messages.
+        """
+        return await _run(self.executor, self.topic.receive_message)
+
+    async def wait_for(self, count: int, *, timeout: float = 20) -> list['SNSMessageTypeDef']:
+        """Wait until ``count`` messages are received from the queue of topic, and remove them.
+
+        Args:
+            count: Number of messages to receive.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Messages received.
+
+        Raises:
+            TimeoutError: If fewer messages are received in time.
+        """
+        return await _run(self.executor, self.topic.wait_for, count, timeout=timeout)
+
+    async def wait_for_matching(
+        self, predicate: Callable[['SNSMessageTypeDef'], bool], *, timeout: float = 20
+    ) -> 'SNSMessageTypeDef':
+        """Wait until a message matching ``predicate`` is received from the queue of topic, and remove it.
+
+        Args:
+            predicate: Function that receives a message and returns if it matches. It is called in the executor.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Message received.
+
+        Raises:
+            TimeoutError: If no message matching is received in time.
+        """
+        return await _run(self.executor, self.topic.wait_for_matching, predicate, timeout=timeout)
+
+    async def purge_topic_messages(self) -> None:
+        """Purge messages in queue of topic."""
+        await self.queue.purge_queue()
+
+    def __aiter__(self) -> AsyncIterator['SNSMessageTypeDef']:
+        """Iterates over messages in queue of topic, removing them after they are received.
+
+        Returns:
+            Iterator over messages.
+        """
+        return self
+
+    async def __anext__(self) -> 'SNSMessageTypeDef':
+        """Receive the next message from queue of topic and delete it.
+
+        Returns:
+            Message received.
+        """
+
+        def receive() -> 'SNSMessageTypeDef | None':
+            return next(self.topic, None)
+
+        message = await _run(self.executor, receive)
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+@dataclass(kw_only=True, frozen=True)
+class AsyncEventBridgeBus:
+    """Bus in Event Bridge service for asyncio code."""
+
+    bus: EventBridgeBus
+    """Bus accessed."""
+    executor: Executor | None = field(default=None, repr=False)
+    """Executor of blocking calls. If it is ``None`` the default executor of event loop will be used."""
+
+    @cached_property
+    def queue(self) -> AsyncSQSQueue:
+        """Queue to bus messages."""
+        return AsyncSQSQueue(queue=self.bus.queue, executor=self.executor)
+
+    async def put_event(
+        self,
+        *,
+        source: str,
+        detail_type: str,
+        detail: str | dict[Any, Any],
+        resources: list[str] | NoArgs = NoArgs.NO_ARG,
+        time: datetime | NoArgs = NoArgs.NO_ARG,
+    ) -> None:
+        """Put event to bus.
+
+        Args:
+            source: Source of event.
+            detail_type: Event detail type.
+            detail: Event details. Receives a string in JSON format or a dict.
+            resources: List of resources associated with the event.
+            time: Date and time of the event. If not provided, the current time will be used.
+        """
+        await _run(
+            self.executor,
+            self.bus.put_event,
+            source=source,
+            detail_type=detail_type,
+            detail=detail,
+            resources=resources,
+            time=time,
+        )
+
+    async def put_events(self, events: Iterable[EventBridgeEvent]) -> EventBridgeBatchResult:
+        """Put events to bus in batches.
+
+        Args:
+            events: Events to put. The iterable is read in the executor.
+
+        Returns:
+            Result of put events, with the events that failed.
+        """
+        return await _run(self.executor, self.bus.put_events, events)
+
+    async def receive_event(self) -> 'EventTypeDef | None':
+        """Receive event from the queue of bus and removes them.
+
+        Returns:
+            Event received, or ``None`` if the queue has no events.
+        """
+        message = await self.queue.receive_message()
+        if not message:
+            return None
+        return cast('EventTypeDef', json.loads(message['Body']))
+
+    async def wait_for(self, count: int, *, timeout: float = 20) -> list['EventTypeDef']:
+        """Wait until ``count`` events are received from the queue of bus, and remove them.
+
+        Args:
+            count: Number of events to receive.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Events received.
+
+        Raises:
+            TimeoutError: If fewer events are received in time.
+        """
+        return await _run(self.executor, self.bus.wait_for, count, timeout=timeout)
+
+    async def wait_for_matching(
+        self, predicate: Callable[['EventTypeDef'], bool], *, timeout: float = 20
+    ) -> 'EventTypeDef':
+        """Wait until an event matching ``predicate`` is received from the queue of bus, and remove it.
+
+        Args:
+            predicate: Function that receives an event and returns if it matches. It is called in the executor.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Event received.
+
+        Raises:
+            TimeoutError: If no event matching is received in time.
+        """
+        return await _run(self.executor, self.bus.wait_for_matching, predicate, timeout=timeout)
+
+    async def purge_bus_events(self) -> None:
+        """Purge events in queue of bus."""
+        await self.queue.purge_queue()
+
+    def __aiter__(self) -> AsyncIterator['EventTypeDef']:
+        """Iterates over events in queue of bus, removing them after they are received.
+
+        Returns:
+            Iterator over events.
+        """
+        return self
+
+    async def __anext__(self) -> 'EventTypeDef':
+        """Receive the next event from queue of bus and delete it.
+
+        Returns:
+            Event received.
+        """
+        return cast('EventTypeDef', json.loads((await anext(self.queue))['Body']))
+
+
+@dataclass(kw_only=True, frozen=True)
+class AsyncS3Bucket:
+    """Bucket in S3 service for asyncio code."""
+
+    bucket: S3Bucket
+    """Bucket accessed."""
+    executor: Executor | None = field(default=None, repr=False)
+    """Executor of blocking calls. If it is ``None`` the default executor of event loop will be used."""
+
+    async def size(self) -> int:
+        """Number of objects in bucket.
+
+        Returns:
+            Number of objects in bucket.
+        """
+        return await _run(self.executor, len, self.bucket)
+
+    async def get(self, key: str) -> tuple['GetObjectOutputTypeDef', bytes]:
+        """Get object in bucket.
+
+        The body of object is read in the executor, and returned as bytes.
+
+        Args:
+            key: Key of object.
+
+        Returns:
+            Object in bucket, with its body stream already read, and the content of body.
+        """
+
+        def get() -> tuple['GetObjectOutputTypeDef', bytes]:
+            obj = self.bucket[key]
+            return obj, obj['Body'].read()
+
+        return await _run(self.executor, get)
+
+    async def put(self, key: str, value: 'BlobTypeDef') -> None:
+        """Put object in bucket.
+
+        Args:
+            key: Key of object.
+            value: Content of object.
+        """
+        await _run(self.executor, self.bucket.__setitem__, key, value)
+
+    async def delete(self, key: str) -> None:
+        """Delete object in bucket.
+
+        Args:
+            key: Key of object.
+        """
+        await _run(self.executor, self.bucket.__delitem__, key)
+
+    async def prune(self) -> None:
+        """Prune objects in bucket."""
+        await _run(self.executor, self.bucket.prune)
+
+    def __aiter__(self) -> AsyncIterator['ObjectTypeDef']:
+        """Iterates over objects in bucket.
+
+        Returns:
+            Iterator over objects.
+        """
+        return self._iter_objects()
+
+    async def _iter_objects(self) -> AsyncIterator['ObjectTypeDef']:
+        """Iterates over objects in bucket, listed in the executor.
+
+        Returns:
+            Iterator over objects.
+        """
+
+        def list_objects() -> list['ObjectTypeDef']:
+            return list(self.bucket)
+
+        for obj in await _run(self.executor, list_objects):
+            yield obj
@@ -1,15 +1,16 @@
 """Access Event Bridge service."""
 
 import json
-from collections.abc import Iterator, Sequence
-from contextlib import contextmanager
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 
-from pytest_moto_fixtures.utils import NoArgs, randstr
+from pytest_moto_fixtures.utils import NoArgs, create_concurrently, is_resource_removal_skipped, randname
 
-from .sqs import SQSQueue, sqs_create_queue
+from .sqs import _BATCH_MAX_ENTRIES, _BATCH_MAX_SIZE, SQSQueue, _LazyQueue, sqs_create_queue
 
 if TYPE_CHECKING:
     from types_boto3_events import EventBridgeClient
@@ -30,12 +31,58 @@ if TYPE_CHECKING:
         },
     )
 
+_TIME_ENTRY_SIZE = 14
+
+
+@dataclass(kw_only=True, frozen=True)
+class EventBridgeEvent:
+    """Event to put on a bus."""
+
+    source: str
+    """Source of event."""
+    detail_type: str
+    """Event detail type."""
+    detail: str | dict[Any, Any]
+    """Event details. If it is a dict, it will be converted to JSON string."""
+    resources: list[str] | NoArgs = NoArgs.NO_ARG
+    """List of resources associated with the event."""
+    time: datetime | NoArgs = NoArgs.NO_ARG
+    """Date and time of the event. If not provided, the current time will be used."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class EventBridgeBatchFailure:
+    """Entry of a batch call that failed."""
+
+    index: int
+    """Position of entry in the input."""
+    code: str
+    """Error code."""
+    message: str
+    """Error message."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class EventBridgeBatchResult:
+    """Result of batch calls."""
+
+    successful: dict[int, str] = field(default_factory=dict)
+    """Identifier of event of each successful entry, by position of entry in the input."""
+    failed: list[EventBridgeBatchFailure] = field(default_factory=list)
+    """Entries that failed."""
+
+    @property
+    def failed_entry_count(self) -> int:
+        """Number of entries that failed."""
+        return len(self.failed)
+
 
 @dataclass(kw_only=True, frozen=True)
 class EventBridgeBus:
     """Bus in Event Bridge service.
 
-    An SQS queue is used to receive messages sent to the bus.
+    An SQS queue is used to receive messages sent to the bus. If it is not provided, it is created by
+    :attr:`create_queue` on first use of :attr:`queue`, and only receives the events put after that.
     """
 
     client: 'EventBridgeClient' = field(repr=False)
@@ -44,8 +91,12 @@ class EventBridgeBus:
     """Bus name."""
     arn: str
     """Bus ARN."""
-    queue: SQSQueue
-    """Queu to bus messages."""
+    queue: _LazyQueue = field(default=_LazyQueue(), repr=False, compare=False)
+    """Queue to bus messages."""
+    create_queue: Callable[[], SQSQueue] | None = field(default=None, repr=False, compare=False)
+    """Function to create the queue targeted by the bus, if :attr:`queue` is not provided."""
+    patterns: Mapping[str, 'EventBridgeBus'] = field(default_factory=dict, repr=False, compare=False)
+    """Bus as seen by the queue of each event pattern, by name of pattern, with the queue of pattern as its queue."""
 
     def __len__(self) -> int:
         """Numter of messages in queue of bus.
@@ -73,20 +124,67 @@ class EventBridgeBus:
             resources: List of resources associated with the event.
             time: Date and time of the event. If not provided, the current time will be used.
         """
-        if not isinstance(detail, str):
-            detail = json.dumps(detail)
-        entry: PutEventsRequestEntryTypeDef = {
-            'Source': source,
-            'DetailType': detail_type,
-            'Detail': detail,
-            'EventBusName': self.name,
-        }
-        if resources is not NoArgs.NO_ARG:
-            entry['Resources'] = resources
-        if time is not NoArgs.NO_ARG:
-            entry['Time'] = time
+        entry = _event_entry(
+            self.name,
+            EventBridgeEvent(source=source, detail_type=detail_type, detail=detail, resources=resources, time=time),
+        )
+        _ = self.queue  # The queue must be targeted before putting the event to receive it
         self.client.put_events(Entries=[entry])
 
+    def put_events(self, events: Iterable[EventBridgeEvent]) -> EventBridgeBatchResult:
+        """Put events to bus in batches.
+
+        The events are read from the iterable as they are put, in batches of up to 10 events and 256 KiB of entries. An
+        event larger than this is not put, and is reported as failed.
+
+        Args:
+            events: Events to put.
+
+        Returns:
+            Result of put events, with the events that failed.
+        """
+        _ = self.queue  # The queue must be targeted before putting the events to receive them
+        result = EventBridgeBatchResult()
+        indexes: list[int] = []
+        entries: list[PutEventsRequestEntryTypeDef] = []
+        size = 0
+        for index, event in enumerate(events):
+            entry = _event_entry(self.name, event)
+            entry_size = _entry_size(entry)
+            if entry_size > _BATCH_MAX_SIZE:
+                message = f'Event larger than {_BATCH_MAX_SIZE} bytes'
+                result.failed.append(EventBridgeBatchFailure(index=index, code='BatchRequestTooLong', message=message))
+                continue
+            if entries and (len(entries) == _BATCH_MAX_ENTRIES or size + entry_size > _BATCH_MAX_SIZE):
+                self._put_batch(indexes, entries, result)
+                indexes, entries, size = [], [], 0
+            indexes.append(index)
+            entries.append(entry)
+            size += entry_size
+        if entries:
+            self._put_batch(indexes, entries, result)
+        return result
+
+    def _put_batch(
+        self, indexes: list[int], entries: list['PutEventsRequestEntryTypeDef'], result: EventBridgeBatchResult
+    ) -> None:
+        """Put a batch of events and add its outcome to result.
+
+        Args:
+            indexes: Positions in the input of the entries of batch.
+            entries: Entries of batch.
+            result: Result where the outcome is added.
+        """
+        response = self.client.put_events(Entries=entries)
+        for index, entry in zip(indexes, response['Entries'], strict=True):
+            if 'ErrorCode' in entry:
+                failure = EventBridgeBatchFailure(
+                    index=index, code=entry['ErrorCode'], message=entry.get('ErrorMessage', '')
+                )
+                result.failed.append(failure)
+            else:
+                result.successful[index] = entry['EventId']
+
     def receive_event(self) -> 'EventTypeDef | None':
         """Receive event from the queue of bus and removes them.
 
@@ -98,6 +196,41 @@ class EventBridgeBus:
             return None
         return cast('EventTypeDef', json.loads(message['Body']))
 
+    def wait_for(self, count: int, *, timeout: float = 20) -> list['EventTypeDef']:
+        """Wait until ``count`` events are received from the queue of bus, and remove them.
+
+        Args:
+            count: Number of events to receive.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Events received.
+
+        Raises:
+            TimeoutError: If fewer events are received in time. The received events are already removed from the
+                queue in SQS, and are kept in the queue object to be returned by its next calls.
+        """
+        messages = self.queue.wait_for(count, timeout=timeout)
+        return [cast('EventTypeDef', json.loads(message['Body'])) for message in messages]
+
+    def wait_for_matching(self, predicate: Callable[['EventTypeDef'], bool], *, timeout: float = 20) -> 'EventTypeDef':
+        """Wait until an event matching ``predicate`` is received from the queue of bus, and remove it.
+
+        Args:
+            predicate: Function that receives an event and returns if it matches.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Event received.
+
+        Raises:
+            TimeoutError: If no event matching is received in time.
+        """
+        message = self.queue.wait_for_matching(
+            lambda message: predicate(cast('EventTypeDef', json.loads(message['Body']))), timeout=timeout
+        )
+        return cast('EventTypeDef', json.loads(message['Body']))
+
     def __iter__(self) -> Iterator['EventTypeDef']:
         """Iterates over events in queue of bus, removing them after they are received.
 
@@ -112,10 +245,7 @@ class EventBridgeBus:
         Returns:
             Message received.
         """
-        message = self.receive_event()
-        if message is None:
-            raise StopIteration
-        return message
+        return cast('EventTypeDef', json.loads(next(self.queue)['Body']))
 
     def purge_bus_events(self) -> None:
         """Purge events in queue of topic."""
@@ -123,12 +253,14 @@ class EventBridgeBus:
 
 
 @contextmanager
-def eventbridge_create_bus(
+def eventbridge_create_bus(  # noqa: PLR0913
     *,
     eventbridge_client: 'EventBridgeClient',
     sqs_client: 'SQSClient',
     name: str | None = None,
     tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    lazy: bool = False,
+    patterns: Mapping[str, Mapping[str, Any]] | NoArgs = NoArgs.NO_ARG,
 ) -> Iterator[EventBridgeBus]:
     """Context for creating an Event Bridge bus with SQS queue targeted and removing it on exit.
 
@@ -137,26 +269,194 @@ def eventbridge_create_bus(
         sqs_client: SQS client where the queue will be created.
         name: Name of bus and queue to be created. If it is ``None`` a random name will be used.
         tags: Tags of bus to be created.
+        lazy: If ``True``, the queue, its rule and target are only created on first use of
+            :attr:`EventBridgeBus.queue`. Events put on the bus before it are not received.
+        patterns: Event patterns by name. For each one, a queue and a rule targeting it with only the matching events
+            are created concurrently, and are available in :attr:`EventBridgeBus.patterns`. They are not affected by
+            ``lazy``.
 
     Return:
         Bus created in Event Bridge service.
     """
     if name is None:
-        name = randstr()
+        name = randname()
     args = _CreateBusArgs(Name=name)
     if tags is not NoArgs.NO_ARG:
         args['Tags'] = tags
+    if isinstance(patterns, NoArgs):
+        patterns = {}
 
-    with sqs_create_queue(sqs_client=sqs_client, name=name) as queue:
-        bus = eventbridge_client.create_event_bus(**args)
-        eventbridge_client.put_rule(Name='all', EventPattern='{}', EventBusName=name)
-        eventbridge_client.put_targets(Rule='all', Targets=[{'Id': 'queue', 'Arn': queue.arn}], EventBusName=name)
-        yield EventBridgeBus(client=eventbridge_client, name=name, arn=bus['EventBusArn'], queue=queue)
-        eventbridge_client.remove_targets(Rule='all', Ids=['queue'], EventBusName=name)
-        eventbridge_client.delete_rule(Name='all', EventBusName=name)
+    bus = eventbridge_client.create_event_bus(**args)
+    with ExitStack() as stack:
+
+        def create_queue() -> SQSQueue:
+            return stack.enter_context(
+                _capture_queue(
+                    eventbridge_client=eventbridge_client,
+                    sqs_client=sqs_client,
+                    bus_name=name,
+                    name=name,
+                    rule='all',
+                    pattern={},
+                )
+            )
+
+        factories = [
+            partial(
+                _capture_queue,
+                eventbridge_client=eventbridge_client,
+                sqs_client=sqs_client,
+                bus_name=name,
+                name=f'{name}-{pattern_name}',
+                rule=f'pattern-{pattern_name}',
+                pattern=pattern,
+            )
+            for pattern_name, pattern in patterns.items()
+        ]
+        queues = stack.enter_context(create_concurrently(factories))
+        eventbridge_bus = EventBridgeBus(
+            client=eventbridge_client,
+            name=name,
+            arn=bus['EventBusArn'],
+            create_queue=create_queue,
+            patterns={
+                pattern_name: EventBridgeBus(
+                    client=eventbridge_client,
+                    name=name,
+                    arn=bus['EventBusArn'],
+                    queue=queue,
+                )
+                for pattern_name, queue in zip(patterns, queues, strict=True)
+            },
+        )
+        if not lazy:
+            _ = eventbridge_bus.queue
+        yield eventbridge_bus
+    if not is_resource_removal_skipped():
         eventbridge_client.delete_event_bus(Name=name)
 
 
+@contextmanager
+def eventbridge_create_buses(  # noqa: PLR0913
+    *,
+    eventbridge_client: 'EventBridgeClient',
+    sqs_client: 'SQSClient',
+    count: int,
+    tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    lazy: bool = False,
+    patterns: Mapping[str, Mapping[str, Any]] | NoArgs = NoArgs.NO_ARG,
+    max_workers: int | None = None,
+) -> Iterator[list[EventBridgeBus]]:
+    """Context for creating many Event Bridge buses with SQS queues targeted concurrently and removing them on exit.
+
+    Args:
+        eventbridge_client: Event Bridge client where the buses will be created.
+        sqs_client: SQS client where the queues will be created.
+        count: Number of buses to be created, with random names.
+        tags: Tags of buses to be created.
+        lazy: If ``True``, the queues, their rules and targets are only created on first use of
+            :attr:`EventBridgeBus.queue`.
+        patterns: Event patterns by name, with a queue created in each bus for each one.
+        max_workers: Maximum number of threads creating and removing the buses.
+
+    Return:
+        Buses created in Event Bridge service.
+    """
+    factory = partial(
+        eventbridge_create_bus,
+        eventbridge_client=eventbridge_client,
+        sqs_client=sqs_client,
+        tags=tags,
+        lazy=lazy,
+        patterns=patterns,
+    )
+    with create_concurrently([factory] * count, max_workers=max_workers) as buses:
+        yield buses
+
+
+def _event_entry(bus_name: str, event: EventBridgeEvent) -> 'PutEventsRequestEntryTypeDef':
+    """Build the entry to put event on bus.
+
+    Args:
+        bus_name: Name of bus.
+        event: Event to put.
+
+    Returns:
+        Entry of call.
+    """
+    detail = event.detail if isinstance(event.detail, str) else json.dumps(event.detail)
+    entry: PutEventsRequestEntryTypeDef = {
+        'Source': event.source,
+        'DetailType': event.detail_type,
+        'Detail': detail,
+        'EventBusName': bus_name,
+    }
+    if not isinstance(event.resources, NoArgs):
+        entry['Resources'] = event.resources
+    if not isinstance(event.time, NoArgs):
+        entry['Time'] = event.time
+    return entry
+
+
+def _entry_size(entry: 'PutEventsRequestEntryTypeDef') -> int:
+    """Size of entry, as counted for the limit of batch.
+
+    Args:
+        entry: Entry of batch.
+
+    Returns:
+        Size in bytes.
+    """
+    size = _TIME_ENTRY_SIZE if 'Time' in entry else 0
+    size += len(entry['Source'].encode()) + len(entry['DetailType'].encode()) + len(entry['Detail'].encode())
+    for resource in entry.get('Resources', []):
+        size += len(resource.encode())
+    return size
+
+
+@contextmanager
+def _capture_queue(  # noqa: PLR0913
+    *,
+    eventbridge_client: 'EventBridgeClient',
+    sqs_client: 'SQSClient',
+    bus_name: str,
+    name: str,
+    rule: str,
+    pattern: Mapping[str, Any],
+) -> Iterator[SQSQueue]:
+    """Context for creating an SQS queue targeted by a rule of a bus and removing them on exit.
+
+    Args:
+        eventbridge_client: Event Bridge client where the bus was created.
+        sqs_client: SQS client where the queue will be created.
+        bus_name: Name of bus.
+        name: Name of queue to be created.
+        rule: Name of rule to be created.
+        pattern: Event pattern of rule. An empty pattern matches all events.
+
+    Return:
+        Queue targeted by the rule.
+    """
+    with sqs_create_queue(sqs_client=sqs_client, name=name) as queue:
+        eventbridge_client.put_rule(Name=rule, EventPattern=json.dumps(pattern), EventBusName=bus_name)
+        eventbridge_client.put_targets(Rule=rule, Targets=[{'Id': 'queue', 'Arn': queue.arn}], EventBusName=bus_name)
+        yield queue
+        _remove_rule(eventbridge_client=eventbridge_client, bus_name=bus_name, rule=rule)
+
+
+def _remove_rule(*, eventbridge_client: 'EventBridgeClient', bus_name: str, rule: str) -> None:
+    """Remove rule and target to queue, unless the removal of resources is skipped.
+
+    Args:
+        eventbridge_client: Event Bridge client where the rule was created.
+        bus_name: Name of bus of rule.
+        rule: Name of rule.
+    """
+    if not is_resource_removal_skipped():
+        eventbridge_client.remove_targets(Rule=rule, Ids=['queue'], EventBusName=bus_name)
+        eventbridge_client.delete_rule(Name=rule, EventBusName=bus_name)
+
+
 class _CreateBusArgs(TypedDict, total=False):
     """Arguments to create bus."""
 
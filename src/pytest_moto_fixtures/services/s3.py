@@ -3,9 +3,10 @@
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
-from pytest_moto_fixtures.utils import NoArgs, randstr
+from pytest_moto_fixtures.utils import NoArgs, create_concurrently, is_resource_removal_skipped, randname
 
 if TYPE_CHECKING:
     from types_boto3_s3 import S3Client
@@ -96,10 +97,31 @@ def s3_create_bucket(*, s3_client: 'S3Client', name: str | NoArgs = NoArgs.NO_AR
         Bucket created in S3 service.
     """
     if isinstance(name, NoArgs):
-        name = randstr()
+        name = randname()
 
     s3_client.create_bucket(Bucket=name)
     yield S3Bucket(client=s3_client, name=name)
+    if is_resource_removal_skipped():
+        return
     for bucket_object in s3_client.list_objects_v2(Bucket=name).get('Contents', []):
         s3_client.delete_object(Bucket=name, Key=bucket_object['Key'])
     s3_client.delete_bucket(Bucket=name)
+
+
+@contextmanager
+def s3_create_buckets(
+    *, s3_client: 'S3Client', count: int, max_workers: int | None = None
+) -> Iterator[list[S3Bucket]]:
+    """Context for creating many S3 buckets concurrently and removing them on exit.
+
+    Args:
+        s3_client: S3 client where buckets will be created.
+        count: Number of buckets to be created, with random names.
+        max_workers: Maximum number of threads creating and removing the buckets.
+
+    Return:
+        Buckets created in S3 service.
+    """
+    factory = partial(s3_create_bucket, s3_client=s3_client)
+    with create_concurrently([factory] * count, max_workers=max_workers) as buckets:
+        yield buckets
@@ -1,22 +1,41 @@
 """Access SNS service."""
 
 import json
-from collections.abc import Iterator, Mapping, Sequence
-from contextlib import contextmanager
+from base64 import b64encode
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypedDict, cast
 
 from typing_extensions import NotRequired
 
-from pytest_moto_fixtures.utils import NoArgs, randstr
+from pytest_moto_fixtures.utils import NoArgs, create_concurrently, is_resource_removal_skipped, randname
 
-from .sqs import SQSQueue, sqs_create_queue
+from .sqs import (
+    _BATCH_MAX_ENTRIES,
+    _BATCH_MAX_SIZE,
+    _PAYLOAD_SIZE_ATTRIBUTE,
+    SQSQueue,
+    _LazyQueue,
+    _offload_payload,
+    _resolve_payload,
+    sqs_create_queue,
+)
 
 if TYPE_CHECKING:
     from types_boto3_sns import SNSClient
-    from types_boto3_sns.type_defs import MessageAttributeValueTypeDef, TagTypeDef
+    from types_boto3_sns.type_defs import (
+        MessageAttributeValueTypeDef,
+        PublishBatchRequestEntryTypeDef,
+        TagTypeDef,
+    )
     from types_boto3_sqs import SQSClient
     from types_boto3_sqs.literals import QueueAttributeNameType
+    from types_boto3_sqs.type_defs import MessageAttributeValueOutputTypeDef as SQSMessageAttributeValueOutputTypeDef
+    from types_boto3_sqs.type_defs import MessageTypeDef as SQSMessageTypeDef
+
+    from .s3 import S3Bucket
 
     class MessageAttributeTypeDef(TypedDict):
         """Type of message attribute in SNS."""
@@ -25,7 +44,11 @@ if TYPE_CHECKING:
         Value: str
 
     class MessageTypeDef(TypedDict):
-        """Type of message in SNS."""
+        """Type of message in SNS.
+
+        With raw message delivery, the envelope is not delivered, so the message identifier is the one in SQS, and the
+        subject, timestamp and signature are not available.
+        """
 
         Type: Literal['Notification']
         MessageId: str
@@ -33,18 +56,208 @@ if TYPE_CHECKING:
         Subject: NotRequired[str]
         Message: str
         MessageAttributes: NotRequired[dict[str, MessageAttributeTypeDef]]
-        Timestamp: str
-        SignatureVersion: str
-        Signature: str
-        SigningCertURL: str
-        UnsubscribeURL: str
+        Timestamp: NotRequired[str]
+        SignatureVersion: NotRequired[str]
+        Signature: NotRequired[str]
+        SigningCertURL: NotRequired[str]
+        UnsubscribeURL: NotRequired[str]
+
+
+@dataclass(kw_only=True, frozen=True)
+class SNSMessage:
+    """Message to publish to a topic."""
+
+    message: str | dict[Any, Any]
+    """Message body. If it is a dict, it will be converted to JSON string."""
+    attributes: Mapping[str, 'MessageAttributeValueTypeDef'] | NoArgs = NoArgs.NO_ARG
+    """Attributes of message."""
+    deduplication_id: str | NoArgs = NoArgs.NO_ARG
+    """Identifier to check for duplicate messages."""
+    group_id: str | NoArgs = NoArgs.NO_ARG
+    """Identifier to group messages that should be delivered sequentially."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class SNSBatchFailure:
+    """Entry of a batch call that failed."""
+
+    index: int
+    """Position of entry in the input."""
+    code: str
+    """Error code."""
+    message: str
+    """Error message."""
+    sender_fault: bool
+    """If the error was caused by the entry sent, instead of the service."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class SNSBatchResult:
+    """Result of batch calls."""
+
+    successful: dict[int, str] = field(default_factory=dict)
+    """Identifier of message of each successful entry, by position of entry in the input."""
+    failed: list[SNSBatchFailure] = field(default_factory=list)
+    """Entries that failed."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class SNSSubscriber:
+    """Subscription of a queue to a topic."""
+
+    filter_policy: Mapping[str, Any] | NoArgs = NoArgs.NO_ARG
+    """Filter policy of messages delivered to the queue."""
+    filter_policy_scope: Literal['MessageAttributes', 'MessageBody'] | NoArgs = NoArgs.NO_ARG
+    """Part of message where the filter policy is applied. If not provided, the message attributes are used."""
+    raw_message_delivery: bool = False
+    """If the messages are delivered to the queue without the SNS envelope."""
+
+    def subscription_attributes(self) -> dict[str, str]:
+        """Attributes of subscription.
+
+        Returns:
+            Attributes to subscribe the queue.
+        """
+        attributes: dict[str, str] = {}
+        if not isinstance(self.filter_policy, NoArgs):
+            attributes['FilterPolicy'] = json.dumps(self.filter_policy)
+        if not isinstance(self.filter_policy_scope, NoArgs):
+            attributes['FilterPolicyScope'] = self.filter_policy_scope
+        if self.raw_message_delivery:
+            attributes['RawMessageDelivery'] = 'true'
+        return attributes
+
+
+class SNSCapturedMessages:
+    """Messages received from the queue of a topic, indexed to be queried.
+
+    The queue is drained on each query, adding only the new messages to the indexes, so each query runs in time
+    proportional to the messages matching it instead of all messages. The messages drained are removed from the queue.
+    """
+
+    def __init__(self, receive: Callable[[], list[tuple['MessageTypeDef', str | None]]]) -> None:
+        """Create an empty store.
+
+        Args:
+            receive: Function that receives the messages available in the queue, with their message group.
+        """
+        self._receive = receive
+        self._messages: list[MessageTypeDef] = []
+        self._keys: list[set[_CaptureKey]] = []
+        self._index: dict[_CaptureKey, list[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of messages captured.
+
+        Returns:
+            Number of messages.
+        """
+        self._drain()
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator['MessageTypeDef']:
+        """Iterates over messages captured, in the order received.
+
+        Returns:
+            Iterator over messages.
+        """
+        self._drain()
+        return iter(list(self._messages))
+
+    def where(
+        self,
+        *,
+        subject: str | NoArgs = NoArgs.NO_ARG,
+        group_id: str | NoArgs = NoArgs.NO_ARG,
+        attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    ) -> list['MessageTypeDef']:
+        """Messages captured matching all the criteria, in the order received.
+
+        Args:
+            subject: Subject of message.
+            group_id: Identifier of message group, for fifo topics.
+            attributes: Values of message attributes, as in the ``'Value'`` of attributes.
+
+        Returns:
+            Messages matching.
+        """
+        return [self._messages[position] for position in self._find(subject, group_id, attributes)]
+
+    def count(
+        self,
+        *,
+        subject: str | NoArgs = NoArgs.NO_ARG,
+        group_id: str | NoArgs = NoArgs.NO_ARG,
+        attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    ) -> int:
+        """Number of messages captured matching all the criteria.
+
+        Args:
+            subject: Subject of message.
+            group_id: Identifier of message group, for fifo topics.
+            attributes: Values of message attributes, as in the ``'Value'`` of attributes.
+
+        Returns:
+            Number of messages matching.
+        """
+        return len(self._find(subject, group_id, attributes))
+
+    def _find(
+        self, subject: str | NoArgs, group_id: str | NoArgs, attributes: Mapping[str, str] | NoArgs
+    ) -> list[int]:
+        """Find the position of messages matching all the criteria.
+
+        Args:
+            subject: Subject of message.
+            group_id: Identifier of message group.
+            attributes: Values of message attributes.
+
+        Returns:
+            Positions of messages matching, in the order received.
+        """
+        self._drain()
+        keys: list[_CaptureKey] = []
+        if not isinstance(subject, NoArgs):
+            keys.append(_CaptureKey('Subject', '', subject))
+        if not isinstance(group_id, NoArgs):
+            keys.append(_CaptureKey('MessageGroupId', '', group_id))
+        if not isinstance(attributes, NoArgs):
+            keys.extend(_CaptureKey('MessageAttributes', name, value) for name, value in attributes.items())
+        if not keys:
+            return list(range(len(self._messages)))
+        positions = min((self._index.get(key, []) for key in keys), key=len)
+        if len(keys) == 1:
+            return list(positions)
+        return [position for position in positions if all(key in self._keys[position] for key in keys)]
+
+    def _drain(self) -> None:
+        """Receive the messages available in the queue and add them to the indexes."""
+        for message, group_id in self._receive():
+            keys = {
+                _CaptureKey('MessageAttributes', name, attribute['Value'])
+                for name, attribute in message.get('MessageAttributes', {}).items()
+            }
+            if 'Subject' in message:
+                keys.add(_CaptureKey('Subject', '', message['Subject']))
+            if group_id is not None:
+                keys.add(_CaptureKey('MessageGroupId', '', group_id))
+            position = len(self._messages)
+            self._messages.append(message)
+            self._keys.append(keys)
+            for key in keys:
+                self._index.setdefault(key, []).append(position)
 
 
 @dataclass(kw_only=True, frozen=True)
 class SNSTopic:
     """Topic in SNS service.
 
-    An SQS queue is used to receive messages sent to the topic.
+    An SQS queue is used to receive messages sent to the topic. If it is not provided, it is created by
+    :attr:`create_queue` on first use of :attr:`queue`, and only receives the messages published after that.
+
+    If :attr:`payload_bucket` is set, messages larger than :attr:`payload_threshold` are stored in the bucket and a
+    pointer to them is published instead, in the format of the Amazon SNS Extended Client Library. Received pointers
+    are resolved to the stored messages, which are kept in the bucket.
     """
 
     client: 'SNSClient' = field(repr=False)
@@ -53,8 +266,21 @@ class SNSTopic:
     """Topic name."""
     arn: str
     """Topic ARN."""
-    queue: SQSQueue
+    queue: _LazyQueue = field(default=_LazyQueue(), repr=False, compare=False)
     """Queue to topic messages."""
+    create_queue: Callable[[], SQSQueue] | None = field(default=None, repr=False, compare=False)
+    """Function to create the queue subscribed to the topic, if :attr:`queue` is not provided."""
+    payload_bucket: 'S3Bucket | None' = field(default=None, repr=False, compare=False)
+    """Bucket to store large messages. If it is ``None``, large messages are published as is and the call fails."""
+    payload_threshold: int = _BATCH_MAX_SIZE
+    """Size in bytes above which messages are stored in :attr:`payload_bucket`."""
+    raw_message_delivery: bool = False
+    """If the queue is subscribed with raw message delivery, receiving the messages without the SNS envelope."""
+
+    @cached_property
+    def captured(self) -> SNSCapturedMessages:
+        """Messages received from the queue of topic, indexed to be queried."""
+        return SNSCapturedMessages(self._receive_captured)
 
     def __len__(self) -> int:
         """Numter of messages in queue of topic.
@@ -85,12 +311,91 @@ class SNSTopic:
         args = _PublishArgs(TopicArn=self.arn, Message=message)
         if not isinstance(attributes, NoArgs):
             args['MessageAttributes'] = attributes
+        if offloaded := self._offload_payload(message, args.get('MessageAttributes', {})):
+            args['Message'], args['MessageAttributes'] = offloaded
         if not isinstance(deduplication_id, NoArgs):
             args['MessageDeduplicationId'] = deduplication_id
         if not isinstance(group_id, NoArgs):
             args['MessageGroupId'] = group_id
+        _ = self.queue  # The queue must be subscribed before publishing to receive the message
         self.client.publish(**args)
 
+    def publish_messages(self, messages: Iterable[str | dict[Any, Any] | SNSMessage]) -> SNSBatchResult:
+        """Publish messages to topic in batches.
+
+        The messages are read from the iterable as they are published, in batches of up to 10 messages and 256 KiB of
+        messages and attributes. A message larger than this is not published, and is reported as failed.
+
+        Args:
+            messages: Messages to publish. A str or dict is published as the message body, without other arguments.
+
+        Returns:
+            Result of published messages, with the messages that failed.
+        """
+        _ = self.queue  # The queue must be subscribed before publishing to receive the message
+        result = SNSBatchResult()
+        entries: list[PublishBatchRequestEntryTypeDef] = []
+        size = 0
+        for index, message in enumerate(messages):
+            entry = _batch_entry(index, message if isinstance(message, SNSMessage) else SNSMessage(message=message))
+            if offloaded := self._offload_payload(entry['Message'], entry.get('MessageAttributes', {})):
+                entry['Message'], entry['MessageAttributes'] = offloaded
+            entry_size = _entry_size(entry)
+            if entry_size > _BATCH_MAX_SIZE:
+                message_failed = f'Message larger than {_BATCH_MAX_SIZE} bytes'
+                result.failed.append(
+                    SNSBatchFailure(index=index, code='BatchRequestTooLong', message=message_failed, sender_fault=True)
+                )
+                continue
+            if entries and (len(entries) == _BATCH_MAX_ENTRIES or size + entry_size > _BATCH_MAX_SIZE):
+                self._publish_batch(entries, result)
+                entries, size = [], 0
+            entries.append(entry)
+            size += entry_size
+        if entries:
+            self._publish_batch(entries, result)
+        return result
+
+    def _publish_batch(self, entries: list['PublishBatchRequestEntryTypeDef'], result: SNSBatchResult) -> None:
+        """Publish a batch of messages and add its outcome to result.
+
+        Args:
+            entries: Entries of batch, with the position in the input as identifier.
+            result: Result where the outcome is added.
+        """
+        response = self.client.publish_batch(TopicArn=self.arn, PublishBatchRequestEntries=entries)
+        for successful in response.get('Successful', []):
+            result.successful[int(successful['Id'])] = successful['MessageId']
+        for failed in response.get('Failed', []):
+            result.failed.append(
+                SNSBatchFailure(
+                    index=int(failed['Id']),
+                    code=failed['Code'],
+                    message=failed.get('Message', ''),
+                    sender_fault=failed['SenderFault'],
+                )
+            )
+
+    def _offload_payload(
+        self, message: str, attributes: Mapping[str, 'MessageAttributeValueTypeDef']
+    ) -> tuple[str, dict[str, 'MessageAttributeValueTypeDef']] | None:
+        """Store message in payload bucket if it is larger than the threshold.
+
+        Args:
+            message: Message body.
+            attributes: Attributes of message.
+
+        Returns:
+            Pointer to publish as message and its attributes, or ``None`` if the message should be published as is.
+        """
+        if self.payload_bucket is None:
+            return None
+        offloaded = _offload_payload(self.payload_bucket, message, threshold=self.payload_threshold)
+        if offloaded is None:
+            return None
+        pointer, size = offloaded
+        return pointer, {**attributes, _PAYLOAD_SIZE_ATTRIBUTE: {'DataType': 'Number', 'StringValue': str(size)}}
+
     def receive_message(self) -> 'MessageTypeDef | None':
         """Receive message from the queue of topic and removes them.
 
@@ -100,7 +405,42 @@ class SNSTopic:
         message = self.queue.receive_message()
         if not message:
             return None
-        return cast('MessageTypeDef', json.loads(message['Body']))
+        return self._decode(message)
+
+    def wait_for(self, count: int, *, timeout: float = 20) -> list['MessageTypeDef']:
+        """Wait until ``count`` messages are received from the queue of topic, and remove them.
+
+        Args:
+            count: Number of messages to receive.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Messages received.
+
+        Raises:
+            TimeoutError: If fewer messages are received in time. The received messages are already removed from the
+                queue in SQS, and are kept in the queue object to be returned by its next calls.
+        """
+        messages = self.queue.wait_for(count, timeout=timeout)
+        return [self._decode(message) for message in messages]
+
+    def wait_for_matching(
+        self, predicate: Callable[['MessageTypeDef'], bool], *, timeout: float = 20
+    ) -> 'MessageTypeDef':
+        """Wait until a message matching ``predicate`` is received from the queue of topic, and remove it.
+
+        Args:
+            predicate: Function that receives a message and returns if it matches.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Message received.
+
+        Raises:
+            TimeoutError: If no message matching is received in time.
+        """
+        message = self.queue.wait_for_matching(lambda message: predicate(self._decode(message)), timeout=timeout)
+        return self._decode(message)
 
     def __iter__(self) -> Iterator['MessageTypeDef']:
         """Iterates over messages in queue of topic, removing them after they are received.
@@ -116,24 +456,74 @@ class SNSTopic:
         Returns:
             Message received.
         """
-        message = self.receive_message()
-        if message is None:
-            raise StopIteration
-        return message
+        return self._decode(next(self.queue))
 
     def purge_topic_messages(self) -> None:
         """Purge messages in queue of topic."""
         self.queue.purge_queue()
 
+    def _receive_captured(self) -> list[tuple['MessageTypeDef', str | None]]:
+        """Receive the messages available in the queue of topic, with their message group.
+
+        Returns:
+            Messages received and their message group, or ``None`` if the topic is not fifo.
+        """
+        messages: list[tuple[MessageTypeDef, str | None]] = []
+        while received := self.queue.receive_messages():
+            messages.extend(
+                (self._decode(message), message.get('Attributes', {}).get('MessageGroupId')) for message in received
+            )
+        return messages
+
+    def _decode(self, message: 'SQSMessageTypeDef') -> 'MessageTypeDef':
+        """Decode the message of topic received by its queue.
+
+        Args:
+            message: Message received by the queue.
+
+        Returns:
+            Message of topic, with the pointer to a message stored in payload bucket resolved.
+        """
+        if self.raw_message_delivery:
+            decoded: MessageTypeDef = {
+                'Type': 'Notification',
+                'MessageId': message['MessageId'],
+                'TopicArn': self.arn,
+                'Message': message['Body'],
+            }
+            if 'MessageAttributes' in message:
+                decoded['MessageAttributes'] = {
+                    name: _message_attribute(value) for name, value in message['MessageAttributes'].items()
+                }
+        else:
+            decoded = cast('MessageTypeDef', json.loads(message['Body']))
+        if self.payload_bucket is not None:
+            decoded['Message'] = _resolve_payload(self.payload_bucket, decoded['Message'])
+        return decoded
+
+
+@dataclass(kw_only=True, frozen=True)
+class SNSFanoutTopic(SNSTopic):
+    """Topic in SNS service with many SQS queues subscribed.
+
+    The topic also works as :class:`SNSTopic`, with its queue receiving all messages published after it is created.
+    """
+
+    subscribers: list[SNSTopic] = field(default_factory=list)
+    """Topic as seen by each subscribed queue, in the order of subscribers, with the subscribed queue as its queue."""
+
 
 @contextmanager
-def sns_create_topic(
+def sns_create_topic(  # noqa: PLR0913
     *,
     sns_client: 'SNSClient',
     sqs_client: 'SQSClient',
     name: str | None = None,
     attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
     tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    lazy: bool = False,
+    payload_bucket: 'S3Bucket | None' = None,
+    raw_message_delivery: bool = False,
 ) -> Iterator[SNSTopic]:
     """Context for creating an SNS topic with SQS queue subscribed and removing it on exit.
 
@@ -143,12 +533,17 @@ def sns_create_topic(
         name: Name of topic and queue to be created. If it is ``None`` a random name will be used.
         attributes: Attributes of topic to be created.
         tags: Tags of topic to be created.
+        lazy: If ``True``, the queue is only created and subscribed on first use of :attr:`SNSTopic.queue`. Messages
+            published to the topic before it are not received.
+        payload_bucket: Bucket to store messages larger than 256 KiB, and publish a pointer to them instead.
+        raw_message_delivery: If ``True``, the queue is subscribed with raw message delivery, receiving the messages
+            without the SNS envelope.
 
     Return:
         Topic created in SNS service.
     """
     if name is None:
-        name = randstr()
+        name = randname()
     args = _CreateTopicArgs(Name=name)
     if not isinstance(attributes, NoArgs):
         args['Attributes'] = attributes
@@ -158,24 +553,47 @@ def sns_create_topic(
     queue_attributes: Mapping[QueueAttributeNameType, str] = {
         'FifoQueue': args.get('Attributes', {}).get('FifoTopic', 'false'),
     }
-    with sqs_create_queue(sqs_client=sqs_client, name=name, attributes=queue_attributes) as queue:
-        topic = sns_client.create_topic(**args)
-        subscription = sns_client.subscribe(
-            TopicArn=topic['TopicArn'], Protocol='sqs', Endpoint=queue.arn, ReturnSubscriptionArn=True
+    topic = sns_client.create_topic(**args)
+    with ExitStack() as stack:
+
+        def create_queue() -> SQSQueue:
+            return stack.enter_context(
+                _subscribe_queue(
+                    sns_client=sns_client,
+                    sqs_client=sqs_client,
+                    topic_arn=topic['TopicArn'],
+                    name=name,
+                    queue_attributes=queue_attributes,
+                    subscription_attributes={'RawMessageDelivery': 'true'} if raw_message_delivery else NoArgs.NO_ARG,
+                )
+            )
+
+        sns_topic = SNSTopic(
+            client=sns_client,
+            name=name,
+            arn=topic['TopicArn'],
+            create_queue=create_queue,
+            payload_bucket=payload_bucket,
+            raw_message_delivery=raw_message_delivery,
         )
-        yield SNSTopic(client=sns_client, name=name, arn=topic['TopicArn'], queue=queue)
-        sns_client.unsubscribe(SubscriptionArn=subscription['SubscriptionArn'])
+        if not lazy:
+            _ = sns_topic.queue
+        yield sns_topic
+    if not is_resource_removal_skipped():
         sns_client.delete_topic(TopicArn=topic['TopicArn'])
 
 
 @contextmanager
-def sns_create_fifo_topic(
+def sns_create_fifo_topic(  # noqa: PLR0913
     *,
     sns_client: 'SNSClient',
     sqs_client: 'SQSClient',
     name: str | None = None,
     attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
     tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    lazy: bool = False,
+    payload_bucket: 'S3Bucket | None' = None,
+    raw_message_delivery: bool = False,
 ) -> Iterator[SNSTopic]:
     """Context for creating an SNS fifo topic with SQS fifo queue subscribed and removing it on exit.
 
@@ -187,23 +605,280 @@ def sns_create_fifo_topic(
         attributes: Attributes of topic to be created. If it does not have the ``'FifoTopic'`` attribute it will be
             added.
         tags: Tags of topic to be created.
+        lazy: If ``True``, the queue is only created and subscribed on first use of :attr:`SNSTopic.queue`. Messages
+            published to the topic before it are not received.
+        payload_bucket: Bucket to store messages larger than 256 KiB, and publish a pointer to them instead.
+        raw_message_delivery: If ``True``, the queue is subscribed with raw message delivery, receiving the messages
+            without the SNS envelope.
 
     Return:
         Topic created in SNS service.
     """
     if name is None:
-        name = randstr()
+        name = randname()
     if not name.endswith('.fifo'):
         name += '.fifo'
     attributes = dict(attributes.items()) if not isinstance(attributes, NoArgs) else {}
     if 'FifoTopic' not in attributes:
         attributes['FifoTopic'] = 'true'
     with sns_create_topic(
-        sns_client=sns_client, sqs_client=sqs_client, name=name, attributes=attributes, tags=tags
+        sns_client=sns_client,
+        sqs_client=sqs_client,
+        name=name,
+        attributes=attributes,
+        tags=tags,
+        lazy=lazy,
+        payload_bucket=payload_bucket,
+        raw_message_delivery=raw_message_delivery,
     ) as topic:
         yield topic
 
 
+@contextmanager
+def sns_create_topics(  # noqa: PLR0913
+    *,
+    sns_client: 'SNSClient',
+    sqs_client: 'SQSClient',
+    count: int,
+    attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    lazy: bool = False,
+    max_workers: int | None = None,
+) -> Iterator[list[SNSTopic]]:
+    """Context for creating many SNS topics with SQS queues subscribed concurrently and removing them on exit.
+
+    Args:
+        sns_client: SNS client where the topics will be created.
+        sqs_client: SQS client where the queues will be created.
+        count: Number of topics to be created, with random names.
+        attributes: Attributes of topics to be created.
+        tags: Tags of topics to be created.
+        lazy: If ``True``, the queues are only created and subscribed on first use of :attr:`SNSTopic.queue`.
+        max_workers: Maximum number of threads creating and removing the topics.
+
+    Return:
+        Topics created in SNS service.
+    """
+    factory = partial(
+        sns_create_topic, sns_client=sns_client, sqs_client=sqs_client, attributes=attributes, tags=tags, lazy=lazy
+    )
+    with create_concurrently([factory] * count, max_workers=max_workers) as topics:
+        yield topics
+
+
+@contextmanager
+def sns_create_fifo_topics(  # noqa: PLR0913
+    *,
+    sns_client: 'SNSClient',
+    sqs_client: 'SQSClient',
+    count: int,
+    attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    lazy: bool = False,
+    max_workers: int | None = None,
+) -> Iterator[list[SNSTopic]]:
+    """Context for creating many SNS fifo topics with SQS fifo queues subscribed concurrently and removing on exit.
+
+    Args:
+        sns_client: SNS client where the topics will be created.
+        sqs_client: SQS client where the queues will be created.
+        count: Number of topics to be created, with random names.
+        attributes: Attributes of topics to be created. If it does not have the ``'FifoTopic'`` attribute it will be
+            added.
+        tags: Tags of topics to be created.
+        lazy: If ``True``, the queues are only created and subscribed on first use of :attr:`SNSTopic.queue`.
+        max_workers: Maximum number of threads creating and removing the topics.
+
+    Return:
+        Topics created in SNS service.
+    """
+    factory = partial(
+        sns_create_fifo_topic,
+        sns_client=sns_client,
+        sqs_client=sqs_client,
+        attributes=attributes,
+        tags=tags,
+        lazy=lazy,
+    )
+    with create_concurrently([factory] * count, max_workers=max_workers) as topics:
+        yield topics
+
+
+@contextmanager
+def sns_create_fanout_topic(  # noqa: PLR0913
+    *,
+    sns_client: 'SNSClient',
+    sqs_client: 'SQSClient',
+    subscribers: Sequence[SNSSubscriber],
+    name: str | None = None,
+    attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    tags: Sequence['TagTypeDef'] | NoArgs = NoArgs.NO_ARG,
+    payload_bucket: 'S3Bucket | None' = None,
+    max_workers: int | None = None,
+) -> Iterator[SNSFanoutTopic]:
+    """Context for creating an SNS topic with many SQS queues subscribed concurrently and removing them on exit.
+
+    Args:
+        sns_client: SNS client where the topic will be created.
+        sqs_client: SQS client where the queues will be created.
+        subscribers: Subscriptions of queues to be created, one queue for each.
+        name: Name of topic to be created, also used as prefix of the queues names. If it is ``None`` a random name
+            will be used, and if the topic is fifo and it does not end with ``'.fifo'`` it will be appended.
+        attributes: Attributes of topic to be created. If it has the ``'FifoTopic'`` attribute as ``'true'``, the topic
+            and queues are fifo.
+        tags: Tags of topic to be created.
+        payload_bucket: Bucket to store messages larger than 256 KiB, and publish a pointer to them instead.
+        max_workers: Maximum number of threads creating and removing the queues and subscriptions.
+
+    Return:
+        Topic created in SNS service.
+    """
+    fifo = not isinstance(attributes, NoArgs) and attributes.get('FifoTopic') == 'true'
+    if name is None:
+        name = randname()
+    if fifo and not name.endswith('.fifo'):
+        name += '.fifo'
+    with sns_create_topic(
+        sns_client=sns_client,
+        sqs_client=sqs_client,
+        name=name,
+        attributes=attributes,
+        tags=tags,
+        lazy=True,
+        payload_bucket=payload_bucket,
+    ) as topic:
+        queue_attributes: Mapping[QueueAttributeNameType, str] = {'FifoQueue': 'true' if fifo else 'false'}
+        prefix = topic.name.removesuffix('.fifo')
+        factories = [
+            partial(
+                _subscribe_queue,
+                sns_client=sns_client,
+                sqs_client=sqs_client,
+                topic_arn=topic.arn,
+                name=f'{prefix}-{index}.fifo' if fifo else f'{prefix}-{index}',
+                queue_attributes=queue_attributes,
+                subscription_attributes=subscriber.subscription_attributes(),
+            )
+            for index, subscriber in enumerate(subscribers)
+        ]
+        with create_concurrently(factories, max_workers=max_workers) as queues:
+            yield SNSFanoutTopic(
+                client=sns_client,
+                name=topic.name,
+                arn=topic.arn,
+                create_queue=topic.create_queue,
+                payload_bucket=payload_bucket,
+                subscribers=[
+                    SNSTopic(
+                        client=sns_client,
+                        name=topic.name,
+                        arn=topic.arn,
+                        queue=queue,
+                        payload_bucket=payload_bucket,
+                        raw_message_delivery=subscriber.raw_message_delivery,
+                    )
+                    for queue, subscriber in zip(queues, subscribers, strict=True)
+                ],
+            )
+
+
+@contextmanager
+def _subscribe_queue(  # noqa: PLR0913
+    *,
+    sns_client: 'SNSClient',
+    sqs_client: 'SQSClient',
+    topic_arn: str,
+    name: str,
+    queue_attributes: Mapping['QueueAttributeNameType', str],
+    subscription_attributes: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+) -> Iterator[SQSQueue]:
+    """Context for creating an SQS queue subscribed to a topic and removing them on exit.
+
+    Args:
+        sns_client: SNS client where the topic was created.
+        sqs_client: SQS client where the queue will be created.
+        topic_arn: ARN of topic.
+        name: Name of queue to be created.
+        queue_attributes: Attributes of queue to be created.
+        subscription_attributes: Attributes of subscription to be created.
+
+    Return:
+        Queue subscribed to the topic.
+    """
+    with sqs_create_queue(sqs_client=sqs_client, name=name, attributes=queue_attributes) as queue:
+        args = _SubscribeArgs(TopicArn=topic_arn, Protocol='sqs', Endpoint=queue.arn, ReturnSubscriptionArn=True)
+        if not isinstance(subscription_attributes, NoArgs):
+            args['Attributes'] = subscription_attributes
+        subscription = sns_client.subscribe(**args)
+        yield queue
+        _unsubscribe(sns_client=sns_client, subscription_arn=subscription['SubscriptionArn'])
+
+
+def _unsubscribe(*, sns_client: 'SNSClient', subscription_arn: str) -> None:
+    """Remove subscription, unless the removal of resources is skipped.
+
+    Args:
+        sns_client: SNS client where the subscription was created.
+        subscription_arn: ARN of subscription.
+    """
+    if not is_resource_removal_skipped():
+        sns_client.unsubscribe(SubscriptionArn=subscription_arn)
+
+
+def _message_attribute(attribute: 'SQSMessageAttributeValueOutputTypeDef') -> 'MessageAttributeTypeDef':
+    """Convert the attribute of message received by SQS to the format of SNS envelope.
+
+    Args:
+        attribute: Attribute of message in SQS.
+
+    Returns:
+        Attribute of message in SNS, with binary values encoded in base64.
+    """
+    if 'BinaryValue' in attribute:
+        return {'Type': attribute['DataType'], 'Value': b64encode(attribute['BinaryValue']).decode()}
+    return {'Type': attribute['DataType'], 'Value': attribute.get('StringValue', '')}
+
+
+def _batch_entry(index: int, message: SNSMessage) -> 'PublishBatchRequestEntryTypeDef':
+    """Build the entry of a batch to publish message.
+
+    Args:
+        index: Position of message in the input, used as identifier of entry.
+        message: Message to publish.
+
+    Returns:
+        Entry of batch.
+    """
+    body = message.message if isinstance(message.message, str) else json.dumps(message.message)
+    entry: PublishBatchRequestEntryTypeDef = {'Id': str(index), 'Message': body}
+    if not isinstance(message.attributes, NoArgs):
+        entry['MessageAttributes'] = message.attributes
+    if not isinstance(message.deduplication_id, NoArgs):
+        entry['MessageDeduplicationId'] = message.deduplication_id
+    if not isinstance(message.group_id, NoArgs):
+        entry['MessageGroupId'] = message.group_id
+    return entry
+
+
+def _entry_size(entry: 'PublishBatchRequestEntryTypeDef') -> int:
+    """Size of message and attributes of entry, as counted for the limit of batch.
+
+    Args:
+        entry: Entry of batch.
+
+    Returns:
+        Size in bytes.
+    """
+    size = len(entry['Message'].encode())
+    for name, attribute in entry.get('MessageAttributes', {}).items():
+        size += len(name.encode()) + len(attribute['DataType'].encode())
+        size += len(attribute.get('StringValue', '').encode())
+        binary = attribute.get('BinaryValue', b'')
+        if isinstance(binary, bytes):
+            size += len(binary)
+    return size
+
+
 class _CreateTopicArgs(TypedDict, total=False):
     """Arguments to create topic."""
 
@@ -212,6 +887,24 @@ class _CreateTopicArgs(TypedDict, total=False):
     Tags: Sequence['TagTypeDef']
 
 
+class _CaptureKey(NamedTuple):
+    """Key of index of captured messages."""
+
+    field: str
+    name: str
+    value: str
+
+
+class _SubscribeArgs(TypedDict, total=False):
+    """Arguments to subscribe an endpoint."""
+
+    TopicArn: str
+    Protocol: str
+    Endpoint: str
+    Attributes: Mapping[str, str]
+    ReturnSubscriptionArn: bool
+
+
 class _PublishArgs(TypedDict, total=False):
     """Arguments to publish a message."""
 
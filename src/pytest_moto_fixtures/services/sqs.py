@@ -1,22 +1,157 @@
 """Access SQS service."""
 
 import json
-from collections.abc import Iterator, Mapping
-from contextlib import contextmanager
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, TypedDict
-
-from pytest_moto_fixtures.utils import NoArgs, randstr
+import re
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, suppress
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import pairwise
+from math import ceil
+from statistics import fmean
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict, overload
+from uuid import uuid4
+
+from pytest_moto_fixtures.utils import NoArgs, create_concurrently, is_resource_removal_skipped, randname
 
 if TYPE_CHECKING:
     from types_boto3_sqs import SQSClient
-    from types_boto3_sqs.literals import QueueAttributeNameType
-    from types_boto3_sqs.type_defs import MessageTypeDef
+    from types_boto3_sqs.literals import MessageSystemAttributeNameType, QueueAttributeNameType
+    from types_boto3_sqs.type_defs import (
+        DeleteMessageBatchRequestEntryTypeDef,
+        MessageAttributeValueTypeDef,
+        MessageTypeDef,
+        SendMessageBatchRequestEntryTypeDef,
+    )
+    from typing_extensions import Self
+
+    from .s3 import S3Bucket
+
+_BATCH_MAX_ENTRIES = 10
+_BATCH_MAX_SIZE = 256 * 1024
+_MAX_WAIT_SECONDS = 20
+_PAYLOAD_POINTER_CLASS = 'software.amazon.payloadoffloading.PayloadS3Pointer'
+_PAYLOAD_SIZE_ATTRIBUTE = 'ExtendedPayloadSize'
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQSMessage:
+    """Message to send to a queue."""
+
+    body: str | dict[Any, Any]
+    """Message body. If it is a dict, it will be converted to JSON string."""
+    delay_seconds: int | NoArgs = NoArgs.NO_ARG
+    """Message delivery delay in seconds."""
+    deduplication_id: str | NoArgs = NoArgs.NO_ARG
+    """Identifier to check for duplicate messages."""
+    group_id: str | NoArgs = NoArgs.NO_ARG
+    """Identifier to group messages that should be delivered sequentially."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQSBatchFailure:
+    """Entry of a batch call that failed."""
+
+    index: int
+    """Position of entry in the input."""
+    code: str
+    """Error code."""
+    message: str
+    """Error message."""
+    sender_fault: bool
+    """If the error was caused by the entry sent, instead of the service."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQSBatchResult:
+    """Result of batch calls."""
+
+    successful: dict[int, str] = field(default_factory=dict)
+    """Identifier of message of each successful entry, by position of entry in the input."""
+    failed: list[SQSBatchFailure] = field(default_factory=list)
+    """Entries that failed."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQSQueueDepth:
+    """Number of messages in queue by state."""
+
+    visible: int
+    """Messages available to receive, including messages received by iteration and not returned yet."""
+    in_flight: int
+    """Messages received, but not deleted or returned to queue yet."""
+    delayed: int
+    """Messages waiting for their delivery delay."""
+
+    @property
+    def total(self) -> int:
+        """Number of messages in all states."""
+        return self.visible + self.in_flight + self.delayed
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQSGroupStats:
+    """Statistics of messages of a group consumed."""
+
+    latencies: list[float]
+    """Time in seconds from receiving each message to the end of its handling, in the order handled."""
+    ordered: bool | None
+    """If the messages were handled in the order they were sent, or ``None`` if the order was not checked."""
+
+    @property
+    def count(self) -> int:
+        """Number of messages handled."""
+        return len(self.latencies)
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean time in seconds from receiving a message to the end of its handling."""
+        return fmean(self.latencies)
+
+    @property
+    def max_latency(self) -> float:
+        """Maximum time in seconds from receiving a message to the end of its handling."""
+        return max(self.latencies)
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQSConsumeResult:
+    """Result of consuming messages of a queue."""
+
+    duration: float
+    """Time in seconds to consume the messages."""
+    groups: dict[str, SQSGroupStats]
+    """Statistics by message group. Messages without group, as in standard queues, are in the ``''`` group."""
+
+    @property
+    def count(self) -> int:
+        """Number of messages handled."""
+        return sum(group.count for group in self.groups.values())
+
+    @property
+    def throughput(self) -> float:
+        """Number of messages handled per second."""
+        return self.count / self.duration if self.duration else 0.0
+
+    @property
+    def ordered(self) -> bool | None:
+        """If the messages of all groups were handled in the order sent, or ``None`` if it was not checked."""
+        checked = [group.ordered for group in self.groups.values() if group.ordered is not None]
+        return all(checked) if checked else None
 
 
 @dataclass(kw_only=True, frozen=True)
 class SQSQueue:
-    """Queue in SQS service."""
+    """Queue in SQS service.
+
+    If :attr:`payload_bucket` is set, bodies larger than :attr:`payload_threshold` are stored in the bucket and a
+    pointer to them is sent instead, in the format of the Amazon SQS Extended Client Library. Received pointers are
+    resolved to the stored bodies, which are kept in the bucket.
+    """
 
     client: 'SQSClient' = field(repr=False)
     """SQS Client."""
@@ -26,22 +161,47 @@ class SQSQueue:
     """Queue ARN."""
     url: str
     """Queue URL."""
+    payload_bucket: 'S3Bucket | None' = field(default=None, repr=False, compare=False)
+    """Bucket to store large bodies. If it is ``None``, large bodies are sent as is and the call fails."""
+    payload_threshold: int = _BATCH_MAX_SIZE
+    """Size in bytes above which bodies are stored in :attr:`payload_bucket`."""
+    _buffer: deque['MessageTypeDef'] = field(default_factory=deque, init=False, repr=False, compare=False)
+    """Messages received and removed from the queue, but not returned yet."""
 
     def __len__(self) -> int:
-        """Number of messages in queue.
+        """Number of messages in queue, including messages received by iteration and not returned yet.
 
         Returns:
             Number of messages in queue.
         """
-        attributes = self.client.get_queue_attributes(
-            QueueUrl=self.url,
-            AttributeNames=[
-                'ApproximateNumberOfMessages',
-                'ApproximateNumberOfMessagesDelayed',
-                'ApproximateNumberOfMessagesNotVisible',
-            ],
-        )['Attributes']
-        return sum(int(value) for value in attributes.values())
+        return self.depth().total
+
+    def depth(self, *, from_backend: bool = False) -> SQSQueueDepth:
+        """Number of messages in queue by state.
+
+        Args:
+            from_backend: If ``True`` and the moto mock is running in the process, the numbers are read from the moto
+                backend, without calling the service.
+
+        Returns:
+            Number of messages in queue by state.
+        """
+        depth = _backend_depth(self.arn) if from_backend else None
+        if depth is None:
+            attributes = self.client.get_queue_attributes(
+                QueueUrl=self.url,
+                AttributeNames=[
+                    'ApproximateNumberOfMessages',
+                    'ApproximateNumberOfMessagesDelayed',
+                    'ApproximateNumberOfMessagesNotVisible',
+                ],
+            )['Attributes']
+            depth = SQSQueueDepth(
+                visible=int(attributes['ApproximateNumberOfMessages']),
+                in_flight=int(attributes['ApproximateNumberOfMessagesNotVisible']),
+                delayed=int(attributes['ApproximateNumberOfMessagesDelayed']),
+            )
+        return replace(depth, visible=depth.visible + len(self._buffer))
 
     def send_message(
         self,
@@ -62,6 +222,8 @@ class SQSQueue:
         if not isinstance(body, str):
             body = json.dumps(body)
         args = _SendMessageArgs(QueueUrl=self.url, MessageBody=body)
+        if offloaded := self._offload_payload(body):
+            args['MessageBody'], args['MessageAttributes'] = offloaded
         if not isinstance(delay_seconds, NoArgs):
             args['DelaySeconds'] = delay_seconds
         if not isinstance(deduplication_id, NoArgs):
@@ -70,22 +232,295 @@ class SQSQueue:
             args['MessageGroupId'] = group_id
         self.client.send_message(**args)
 
+    def send_messages(self, messages: Iterable[str | dict[Any, Any] | SQSMessage]) -> SQSBatchResult:
+        """Send messages to queue in batches.
+
+        The messages are read from the iterable as they are sent, in batches of up to 10 messages and 256 KiB of
+        bodies. A message larger than this is not sent, and is reported as failed.
+
+        Args:
+            messages: Messages to send. A str or dict is sent as the body of message, without other arguments.
+
+        Returns:
+            Result of sent messages, with the messages that failed.
+        """
+        result = SQSBatchResult()
+        entries: list[SendMessageBatchRequestEntryTypeDef] = []
+        size = 0
+        for index, message in enumerate(messages):
+            entry = _batch_entry(index, message if isinstance(message, SQSMessage) else SQSMessage(body=message))
+            if offloaded := self._offload_payload(entry['MessageBody']):
+                entry['MessageBody'], entry['MessageAttributes'] = offloaded
+            entry_size = len(entry['MessageBody'].encode())
+            if entry_size > _BATCH_MAX_SIZE:
+                message_failed = f'Message larger than {_BATCH_MAX_SIZE} bytes'
+                result.failed.append(
+                    SQSBatchFailure(index=index, code='BatchRequestTooLong', message=message_failed, sender_fault=True)
+                )
+                continue
+            if entries and (len(entries) == _BATCH_MAX_ENTRIES or size + entry_size > _BATCH_MAX_SIZE):
+                self._send_message_batch(entries, result)
+                entries, size = [], 0
+            entries.append(entry)
+            size += entry_size
+        if entries:
+            self._send_message_batch(entries, result)
+        return result
+
+    def _offload_payload(self, body: str) -> tuple[str, dict[str, 'MessageAttributeValueTypeDef']] | None:
+        """Store body in payload bucket if it is larger than the threshold.
+
+        Args:
+            body: Message body.
+
+        Returns:
+            Pointer to send as body and its message attributes, or ``None`` if the body should be sent as is.
+        """
+        if self.payload_bucket is None:
+            return None
+        offloaded = _offload_payload(self.payload_bucket, body, threshold=self.payload_threshold)
+        if offloaded is None:
+            return None
+        pointer, size = offloaded
+        return pointer, {_PAYLOAD_SIZE_ATTRIBUTE: {'DataType': 'Number', 'StringValue': str(size)}}
+
+    def _send_message_batch(
+        self, entries: list['SendMessageBatchRequestEntryTypeDef'], result: SQSBatchResult
+    ) -> None:
+        """Send a batch of messages and add its outcome to result.
+
+        Args:
+            entries: Entries of batch, with the position in the input as identifier.
+            result: Result where the outcome is added.
+        """
+        response = self.client.send_message_batch(QueueUrl=self.url, Entries=entries)
+        for successful in response.get('Successful', []):
+            result.successful[int(successful['Id'])] = successful['MessageId']
+        for failed in response.get('Failed', []):
+            result.failed.append(
+                SQSBatchFailure(
+                    index=int(failed['Id']),
+                    code=failed['Code'],
+                    message=failed.get('Message', ''),
+                    sender_fault=failed['SenderFault'],
+                )
+            )
+
     def receive_message(self) -> 'MessageTypeDef | None':
         """Receives messages from the queue and removes them.
 
         Returns:
             Messages received from the queue, or ``None`` if the queue has no messages.
         """
-        messages = self.client.receive_message(QueueUrl=self.url, MaxNumberOfMessages=1).get('Messages')
-        if not messages:
-            return None
-        message = messages[0]
-        self.client.delete_message(QueueUrl=self.url, ReceiptHandle=message['ReceiptHandle'])
-        return message
+        messages = self._pop_buffer(1) or self._receive_batch(1)
+        return messages[0] if messages else None
+
+    def receive_messages(self, *, max_messages: int = _BATCH_MAX_ENTRIES) -> list['MessageTypeDef']:
+        """Receives up to ``max_messages`` messages from the queue and removes them.
+
+        Messages are received in batches of up to 10 messages, until the number of messages is reached or the queue
+        has no messages. Messages already received by iteration and not returned yet are returned first.
+
+        Args:
+            max_messages: Maximum number of messages to receive.
+
+        Returns:
+            Messages received from the queue.
+        """
+        messages = self._pop_buffer(max_messages)
+        while len(messages) < max_messages:
+            received = self._receive_batch(min(max_messages - len(messages), _BATCH_MAX_ENTRIES))
+            if not received:
+                break
+            messages.extend(received)
+        return messages
+
+    def wait_for(self, count: int, *, timeout: float = _MAX_WAIT_SECONDS) -> list['MessageTypeDef']:
+        """Wait until ``count`` messages are received from the queue, and remove them.
+
+        The queue is long polled, so the messages are returned as soon as they are received. As the wait of each poll
+        is rounded up to seconds, it can take up to one second more than ``timeout``.
+
+        Args:
+            count: Number of messages to receive.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Messages received from the queue.
+
+        Raises:
+            TimeoutError: If fewer messages are received in time. The received messages are already removed from the
+                queue in SQS, and are kept in this object to be returned by its next calls.
+        """
+        deadline = monotonic() + timeout
+        messages = self.receive_messages(max_messages=count)
+        while len(messages) < count:
+            wait_seconds = _wait_seconds(deadline)
+            if not wait_seconds:
+                self._buffer.extendleft(reversed(messages))
+                msg = f'Received {len(messages)} of {count} messages in {timeout} seconds'
+                raise TimeoutError(msg)
+            messages.extend(
+                self._receive_batch(min(count - len(messages), _BATCH_MAX_ENTRIES), wait_seconds=wait_seconds)
+            )
+        return messages
+
+    def wait_for_matching(
+        self, predicate: Callable[['MessageTypeDef'], bool], *, timeout: float = _MAX_WAIT_SECONDS
+    ) -> 'MessageTypeDef':
+        """Wait until a message matching ``predicate`` is received from the queue, and remove it.
+
+        The queue is received once without waiting, and then long polled, so the message is returned as soon as it is
+        received. Messages received that do not match are already removed from the queue in SQS, and are kept in this
+        object to be returned by its next calls, in the same order.
+
+        Args:
+            predicate: Function that receives a message and returns if it matches.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Message received from the queue.
+
+        Raises:
+            TimeoutError: If no message matching is received in time.
+        """
+        deadline = monotonic() + timeout
+        skipped: list[MessageTypeDef] = []
+        polled = False
+        try:
+            while True:
+                if not self._buffer:
+                    wait_seconds = _wait_seconds(deadline) if polled else 0
+                    if polled and not wait_seconds:
+                        msg = f'No message matching received in {timeout} seconds'
+                        raise TimeoutError(msg)
+                    self._buffer.extend(self._receive_batch(_BATCH_MAX_ENTRIES, wait_seconds=wait_seconds))
+                    polled = True
+                    continue
+                if predicate(self._buffer[0]):
+                    return self._buffer.popleft()
+                skipped.append(self._buffer.popleft())
+        finally:
+            self._buffer.extendleft(reversed(skipped))
+
+    def consume(
+        self,
+        handler: Callable[['MessageTypeDef'], object],
+        *,
+        workers: int = 4,
+        sequence: Callable[['MessageTypeDef'], int] | None = None,
+    ) -> SQSConsumeResult:
+        """Receive all messages from the queue, remove them and handle them in parallel.
+
+        Each message group is handled by a single worker, in the order received, so different groups are handled in
+        parallel while the order inside a group is preserved. Messages without group, as in standard queues, are
+        handled by any worker.
+
+        The order inside each group is checked against ``sequence``, which gives the position of a message in the
+        order it was sent, as a counter in its body or attributes. The ``'SequenceNumber'`` attribute of fifo queues
+        can be used in SQS, but moto returns random values for it.
+
+        Args:
+            handler: Function that receives a message. It is called in the worker threads.
+            workers: Number of worker threads.
+            sequence: Function that returns the position of a message in the order it was sent. If it is ``None``, the
+                order is not checked.
+
+        Returns:
+            Duration of consume, and latency and ordering of messages by group.
+
+        Raises:
+            ValueError: If ``workers`` is not positive.
+            Exception: The first error raised by ``handler``, after all messages are handled.
+        """
+        if workers < 1:
+            msg = f'workers must be positive, got {workers}'
+            raise ValueError(msg)
+        start = monotonic()
+        lanes = [ThreadPoolExecutor(max_workers=1) for _ in range(workers)]
+        group_lanes: dict[str, ThreadPoolExecutor] = {}
+        handled: dict[str, list[tuple[int | None, float]]] = {'': []}
+        futures: list[Future[None]] = []
+
+        def handle(group: str, message: 'MessageTypeDef', received: float) -> None:
+            position = sequence(message) if sequence is not None and group else None
+            handler(message)
+            handled[group].append((position, monotonic() - received))
+
+        try:
+            messages = self._pop_buffer(len(self._buffer)) or self._receive_batch(_BATCH_MAX_ENTRIES)
+            while messages:
+                received = monotonic()
+                for message in messages:
+                    group = message.get('Attributes', {}).get('MessageGroupId', '')
+                    if not group:
+                        lane = lanes[len(futures) % workers]
+                    elif group in group_lanes:
+                        lane = group_lanes[group]
+                    else:
+                        lane = group_lanes[group] = lanes[len(group_lanes) % workers]
+                        handled[group] = []
+                    futures.append(lane.submit(handle, group, message, received))
+                messages = self._receive_batch(_BATCH_MAX_ENTRIES)
+        finally:
+            for lane in lanes:
+                lane.shutdown()
+        duration = monotonic() - start
+        for future in futures:
+            future.result()
+
+        return SQSConsumeResult(
+            duration=duration,
+            groups={
+                group: SQSGroupStats(latencies=[latency for _, latency in entries], ordered=_is_ordered(entries))
+                for group, entries in handled.items()
+                if entries
+            },
+        )
+
+    def _receive_batch(self, max_messages: int, *, wait_seconds: int = 0) -> list['MessageTypeDef']:
+        """Receive a batch of messages from the queue and remove them.
+
+        The messages are received with their message attributes, and the ``'MessageGroupId'`` and
+        ``'SequenceNumber'`` attributes of fifo queues.
+
+        Args:
+            max_messages: Maximum number of messages, up to 10.
+            wait_seconds: Time to wait for messages, up to 20 seconds. If it is ``0``, the wait configured in the
+                queue is used.
+
+        Returns:
+            Messages received from the queue.
+        """
+        args = _ReceiveMessageArgs(
+            QueueUrl=self.url,
+            MaxNumberOfMessages=max_messages,
+            MessageAttributeNames=['All'],
+            MessageSystemAttributeNames=['MessageGroupId', 'SequenceNumber'],
+        )
+        if wait_seconds:
+            args['WaitTimeSeconds'] = wait_seconds
+        response = self.client.receive_message(**args)
+        messages = response.get('Messages', [])
+        if len(messages) == 1:
+            self.client.delete_message(QueueUrl=self.url, ReceiptHandle=messages[0]['ReceiptHandle'])
+        elif messages:
+            entries: list[DeleteMessageBatchRequestEntryTypeDef] = [
+                {'Id': str(i), 'ReceiptHandle': message['ReceiptHandle']} for i, message in enumerate(messages)
+            ]
+            self.client.delete_message_batch(QueueUrl=self.url, Entries=entries)
+        if self.payload_bucket is not None:
+            for message in messages:
+                message['Body'] = _resolve_payload(self.payload_bucket, message['Body'])
+        return messages
 
     def __iter__(self) -> Iterator['MessageTypeDef']:
         """Iterates over messages in queue, removing them after they are received.
 
+        Messages are received in batches of up to 10 messages, and removed from the queue in SQS at once. Messages
+        received and not returned yet, as when the iteration stops early, are only kept in this object: they are
+        returned by its next calls, but are not seen by other clients of the queue.
+
         Returns:
             Iterator over messages.
         """
@@ -97,23 +532,45 @@ class SQSQueue:
         Returns:
             Message received from queue.
         """
-        message = self.receive_message()
-        if message is None:
+        if not self._buffer:
+            self._buffer.extend(self._receive_batch(_BATCH_MAX_ENTRIES))
+        messages = self._pop_buffer(1)
+        if not messages:
             raise StopIteration
-        return message
+        return messages[0]
+
+    def _pop_buffer(self, max_messages: int) -> list['MessageTypeDef']:
+        """Remove messages from the buffer of messages received by iteration.
+
+        The buffer can be changed by other threads, so it is not checked before removing each message.
+
+        Args:
+            max_messages: Maximum number of messages to remove.
+
+        Returns:
+            Messages removed from the buffer.
+        """
+        messages: list[MessageTypeDef] = []
+        with suppress(IndexError):
+            while len(messages) < max_messages:
+                messages.append(self._buffer.popleft())
+        return messages
 
     def purge_queue(self) -> None:
-        """Purge messages in queue."""
+        """Purge messages in queue, including messages received by iteration and not returned yet."""
+        self._buffer.clear()
         self.client.purge_queue(QueueUrl=self.url)
 
 
 @contextmanager
-def sqs_create_queue(
+def sqs_create_queue(  # noqa: PLR0913
     *,
     sqs_client: 'SQSClient',
     name: str | None = None,
     attributes: Mapping['QueueAttributeNameType', str] | NoArgs = NoArgs.NO_ARG,
     tags: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    lookup_arn: bool = False,
+    payload_bucket: 'S3Bucket | None' = None,
 ) -> Iterator[SQSQueue]:
     """Context for creating an SQS queue and removing it on exit.
 
@@ -122,12 +579,16 @@ def sqs_create_queue(
         name: Name of queue to be created. If it is ``None`` a random name will be used.
         attributes: Attributes of queue to be created.
         tags: Tags of queue to be created.
+        lookup_arn: If ``True``, the queue ARN is read from the queue attributes. Otherwise, it is built from the
+            partition and region of client and the account in queue URL, and read from the attributes only if the URL
+            has no account.
+        payload_bucket: Bucket to store bodies larger than 256 KiB, and send a pointer to them instead.
 
     Return:
         Queue created in SQS service.
     """
     if name is None:
-        name = randstr()
+        name = randname()
     args = _CreateQueueArgs(QueueName=name)
     if not isinstance(attributes, NoArgs):
         args['Attributes'] = attributes
@@ -135,18 +596,24 @@ def sqs_create_queue(
         args['tags'] = tags
 
     queue = sqs_client.create_queue(**args)
-    attributes = sqs_client.get_queue_attributes(QueueUrl=queue['QueueUrl'], AttributeNames=['QueueArn'])['Attributes']
-    yield SQSQueue(client=sqs_client, name=name, arn=attributes['QueueArn'], url=queue['QueueUrl'])
-    sqs_client.delete_queue(QueueUrl=queue['QueueUrl'])
+    arn = None if lookup_arn else _queue_arn(sqs_client=sqs_client, name=name, url=queue['QueueUrl'])
+    if arn is None:
+        response = sqs_client.get_queue_attributes(QueueUrl=queue['QueueUrl'], AttributeNames=['QueueArn'])
+        arn = response['Attributes']['QueueArn']
+    yield SQSQueue(client=sqs_client, name=name, arn=arn, url=queue['QueueUrl'], payload_bucket=payload_bucket)
+    if not is_resource_removal_skipped():
+        sqs_client.delete_queue(QueueUrl=queue['QueueUrl'])
 
 
 @contextmanager
-def sqs_create_fifo_queue(
+def sqs_create_fifo_queue(  # noqa: PLR0913
     *,
     sqs_client: 'SQSClient',
     name: str | None = None,
     attributes: Mapping['QueueAttributeNameType', str] | NoArgs = NoArgs.NO_ARG,
     tags: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    lookup_arn: bool = False,
+    payload_bucket: 'S3Bucket | None' = None,
 ) -> Iterator[SQSQueue]:
     """Context for creating an SQS fifo queue and removing it on exit.
 
@@ -157,21 +624,348 @@ def sqs_create_fifo_queue(
         attributes: Attributes of queue to be created. If it does not have the ``'FifoQueue'`` attribute it will be
             added.
         tags: Tags of queue to be created.
+        lookup_arn: If ``True``, the queue ARN is read from the queue attributes instead of built locally.
+        payload_bucket: Bucket to store bodies larger than 256 KiB, and send a pointer to them instead.
 
     Return:
         Queue created in SQS service.
     """
     if name is None:
-        name = randstr()
+        name = randname()
     if not name.endswith('.fifo'):
         name += '.fifo'
     attributes = dict(attributes.items()) if not isinstance(attributes, NoArgs) else {}
     if 'FifoQueue' not in attributes:
         attributes['FifoQueue'] = 'true'
-    with sqs_create_queue(sqs_client=sqs_client, name=name, attributes=attributes, tags=tags) as queue:
+    with sqs_create_queue(
+        sqs_client=sqs_client,
+        name=name,
+        attributes=attributes,
+        tags=tags,
+        lookup_arn=lookup_arn,
+        payload_bucket=payload_bucket,
+    ) as queue:
         yield queue
 
 
+@contextmanager
+def sqs_create_queues(
+    *,
+    sqs_client: 'SQSClient',
+    count: int,
+    attributes: Mapping['QueueAttributeNameType', str] | NoArgs = NoArgs.NO_ARG,
+    tags: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    max_workers: int | None = None,
+) -> Iterator[list[SQSQueue]]:
+    """Context for creating many SQS queues concurrently and removing them on exit.
+
+    Args:
+        sqs_client: SQS client where the queues will be created.
+        count: Number of queues to be created, with random names.
+        attributes: Attributes of queues to be created.
+        tags: Tags of queues to be created.
+        max_workers: Maximum number of threads creating and removing the queues.
+
+    Return:
+        Queues created in SQS service.
+    """
+    factory = partial(sqs_create_queue, sqs_client=sqs_client, attributes=attributes, tags=tags)
+    with create_concurrently([factory] * count, max_workers=max_workers) as queues:
+        yield queues
+
+
+@contextmanager
+def sqs_create_fifo_queues(
+    *,
+    sqs_client: 'SQSClient',
+    count: int,
+    attributes: Mapping['QueueAttributeNameType', str] | NoArgs = NoArgs.NO_ARG,
+    tags: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    max_workers: int | None = None,
+) -> Iterator[list[SQSQueue]]:
+    """Context for creating many SQS fifo queues concurrently and removing them on exit.
+
+    Args:
+        sqs_client: SQS client where the queues will be created.
+        count: Number of queues to be created, with random names.
+        attributes: Attributes of queues to be created. If it does not have the ``'FifoQueue'`` attribute it will be
+            added.
+        tags: Tags of queues to be created.
+        max_workers: Maximum number of threads creating and removing the queues.
+
+    Return:
+        Queues created in SQS service.
+    """
+    factory = partial(sqs_create_fifo_queue, sqs_client=sqs_client, attributes=attributes, tags=tags)
+    with create_concurrently([factory] * count, max_workers=max_workers) as queues:
+        yield queues
+
+
+class SQSQueuePool:
+    """Pool of SQS queues reused between leases.
+
+    Queues are created on demand, purged when returned to the pool and only removed when the pool is closed. Queues
+    are grouped by their attributes and tags, so a lease only receives a queue created with the same settings.
+    Changes made on queue attributes or tags while leased are not reverted.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty pool."""
+        self._stack = ExitStack()
+        self._queues: list[SQSQueue] = []
+        self._free: dict[_PoolKey, list[SQSQueue]] = {}
+
+    def __len__(self) -> int:
+        """Number of queues created by the pool.
+
+        Returns:
+            Number of queues.
+        """
+        return len(self._queues)
+
+    def __iter__(self) -> Iterator[SQSQueue]:
+        """Iterates over queues created by the pool.
+
+        Returns:
+            Iterator over queues.
+        """
+        return iter(self._queues)
+
+    @contextmanager
+    def lease(
+        self,
+        *,
+        sqs_client: 'SQSClient',
+        attributes: Mapping['QueueAttributeNameType', str] | NoArgs = NoArgs.NO_ARG,
+        tags: Mapping[str, str] | NoArgs = NoArgs.NO_ARG,
+    ) -> Iterator[SQSQueue]:
+        """Context for leasing a queue from the pool and returning it on exit.
+
+        Args:
+            sqs_client: SQS client used to access the queue, and to create it if the pool has no free queue.
+            attributes: Attributes of queue. If it has the ``'FifoQueue'`` attribute as ``'true'`` a fifo queue will
+                be used.
+            tags: Tags of queue.
+
+        Return:
+            Queue leased from the pool.
+        """
+        key = _PoolKey(
+            attributes=frozenset(attributes.items()) if not isinstance(attributes, NoArgs) else frozenset(),
+            tags=frozenset(tags.items()) if not isinstance(tags, NoArgs) else frozenset(),
+        )
+        free = self._free.setdefault(key, [])
+        if free:
+            queue = free.pop()
+        else:
+            create = sqs_create_fifo_queue if dict(key.attributes).get('FifoQueue') == 'true' else sqs_create_queue
+            queue = self._stack.enter_context(create(sqs_client=sqs_client, attributes=attributes, tags=tags))
+            self._queues.append(queue)
+        leased = replace(queue, client=sqs_client)
+        try:
+            yield leased
+        finally:
+            leased.purge_queue()
+            free.append(queue)
+
+    def close(self) -> None:
+        """Remove all queues created by the pool."""
+        self._stack.close()
+        self._queues.clear()
+        self._free.clear()
+
+
+def _wait_seconds(deadline: float) -> int:
+    """Time to long poll a queue until the deadline.
+
+    Args:
+        deadline: Deadline, as returned by :func:`time.monotonic`.
+
+    Returns:
+        Time in seconds, rounded up and limited to the maximum of a poll, or ``0`` if the deadline has passed.
+    """
+    remaining = deadline - monotonic()
+    if remaining <= 0:
+        return 0
+    return min(ceil(remaining), _MAX_WAIT_SECONDS)
+
+
+def _backend_depth(arn: str) -> SQSQueueDepth | None:
+    """Read the number of messages in queue from moto backend.
+
+    Args:
+        arn: Queue ARN.
+
+    Returns:
+        Number of messages in queue by state, or ``None`` if the moto mock is not running in the process.
+    """
+    try:
+        from moto import settings  # noqa: PLC0415
+        from moto.core.models import botocore_stubber  # noqa: PLC0415
+        from moto.sqs.models import sqs_backends  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    if not botocore_stubber.enabled or settings.TEST_SERVER_MODE:
+        return None
+    _, _, _, region, account_id, name = arn.split(':')
+    queue = sqs_backends[account_id][region].queues.get(name)
+    if queue is None:
+        return None
+    return SQSQueueDepth(
+        visible=queue.approximate_number_of_messages,
+        in_flight=queue.approximate_number_of_messages_not_visible,
+        delayed=queue.approximate_number_of_messages_delayed,
+    )
+
+
+def _queue_arn(*, sqs_client: 'SQSClient', name: str, url: str) -> str | None:
+    """Build the ARN of queue without calling the service.
+
+    Args:
+        sqs_client: SQS client where the queue was created.
+        name: Queue name.
+        url: Queue URL, like ``'https://sqs.us-east-1.amazonaws.com/123456789012/name'``.
+
+    Returns:
+        Queue ARN, or ``None`` if the URL does not have the account.
+    """
+    match = re.fullmatch(rf'.*/(\d{{12}})/{re.escape(name)}', url)
+    if match is None:
+        return None
+    return f'arn:{sqs_client.meta.partition}:sqs:{sqs_client.meta.region_name}:{match[1]}:{name}'
+
+
+def _offload_payload(bucket: 'S3Bucket', body: str, *, threshold: int) -> tuple[str, int] | None:
+    """Store body in bucket if it is larger than threshold.
+
+    The body is only encoded if it can be larger than threshold, and the encoded body is stored without copies.
+
+    Args:
+        bucket: Bucket where the body is stored.
+        body: Body of message.
+        threshold: Size in bytes above which the body is stored.
+
+    Returns:
+        Pointer to the stored body and size of body in bytes, or ``None`` if the body is not larger than threshold.
+    """
+    if len(body) * 4 <= threshold:  # A character has up to 4 bytes in UTF-8
+        return None
+    payload = body.encode()
+    if len(payload) <= threshold:
+        return None
+    key = str(uuid4())
+    bucket[key] = payload
+    pointer = json.dumps([_PAYLOAD_POINTER_CLASS, {'s3BucketName': bucket.name, 's3Key': key}], separators=(',', ':'))
+    return pointer, len(payload)
+
+
+def _resolve_payload(bucket: 'S3Bucket', body: str) -> str:
+    """Read the body stored in bucket if the body is a pointer.
+
+    Args:
+        bucket: Bucket with client to read the body. The bucket name is read from the pointer.
+        body: Body of message.
+
+    Returns:
+        Stored body, or the body itself if it is not a pointer.
+    """
+    if not body.startswith(f'["{_PAYLOAD_POINTER_CLASS}",'):
+        return body
+    _, pointer = json.loads(body)
+    response = bucket.client.get_object(Bucket=pointer['s3BucketName'], Key=pointer['s3Key'])
+    return response['Body'].read().decode()
+
+
+def _batch_entry(index: int, message: SQSMessage) -> 'SendMessageBatchRequestEntryTypeDef':
+    """Build the entry of a batch to send message.
+
+    Args:
+        index: Position of message in the input, used as identifier of entry.
+        message: Message to send.
+
+    Returns:
+        Entry of batch.
+    """
+    body = message.body if isinstance(message.body, str) else json.dumps(message.body)
+    entry: SendMessageBatchRequestEntryTypeDef = {'Id': str(index), 'MessageBody': body}
+    if not isinstance(message.delay_seconds, NoArgs):
+        entry['DelaySeconds'] = message.delay_seconds
+    if not isinstance(message.deduplication_id, NoArgs):
+        entry['MessageDeduplicationId'] = message.deduplication_id
+    if not isinstance(message.group_id, NoArgs):
+        entry['MessageGroupId'] = message.group_id
+    return entry
+
+
+def _is_ordered(entries: list[tuple[int | None, float]]) -> bool | None:
+    """Check if the messages of a group were handled in the order they were sent.
+
+    Args:
+        entries: Position in the order sent and latency of each message, in the order handled.
+
+    Returns:
+        If the positions are in order, or ``None`` if the messages have no position.
+    """
+    positions = [position for position, _ in entries if position is not None]
+    if not positions:
+        return None
+    return all(previous <= current for previous, current in pairwise(positions))
+
+
+@dataclass(frozen=True)
+class _PoolKey:
+    """Settings of queues that can be shared in pool."""
+
+    attributes: frozenset[tuple[str, str]]
+    tags: frozenset[tuple[str, str]]
+
+
+class _QueueOwner(Protocol):
+    """Object with a queue that can be created on first use."""
+
+    @property
+    def create_queue(self) -> Callable[[], SQSQueue] | None:
+        """Function to create the queue, if it is not provided."""
+
+
+class _LazyQueue:
+    """Descriptor of a queue field that is created on first use if it is not provided.
+
+    The queue is created by the ``create_queue`` attribute of the instance, and kept after that. The creation is
+    guarded by a lock of the instance, so concurrent first uses create a single queue.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attribute = f'_{name}'
+        self._lock_attribute = f'_{name}_lock'
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> 'Self': ...
+
+    @overload
+    def __get__(self, instance: _QueueOwner, owner: type) -> SQSQueue: ...
+
+    def __get__(self, instance: _QueueOwner | None, owner: type) -> 'SQSQueue | Self':
+        if instance is None:
+            return self
+        queue: SQSQueue | None = instance.__dict__.get(self._attribute)
+        if queue is not None:
+            return queue
+        with instance.__dict__.setdefault(self._lock_attribute, Lock()):
+            queue = instance.__dict__.get(self._attribute)
+            if queue is None:
+                if instance.create_queue is None:
+                    msg = 'Either queue or create_queue must be provided'
+                    raise AttributeError(msg)
+                queue = instance.__dict__[self._attribute] = instance.create_queue()
+        return queue
+
+    def __set__(self, instance: _QueueOwner, value: 'SQSQueue | Self') -> None:
+        if isinstance(value, SQSQueue):
+            instance.__dict__[self._attribute] = value
+
+
 class _CreateQueueArgs(TypedDict, total=False):
     """Arguments to create queue."""
 
@@ -186,5 +980,16 @@ class _SendMessageArgs(TypedDict, total=False):
     QueueUrl: str
     MessageBody: str
     DelaySeconds: int
+    MessageAttributes: Mapping[str, 'MessageAttributeValueTypeDef']
     MessageDeduplicationId: str
     MessageGroupId: str
+
+
+class _ReceiveMessageArgs(TypedDict, total=False):
+    """Arguments to receive message."""
+
+    QueueUrl: str
+    MaxNumberOfMessages: int
+    MessageAttributeNames: Sequence[str]
+    WaitTimeSeconds: int
+    MessageSystemAttributeNames: Sequence['MessageSystemAttributeNameType']
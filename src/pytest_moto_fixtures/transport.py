@@ -0,0 +1,187 @@
+"""In-process transport from clients to moto backends.
+
+Calls of supported operations skip the HTTP request to moto and the parsing of its response, calling the moto backend
+directly and building the same response that botocore would parse. If the backend raises an error, the call falls
+back to the HTTP path, so errors are reported exactly as without the fast transport.
+"""
+
+import os
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from botocore.awsrequest import AWSResponse, HTTPHeaders
+from moto import settings
+from moto.core.models import DEFAULT_ACCOUNT_ID, botocore_stubber
+from moto.sqs.constants import MAXIMUM_VISIBILITY_TIMEOUT
+from moto.sqs.models import sqs_backends
+from moto.sqs.utils import validate_message_attributes
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+_PARAMS_CONTEXT_KEY = 'pytest_moto_fixtures_params'
+_SQS_SYSTEM_ATTRIBUTES = (
+    'ApproximateFirstReceiveTimestamp',
+    'ApproximateReceiveCount',
+    'MessageDeduplicationId',
+    'MessageGroupId',
+    'SenderId',
+    'SentTimestamp',
+    'SequenceNumber',
+)
+
+_SQS_COUNTER_ATTRIBUTES = {
+    'ApproximateNumberOfMessages': 'approximate_number_of_messages',
+    'ApproximateNumberOfMessagesDelayed': 'approximate_number_of_messages_delayed',
+    'ApproximateNumberOfMessagesNotVisible': 'approximate_number_of_messages_not_visible',
+}
+
+_Handler = Callable[[str, str, dict[str, Any]], dict[str, Any]]
+
+
+def enable_fast_transport(client: 'BaseClient') -> None:
+    """Send the calls of supported operations of client directly to moto backends.
+
+    Supported operations are ``SendMessage``, ``ReceiveMessage``, ``DeleteMessage`` and ``GetQueueAttributes`` of SQS,
+    the last only for the counters of messages. Calls of other operations are not changed. Enabling it more than once
+    on the same client has no effect.
+
+    Args:
+        client: Client to change.
+    """
+    service_id = client.meta.service_model.service_id.hyphenize()
+    handlers = _HANDLERS.get(client.meta.service_model.service_name, {})
+    for operation_name, handler in handlers.items():
+        client.meta.events.register(
+            f'before-parameter-build.{service_id}.{operation_name}',
+            _store_params,
+            unique_id=f'{_PARAMS_CONTEXT_KEY}-{operation_name}',
+        )
+        client.meta.events.register(
+            f'before-call.{service_id}.{operation_name}',
+            partial(_call_backend, region=client.meta.region_name, handler=handler),  # type: ignore[arg-type]
+            unique_id=f'pytest_moto_fixtures_call-{operation_name}',
+        )
+
+
+def _store_params(params: dict[str, Any], context: dict[str, Any], **kwargs: object) -> None:
+    """Keep the parameters of call, before they are serialized, in the context of request."""
+    context[_PARAMS_CONTEXT_KEY] = params
+
+
+def _call_backend(
+    context: dict[str, Any], region: str, handler: _Handler, **kwargs: object
+) -> tuple[AWSResponse, dict[str, Any]] | None:
+    """Call the backend and return the response as parsed by botocore, or ``None`` to use the HTTP path."""
+    if not botocore_stubber.enabled or settings.TEST_SERVER_MODE:
+        return None
+    account_id = os.environ.get('MOTO_ACCOUNT_ID', DEFAULT_ACCOUNT_ID)
+    try:
+        parsed = handler(account_id, region, context[_PARAMS_CONTEXT_KEY])
+    except Exception:  # noqa: BLE001
+        return None
+    parsed['ResponseMetadata'] = {
+        'RequestId': str(uuid4()),
+        'HTTPStatusCode': 200,
+        'HTTPHeaders': {},
+        'RetryAttempts': 0,
+    }
+    return AWSResponse(url='', status_code=200, headers=HTTPHeaders(), raw=None), parsed
+
+
+def _sqs_send_message(account_id: str, region: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Send message to SQS backend."""
+    message_attributes = params.get('MessageAttributes', {})
+    validate_message_attributes(message_attributes)
+    backend = sqs_backends[account_id][region]
+    queue_name = params['QueueUrl'].split('/')[-1]
+    queue = backend.get_queue(queue_name)
+    message = backend.send_message(
+        queue_name,
+        params['MessageBody'],
+        message_attributes=message_attributes,
+        delay_seconds=params.get('DelaySeconds'),
+        deduplication_id=params.get('MessageDeduplicationId'),
+        group_id=params.get('MessageGroupId'),
+        system_attributes=params.get('MessageSystemAttributes'),
+    )
+    response = {'MD5OfMessageBody': message.body_md5, 'MessageId': message.id}
+    if message.message_attributes:
+        response['MD5OfMessageAttributes'] = message.attribute_md5
+    if queue.fifo_queue and message.sequence_number:
+        response['SequenceNumber'] = message.sequence_number
+    return response
+
+
+def _sqs_receive_message(account_id: str, region: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Receive messages from SQS backend."""
+    backend = sqs_backends[account_id][region]
+    queue_name = params['QueueUrl'].split('/')[-1]
+    queue = backend.get_queue(queue_name)
+    default_wait_time: int = queue.receive_message_wait_time_seconds  # type: ignore[attr-defined]
+    default_visibility_timeout: int = queue.visibility_timeout  # type: ignore[attr-defined]
+    count: int = params.get('MaxNumberOfMessages', 1)
+    wait_time: int = params.get('WaitTimeSeconds', default_wait_time)
+    visibility_timeout: int = params.get('VisibilityTimeout', default_visibility_timeout)
+    if not 1 <= count <= 10 or not 0 <= wait_time <= 20 or visibility_timeout > MAXIMUM_VISIBILITY_TIMEOUT:  # noqa: PLR2004
+        msg = 'Invalid parameters, the HTTP path reports the error'
+        raise ValueError(msg)
+    messages = backend.receive_message(
+        queue_name, count, wait_time, visibility_timeout, params.get('MessageAttributeNames', [])
+    )
+    attribute_names = {*params.get('AttributeNames', []), *params.get('MessageSystemAttributeNames', [])}
+    include = [name for name in _SQS_SYSTEM_ATTRIBUTES if 'All' in attribute_names or name in attribute_names]
+
+    received = []
+    for message in messages:
+        item: dict[str, Any] = {
+            'MessageId': message.id,
+            'ReceiptHandle': message.receipt_handle,
+            'MD5OfBody': message.body_md5,
+            'Body': message.body,
+        }
+        if message.message_attributes:
+            item['MessageAttributes'] = message.message_attributes
+            item['MD5OfMessageAttributes'] = message.attribute_md5
+        values = {
+            'ApproximateFirstReceiveTimestamp': str(message.approximate_first_receive_timestamp),
+            'ApproximateReceiveCount': str(message.approximate_receive_count),
+            'MessageDeduplicationId': message.deduplication_id,
+            'MessageGroupId': message.group_id,
+            'SenderId': message.sender_id,
+            'SentTimestamp': str(message.sent_timestamp),
+            'SequenceNumber': message.sequence_number,
+        }
+        if include:
+            item['Attributes'] = {name: values[name] for name in include if values[name] is not None}
+        received.append(item)
+    return {'Messages': received} if received else {}
+
+
+def _sqs_delete_message(account_id: str, region: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Delete message from SQS backend."""
+    backend = sqs_backends[account_id][region]
+    backend.delete_message(params['QueueUrl'].split('/')[-1], params['ReceiptHandle'])
+    return {}
+
+
+def _sqs_get_queue_attributes(account_id: str, region: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Get counters of messages from SQS backend."""
+    names = params.get('AttributeNames', [])
+    if not names or not set(names) <= _SQS_COUNTER_ATTRIBUTES.keys():
+        msg = 'Only counters of messages are supported, the HTTP path returns other attributes'
+        raise ValueError(msg)
+    queue = sqs_backends[account_id][region].get_queue(params['QueueUrl'].split('/')[-1])
+    return {'Attributes': {name: str(getattr(queue, _SQS_COUNTER_ATTRIBUTES[name])) for name in names}}
+
+
+_HANDLERS: dict[str, dict[str, _Handler]] = {
+    'sqs': {
+        'SendMessage': _sqs_send_message,
+        'ReceiveMessage': _sqs_receive_message,
+        'DeleteMessage': _sqs_delete_message,
+        'GetQueueAttributes': _sqs_get_queue_attributes,
+    },
+}
@@ -1,8 +1,16 @@
 """Utils functions."""
 
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
 from enum import Enum
+from functools import partial
 from random import choice
 from string import ascii_letters, digits
+from typing import TypeVar
+
+_T = TypeVar('_T')
 
 
 def randstr(*, chars: str = ascii_letters + digits, length: int = 10) -> str:
@@ -18,6 +26,115 @@ def randstr(*, chars: str = ascii_letters + digits, length: int = 10) -> str:
     return ''.join(choice(chars) for _ in range(length))
 
 
+def xdist_worker_id() -> str | None:
+    """Identifier of the pytest-xdist worker running the current process.
+
+    Returns:
+        Worker identifier, like ``'gw0'``, or ``None`` if not running in a pytest-xdist worker.
+    """
+    return os.environ.get('PYTEST_XDIST_WORKER')
+
+
+def xdist_worker_number() -> int | None:
+    """Number of the pytest-xdist worker running the current process.
+
+    Returns:
+        Worker number, or ``None`` if not running in a pytest-xdist worker.
+    """
+    worker_id = xdist_worker_id()
+    if worker_id is None:
+        return None
+    return int(worker_id.removeprefix('gw'))
+
+
+def randname(*, length: int = 10) -> str:
+    """Generate a random name for resources.
+
+    When running in a pytest-xdist worker, the name is prefixed with the worker identifier, so each worker has its own
+    namespace of names.
+
+    Args:
+        length: Length of random part of generated name.
+
+    Returns:
+        Generated name.
+    """
+    name = randstr(length=length)
+    worker_id = xdist_worker_id()
+    if worker_id is not None:
+        name = f'{worker_id}-{name}'
+    return name
+
+
+_skip_removal = False
+
+
+@contextmanager
+def skip_resource_removal() -> Iterator[None]:
+    """Context where the resources created by the ``*_create_*`` contexts are not removed on exit.
+
+    Used when the state of AWS mock is about to be discarded, so removing each resource would only add calls.
+    """
+    global _skip_removal  # noqa: PLW0603
+    previous = _skip_removal
+    _skip_removal = True
+    try:
+        yield
+    finally:
+        _skip_removal = previous
+
+
+def is_resource_removal_skipped() -> bool:
+    """Check if the removal of resources is skipped.
+
+    Returns:
+        ``True`` if running in the :func:`skip_resource_removal` context.
+    """
+    return _skip_removal
+
+
+def _call_concurrently(funcs: Sequence[Callable[[], _T]], *, max_workers: int | None) -> list[Future[_T]]:
+    """Call functions in a thread pool and wait for all of them.
+
+    Args:
+        funcs: Functions to call.
+        max_workers: Maximum number of threads. If it is ``None`` the default of :class:`ThreadPoolExecutor` is used.
+
+    Returns:
+        Finished futures of calls, in the same order as the functions.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [executor.submit(func) for func in funcs]
+
+
+@contextmanager
+def create_concurrently(
+    factories: Sequence[Callable[[], AbstractContextManager[_T]]], *, max_workers: int | None = None
+) -> Iterator[list[_T]]:
+    """Context for entering many contexts concurrently and exiting them concurrently on exit.
+
+    If entering any context fails, the contexts already entered are exited and the first error is raised.
+
+    Args:
+        factories: Functions that return the contexts to enter, like the ``*_create_*`` contexts with their arguments.
+        max_workers: Maximum number of threads. If it is ``None`` the default of :class:`ThreadPoolExecutor` is used.
+
+    Return:
+        Values returned by contexts, in the same order as the factories.
+    """
+    contexts = [factory() for factory in factories]
+    entering = _call_concurrently([context.__enter__ for context in contexts], max_workers=max_workers)
+    entered = [context for context, future in zip(contexts, entering, strict=True) if future.exception() is None]
+    try:
+        yield [future.result() for future in entering]
+    finally:
+        exiting = _call_concurrently(
+            [partial(context.__exit__, None, None, None) for context in entered], max_workers=max_workers
+        )
+        for future in exiting:
+            future.result()
+
+
 class NoArgs(Enum):
     """Class for values not provided in function calls."""
 
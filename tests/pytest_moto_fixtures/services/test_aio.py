@@ -0,0 +1,99 @@
+import asyncio
+from random import randint
+
+from pytest_moto_fixtures.services.aio import AsyncEventBridgeBus, AsyncS3Bucket, AsyncSNSTopic, AsyncSQSQueue
+from pytest_moto_fixtures.services.eventbridge import EventBridgeEvent
+from pytest_moto_fixtures.services.sqs import SQSQueueDepth
+from pytest_moto_fixtures.utils import randstr
+
+
+class TestAsyncSQSQueue:
+    def test_send_and_receive_message(self, async_sqs_queue: AsyncSQSQueue) -> None:
+        message = randstr()
+
+        async def run() -> None:
+            await async_sqs_queue.send_message(body=message)
+            assert await async_sqs_queue.depth() == SQSQueueDepth(visible=1, in_flight=0, delayed=0)
+            returned = await async_sqs_queue.receive_message()
+            assert returned is not None
+            assert returned['Body'] == message
+            assert await async_sqs_queue.receive_message() is None
+
+        asyncio.run(run())
+
+    def test_iter_with_concurrent_producers(self, async_sqs_queue: AsyncSQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(20, 50))]
+
+        async def run() -> list[str]:
+            await asyncio.gather(*(async_sqs_queue.send_message(body=message) for message in messages))
+            return [message['Body'] async for message in async_sqs_queue]
+
+        assert sorted(asyncio.run(run())) == sorted(messages)
+
+    def test_send_messages_and_wait_for(self, async_sqs_queue: AsyncSQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(3, 10))]
+
+        async def run() -> list[str]:
+            waiting = asyncio.create_task(async_sqs_queue.wait_for(len(messages), timeout=5))
+            await async_sqs_queue.send_messages(messages)
+            return [message['Body'] for message in await waiting]
+
+        assert sorted(asyncio.run(run())) == sorted(messages)
+
+
+class TestAsyncSNSTopic:
+    def test_publish_and_receive_message(self, async_sns_topic: AsyncSNSTopic) -> None:
+        messages = [randstr() for _ in range(randint(3, 10))]
+
+        async def run() -> list[str]:
+            for message in messages:
+                await async_sns_topic.publish_message(message=message)
+            first = await async_sns_topic.receive_message()
+            assert first is not None
+            return [first['Message']] + [message['Message'] async for message in async_sns_topic]
+
+        assert asyncio.run(run()) == messages
+
+
+class TestAsyncEventBridgeBus:
+    def test_put_and_receive_event(self, async_eventbridge_bus: AsyncEventBridgeBus) -> None:
+        details = [{randstr(): randstr()} for _ in range(randint(3, 10))]
+
+        async def run() -> list[object]:
+            for detail in details:
+                await async_eventbridge_bus.put_event(source=randstr(), detail_type=randstr(), detail=detail)
+            return [event['detail'] async for event in async_eventbridge_bus]
+
+        assert asyncio.run(run()) == details
+
+    def test_put_events(self, async_eventbridge_bus: AsyncEventBridgeBus) -> None:
+        details = [{randstr(): randstr()} for _ in range(randint(3, 10))]
+
+        async def run() -> list[object]:
+            returned = await async_eventbridge_bus.put_events(
+                EventBridgeEvent(source=randstr(), detail_type=randstr(), detail=detail) for detail in details
+            )
+            assert returned.failed_entry_count == 0
+            return [event['detail'] async for event in async_eventbridge_bus]
+
+        assert asyncio.run(run()) == details
+
+
+class TestAsyncS3Bucket:
+    def test_objects(self, async_s3_bucket: AsyncS3Bucket) -> None:
+        objects = {randstr(): randstr().encode() for _ in range(randint(3, 10))}
+
+        async def run() -> None:
+            await asyncio.gather(*(async_s3_bucket.put(key, value) for key, value in objects.items()))
+            assert await async_s3_bucket.size() == len(objects)
+            assert sorted([obj['Key'] async for obj in async_s3_bucket]) == sorted(objects)
+            key, value = next(iter(objects.items()))
+            obj, body = await async_s3_bucket.get(key)
+            assert body == value
+            assert obj['ContentLength'] == len(value)
+            await async_s3_bucket.delete(key)
+            assert await async_s3_bucket.size() == len(objects) - 1
+            await async_s3_bucket.prune()
+            assert await async_s3_bucket.size() == 0
+
+        asyncio.run(run())
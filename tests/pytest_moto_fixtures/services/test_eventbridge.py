@@ -1,11 +1,20 @@
 import json
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from random import randint
+from threading import Timer
 from typing import TYPE_CHECKING
-
-from pytest_moto_fixtures.services.eventbridge import EventBridgeBus, eventbridge_create_bus
+from unittest.mock import Mock
+
+from pytest_moto_fixtures.services.eventbridge import (
+    EventBridgeBatchFailure,
+    EventBridgeBus,
+    EventBridgeEvent,
+    eventbridge_create_bus,
+    eventbridge_create_buses,
+)
 from pytest_moto_fixtures.services.sqs import SQSQueue
-from pytest_moto_fixtures.utils import randstr
+from pytest_moto_fixtures.utils import randstr, skip_resource_removal
 
 if TYPE_CHECKING:
     from types_boto3_events import EventBridgeClient
@@ -25,6 +34,16 @@ class TestEventBridgeBus:
         assert sut.arn == arn
         assert sut.queue == sqs_queue
 
+    def test_create_queue_arg(self, eventbridge_client: 'EventBridgeClient', sqs_queue: SQSQueue) -> None:
+        create_queue = Mock(return_value=sqs_queue)
+
+        sut = EventBridgeBus(client=eventbridge_client, name=randstr(), arn=randstr(), create_queue=create_queue)
+
+        create_queue.assert_not_called()
+        assert sut.queue == sqs_queue
+        assert sut.queue == sqs_queue
+        create_queue.assert_called_once_with()
+
     def test_len(self, eventbridge_bus: EventBridgeBus) -> None:
         messages = [randstr() for _ in range(randint(3, 10))]
 
@@ -94,6 +113,85 @@ class TestEventBridgeBus:
             for event in (json.loads(event['Body']) for event in received)
         ] == times
 
+    def test_put_events(self, eventbridge_bus: EventBridgeBus) -> None:
+        times = [datetime.fromtimestamp(randint(946692000, 1577847600), tz=timezone.utc) for _ in range(3, 10)]
+        events = [
+            EventBridgeEvent(
+                source=randstr(),
+                detail_type=randstr(),
+                detail={randstr(): randstr()},
+                resources=[randstr() for _ in range(randint(1, 3))],
+                time=time,
+            )
+            for time in times
+        ]
+
+        returned = eventbridge_bus.put_events(events)
+
+        assert sorted(returned.successful) == list(range(len(events)))
+        assert returned.failed_entry_count == 0
+        received = [json.loads(event['Body']) for event in eventbridge_bus.queue]
+        assert [
+            (
+                event['source'],
+                event['detail-type'],
+                event['detail'],
+                event['resources'],
+                datetime.strptime(event['time'], '%Y-%m-%dT%H:%M:%S%z'),
+            )
+            for event in received
+        ] == [(event.source, event.detail_type, event.detail, event.resources, event.time) for event in events]
+
+    def test_put_events_in_batches(self, eventbridge_bus: EventBridgeBus) -> None:
+        batches: list[int] = []
+        eventbridge_bus.client.meta.events.register(
+            'provide-client-params.events.PutEvents', lambda params, **_: batches.append(len(params['Entries']))
+        )
+        consumed: list[int] = []
+
+        def events() -> Iterator[EventBridgeEvent]:
+            for i in range(25):
+                consumed.append(i)
+                value = randstr(length=100 * 1024) if i < 3 else randstr()  # noqa: PLR2004
+                yield EventBridgeEvent(source=randstr(), detail_type=randstr(), detail={'value': value})
+
+        returned = eventbridge_bus.put_events(events())
+
+        assert batches == [2, 10, 10, 3]
+        assert len(returned.successful) == 25  # noqa: PLR2004
+        assert len(consumed) == 25  # noqa: PLR2004
+        assert len(eventbridge_bus) == 25  # noqa: PLR2004
+
+    def test_put_events_with_too_large_event(self, eventbridge_bus: EventBridgeBus) -> None:
+        values = [randstr(), randstr(length=300 * 1024), randstr(), randstr()]
+
+        returned = eventbridge_bus.put_events(
+            EventBridgeEvent(source=randstr(), detail_type=randstr(), detail={'value': value}) for value in values
+        )
+
+        assert sorted(returned.successful) == [0, 2, 3]
+        assert returned.failed == [
+            EventBridgeBatchFailure(index=1, code='BatchRequestTooLong', message='Event larger than 262144 bytes')
+        ]
+        received = [json.loads(event['Body']) for event in eventbridge_bus.queue]
+        assert [event['detail']['value'] for event in received] == [values[0], values[2], values[3]]
+
+    def test_put_events_with_failure(self, sqs_queue: SQSQueue) -> None:
+        client = Mock()
+        client.put_events.return_value = {
+            'FailedEntryCount': 1,
+            'Entries': [{'EventId': 'id'}, {'ErrorCode': 'InternalFailure', 'ErrorMessage': 'error'}],
+        }
+        sut = EventBridgeBus(client=client, name=randstr(), arn=randstr(), queue=sqs_queue)
+
+        returned = sut.put_events(
+            iter([EventBridgeEvent(source=randstr(), detail_type=randstr(), detail={}) for _ in range(2)])
+        )
+
+        assert returned.successful == {0: 'id'}
+        assert returned.failed == [EventBridgeBatchFailure(index=1, code='InternalFailure', message='error')]
+        assert returned.failed_entry_count == 1
+
     def test_receive_event_without_event_in_bus(self, eventbridge_bus: EventBridgeBus) -> None:
         returned = eventbridge_bus.receive_event()
 
@@ -142,6 +240,27 @@ class TestEventBridgeBus:
         for event, returned in zip(events, eventbridge_bus, strict=True):
             assert returned['detail'] == event
 
+    def test_wait_for(self, eventbridge_bus: EventBridgeBus) -> None:
+        detail = {randstr(): randstr()}
+        kwargs = {'source': randstr(), 'detail_type': randstr(), 'detail': detail}
+        timer = Timer(0.5, eventbridge_bus.put_event, kwargs=kwargs)
+        timer.start()
+
+        returned = eventbridge_bus.wait_for(1, timeout=5)
+
+        timer.join()
+        assert [event['detail'] for event in returned] == [detail]
+
+    def test_wait_for_matching(self, eventbridge_bus: EventBridgeBus) -> None:
+        sources = [randstr() for _ in range(3)]
+        for source in sources:
+            eventbridge_bus.put_event(source=source, detail_type='test', detail={})
+
+        returned = eventbridge_bus.wait_for_matching(lambda event: event['source'] == sources[1], timeout=5)
+
+        assert returned['source'] == sources[1]
+        assert [event['source'] for event in eventbridge_bus] == [sources[0], sources[2]]
+
     def test_purge_bus_events(self, eventbridge_bus: EventBridgeBus) -> None:
         events = randint(3, 10)
         eventbridge_bus.client.put_events(
@@ -182,3 +301,74 @@ class TestEventBridgeCreateBus:
 
         with eventbridge_create_bus(eventbridge_client=eventbridge_client, sqs_client=sqs_client, tags=tags) as sut:
             assert eventbridge_client.list_tags_for_resource(ResourceARN=sut.arn)['Tags'] == tags
+
+    def test_lazy_arg(self, eventbridge_client: 'EventBridgeClient', sqs_client: 'SQSClient') -> None:
+        with eventbridge_create_bus(eventbridge_client=eventbridge_client, sqs_client=sqs_client, lazy=True) as sut:
+            assert sqs_client.list_queues().get('QueueUrls', []) == []
+            assert eventbridge_client.list_rules(EventBusName=sut.name)['Rules'] == []
+
+            detail = {randstr(): randstr()}
+            sut.put_event(source=randstr(), detail_type=randstr(), detail=detail)
+
+            assert sqs_client.list_queues()['QueueUrls'] == [sut.queue.url]
+            returned = sut.receive_event()
+            assert returned is not None
+            assert returned['detail'] == detail
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+    def test_patterns_arg(self, eventbridge_client: 'EventBridgeClient', sqs_client: 'SQSClient') -> None:
+        detail_types = [randstr() for _ in range(randint(2, 5))]
+        events = [
+            EventBridgeEvent(source=randstr(), detail_type=detail_types[i % len(detail_types)], detail={'index': i})
+            for i in range(randint(20, 50))
+        ]
+
+        with eventbridge_create_bus(
+            eventbridge_client=eventbridge_client,
+            sqs_client=sqs_client,
+            lazy=True,
+            patterns={detail_type: {'detail-type': [detail_type]} for detail_type in detail_types},
+        ) as sut:
+            assert list(sut.patterns) == detail_types
+            assert sorted(sqs_client.list_queues()['QueueUrls']) == sorted(
+                pattern.queue.url for pattern in sut.patterns.values()
+            )
+            rules = [rule['Name'] for rule in eventbridge_client.list_rules(EventBusName=sut.name)['Rules']]
+            assert sorted(rules) == sorted(f'pattern-{detail_type}' for detail_type in detail_types)
+
+            sut.patterns[detail_types[0]].put_events(events)
+
+            for detail_type, pattern in sut.patterns.items():
+                assert pattern.name == sut.name
+                assert [event['detail'] for event in pattern] == [
+                    event.detail for event in events if event.detail_type == detail_type
+                ]
+            assert len(sqs_client.list_queues()['QueueUrls']) == len(detail_types)
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+    def test_skip_resource_removal(self, eventbridge_client: 'EventBridgeClient', sqs_client: 'SQSClient') -> None:
+        with (
+            skip_resource_removal(),
+            eventbridge_create_bus(eventbridge_client=eventbridge_client, sqs_client=sqs_client) as sut,
+        ):
+            pass
+
+        assert sut.arn in [bus['Arn'] for bus in eventbridge_client.list_event_buses()['EventBuses']]
+        assert [rule['Name'] for rule in eventbridge_client.list_rules(EventBusName=sut.name)['Rules']] == ['all']
+
+
+class TestEventBridgeCreateBuses:
+    def test_default_args(self, eventbridge_client: 'EventBridgeClient', sqs_client: 'SQSClient') -> None:
+        count = randint(10, 30)
+
+        with eventbridge_create_buses(
+            eventbridge_client=eventbridge_client, sqs_client=sqs_client, count=count
+        ) as sut:
+            assert len(sut) == count
+            result = eventbridge_client.list_event_buses()
+            assert {bus.arn for bus in sut} <= {bus['Arn'] for bus in result['EventBuses']}
+            assert len(sqs_client.list_queues()['QueueUrls']) == count
+
+        result = eventbridge_client.list_event_buses()
+        assert not {bus.arn for bus in sut} & {bus['Arn'] for bus in result['EventBuses']}
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
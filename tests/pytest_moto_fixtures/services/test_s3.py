@@ -4,8 +4,8 @@ from typing import TYPE_CHECKING
 import pytest
 from botocore.errorfactory import ClientError
 
-from pytest_moto_fixtures.services.s3 import S3Bucket, s3_create_bucket
-from pytest_moto_fixtures.utils import randstr
+from pytest_moto_fixtures.services.s3 import S3Bucket, s3_create_bucket, s3_create_buckets
+from pytest_moto_fixtures.utils import randstr, skip_resource_removal
 
 if TYPE_CHECKING:
     from types_boto3_s3 import S3Client
@@ -95,3 +95,23 @@ class TestS3CreateBucket:
 
         with s3_create_bucket(s3_client=s3_client, name=name) as sut:
             assert sut.name == name
+
+    def test_skip_resource_removal(self, s3_client: 'S3Client') -> None:
+        with skip_resource_removal(), s3_create_bucket(s3_client=s3_client) as sut:
+            sut['key'] = b'value'
+
+        assert s3_client.list_objects_v2(Bucket=sut.name)['KeyCount'] == 1
+
+
+class TestS3CreateBuckets:
+    def test_default_args(self, s3_client: 'S3Client') -> None:
+        count = randint(10, 30)
+
+        with s3_create_buckets(s3_client=s3_client, count=count) as sut:
+            assert len(sut) == count
+            for bucket in sut:
+                bucket['key'] = b'value'
+            result = s3_client.list_buckets()
+            assert sorted(bucket['Name'] for bucket in result['Buckets']) == sorted(bucket.name for bucket in sut)
+
+        assert s3_client.list_buckets()['Buckets'] == []
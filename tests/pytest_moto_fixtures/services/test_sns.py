@@ -1,15 +1,31 @@
 import json
+from base64 import b64encode
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from random import randint
+from threading import Barrier, Timer
+from time import sleep
 from typing import TYPE_CHECKING
-from unittest.mock import ANY
-
-from pytest_moto_fixtures.services.sns import SNSTopic, sns_create_fifo_topic, sns_create_topic
+from unittest.mock import ANY, Mock
+
+from pytest_moto_fixtures.services.s3 import S3Bucket
+from pytest_moto_fixtures.services.sns import (
+    SNSBatchFailure,
+    SNSMessage,
+    SNSSubscriber,
+    SNSTopic,
+    sns_create_fanout_topic,
+    sns_create_fifo_topic,
+    sns_create_fifo_topics,
+    sns_create_topic,
+    sns_create_topics,
+)
 from pytest_moto_fixtures.services.sqs import SQSQueue
-from pytest_moto_fixtures.utils import randstr
+from pytest_moto_fixtures.utils import randstr, skip_resource_removal
 
 if TYPE_CHECKING:
     from types_boto3_sns import SNSClient
-    from types_boto3_sns.type_defs import TagTypeDef
+    from types_boto3_sns.type_defs import MessageAttributeValueTypeDef, TagTypeDef
     from types_boto3_sqs import SQSClient
 
 
@@ -25,6 +41,37 @@ class TestSNSTopic:
         assert sut.arn == arn
         assert sut.queue == sqs_queue
 
+    def test_create_queue_arg(self, sns_client: 'SNSClient', sqs_queue: SQSQueue) -> None:
+        create_queue = Mock(return_value=sqs_queue)
+
+        sut = SNSTopic(client=sns_client, name=randstr(), arn=randstr(), create_queue=create_queue)
+
+        create_queue.assert_not_called()
+        assert sut.queue == sqs_queue
+        assert sut.queue == sqs_queue
+        create_queue.assert_called_once_with()
+
+    def test_create_queue_arg_from_threads(self, sns_client: 'SNSClient', sqs_queue: SQSQueue) -> None:
+        threads = 8
+        barrier = Barrier(threads)
+
+        def slow_create_queue() -> SQSQueue:
+            sleep(0.1)
+            return sqs_queue
+
+        create_queue = Mock(side_effect=slow_create_queue)
+        sut = SNSTopic(client=sns_client, name=randstr(), arn=randstr(), create_queue=create_queue)
+
+        def get_queue() -> SQSQueue:
+            barrier.wait()
+            return sut.queue
+
+        with ThreadPoolExecutor(threads) as executor:
+            returned = list(executor.map(lambda _: get_queue(), range(threads)))
+
+        assert returned == [sqs_queue] * threads
+        create_queue.assert_called_once_with()
+
     def test_len(self, sns_topic: SNSTopic) -> None:
         messages = [randstr() for _ in range(randint(3, 10))]
 
@@ -56,6 +103,107 @@ class TestSNSTopic:
         received = list(sns_topic.queue)
         assert [json.loads(json.loads(message['Body'])['Message']) for message in received] == messages
 
+    def test_publish_messages(self, sns_topic: SNSTopic) -> None:
+        messages = [randstr() for _ in range(randint(3, 10))]
+        messages_dict = [{randstr(): randstr()} for _ in range(randint(3, 10))]
+
+        returned = sns_topic.publish_messages([*messages, *messages_dict])
+
+        assert sorted(returned.successful) == list(range(len(messages) + len(messages_dict)))
+        assert returned.failed == []
+        received = [message['Message'] for message in sns_topic]
+        assert received == [*messages, *(json.dumps(message) for message in messages_dict)]
+
+    def test_publish_messages_in_batches(self, sns_topic: SNSTopic) -> None:
+        batches: list[int] = []
+        sns_topic.client.meta.events.register(
+            'provide-client-params.sns.PublishBatch',
+            lambda params, **_: batches.append(len(params['PublishBatchRequestEntries'])),
+        )
+        consumed: list[int] = []
+
+        def messages() -> Iterator[str]:
+            for i in range(25):
+                consumed.append(i)
+                yield randstr(length=100 * 1024) if i < 3 else randstr()  # noqa: PLR2004
+
+        returned = sns_topic.publish_messages(messages())
+
+        assert batches == [2, 10, 10, 3]
+        assert len(returned.successful) == 25  # noqa: PLR2004
+        assert len(consumed) == 25  # noqa: PLR2004
+
+    def test_publish_messages_with_too_large_message(self, sns_topic: SNSTopic) -> None:
+        messages = [randstr(), randstr(length=256 * 1024 + 1), randstr()]
+
+        returned = sns_topic.publish_messages(messages)
+
+        assert sorted(returned.successful) == [0, 2]
+        assert returned.failed == [
+            SNSBatchFailure(
+                index=1, code='BatchRequestTooLong', message='Message larger than 262144 bytes', sender_fault=True
+            )
+        ]
+        assert [message['Message'] for message in sns_topic] == [messages[0], messages[2]]
+
+    def test_publish_messages_with_attributes(self, sns_topic: SNSTopic) -> None:
+        message = randstr()
+        attributes: dict[str, MessageAttributeValueTypeDef] = {
+            randstr(): {'DataType': 'String', 'StringValue': randstr()} for _ in range(randint(1, 3))
+        }
+
+        sns_topic.publish_messages([SNSMessage(message=message, attributes=attributes)])
+
+        returned = sns_topic.receive_message()
+        assert returned is not None
+        assert returned['Message'] == message
+        assert returned['MessageAttributes'] == {
+            name: {'Type': value['DataType'], 'Value': value['StringValue']} for name, value in attributes.items()
+        }
+
+    def test_publish_messages_with_failure(self, sqs_queue: SQSQueue) -> None:
+        client = Mock()
+        client.publish_batch.return_value = {
+            'Successful': [{'Id': '0', 'MessageId': 'id'}],
+            'Failed': [{'Id': '1', 'SenderFault': True, 'Code': 'InvalidParameter', 'Message': 'error'}],
+        }
+        sut = SNSTopic(client=client, name=randstr(), arn=randstr(), queue=sqs_queue)
+
+        returned = sut.publish_messages(iter(['first', 'second']))
+
+        assert returned.successful == {0: 'id'}
+        assert returned.failed == [
+            SNSBatchFailure(index=1, code='InvalidParameter', message='error', sender_fault=True)
+        ]
+
+    def test_captured(self, sns_topic: SNSTopic) -> None:
+        kinds = [randstr() for _ in range(3)]
+        published = [(randstr(), kinds[i % len(kinds)], f'subject-{i % 2}') for i in range(randint(20, 50))]
+        for message, kind, subject in published:
+            sns_topic.client.publish(
+                TopicArn=sns_topic.arn,
+                Message=message,
+                Subject=subject,
+                MessageAttributes={'kind': {'DataType': 'String', 'StringValue': kind}},
+            )
+
+        for kind in kinds:
+            assert [message['Message'] for message in sns_topic.captured.where(attributes={'kind': kind})] == [
+                message for message, message_kind, _ in published if message_kind == kind
+            ]
+            assert sns_topic.captured.count(attributes={'kind': kind}, subject='subject-0') == len(
+                [1 for _, message_kind, subject in published if message_kind == kind and subject == 'subject-0']
+            )
+        assert sns_topic.captured.count(subject='subject-1') == len(published) // 2
+        assert sns_topic.captured.count(attributes={'kind': randstr()}) == 0
+        assert len(sns_topic.captured) == len(published)
+        assert len(sns_topic.queue) == 0
+
+        sns_topic.publish_message(message=randstr())
+
+        assert len(sns_topic.captured) == len(published) + 1
+        assert sns_topic.captured.count() == len(published) + 1
+
     def test_publish_message_with_attributes(self, sns_topic: SNSTopic) -> None:
         messages = [
             {
@@ -106,6 +254,35 @@ class TestSNSTopic:
 
         assert returned is None
 
+    def test_receive_message_with_raw_message_delivery(self, sns_client: 'SNSClient', sqs_queue: SQSQueue) -> None:
+        message = randstr()
+        text = randstr()
+        binary = randstr().encode()
+        arn = randstr()
+        sut = SNSTopic(client=sns_client, name=randstr(), arn=arn, queue=sqs_queue, raw_message_delivery=True)
+        # moto fails to deliver binary attributes with raw message delivery, so the queue receives the message directly
+        sqs_queue.client.send_message(
+            QueueUrl=sqs_queue.url,
+            MessageBody=message,
+            MessageAttributes={
+                'text': {'DataType': 'String', 'StringValue': text},
+                'binary': {'DataType': 'Binary', 'BinaryValue': binary},
+            },
+        )
+
+        returned = sut.receive_message()
+
+        assert returned == {
+            'Type': 'Notification',
+            'MessageId': ANY,
+            'TopicArn': arn,
+            'Message': message,
+            'MessageAttributes': {
+                'text': {'Type': 'String', 'Value': text},
+                'binary': {'Type': 'Binary', 'Value': b64encode(binary).decode()},
+            },
+        }
+
     def test_iter_over_messages_in_topic(self, sns_topic: SNSTopic) -> None:
         messages = [randstr() for _ in range(randint(3, 10))]
 
@@ -115,6 +292,26 @@ class TestSNSTopic:
         for message, returned in zip(messages, sns_topic, strict=True):
             assert returned['Message'] == message
 
+    def test_wait_for(self, sns_topic: SNSTopic) -> None:
+        message = randstr()
+        timer = Timer(0.5, sns_topic.publish_message, kwargs={'message': message})
+        timer.start()
+
+        returned = sns_topic.wait_for(1, timeout=5)
+
+        timer.join()
+        assert [message['Message'] for message in returned] == [message]
+
+    def test_wait_for_matching(self, sns_topic: SNSTopic) -> None:
+        messages = [randstr() for _ in range(3)]
+        for message in messages:
+            sns_topic.publish_message(message=message)
+
+        returned = sns_topic.wait_for_matching(lambda message: message['Message'] == messages[1], timeout=5)
+
+        assert returned['Message'] == messages[1]
+        assert [message['Message'] for message in sns_topic] == [messages[0], messages[2]]
+
     def test_purge_topic_messages(self, sns_topic: SNSTopic) -> None:
         for _ in range(randint(3, 10)):
             sns_topic.client.publish(TargetArn=sns_topic.arn, Message=randstr())
@@ -148,6 +345,27 @@ class TestSNSFifoTopic:
         received = list(sns_fifo_topic.queue)
         assert [json.loads(message['Body'])['Message'] for message in received] == messages
 
+    def test_publish_messages(self, sns_fifo_topic: SNSTopic) -> None:
+        messages = [randstr() for _ in range(randint(3, 15))]
+
+        sns_fifo_topic.publish_messages(
+            SNSMessage(message=message, deduplication_id=message, group_id='group') for message in messages
+        )
+
+        assert [message['Message'] for message in sns_fifo_topic] == messages
+
+    def test_captured(self, sns_fifo_topic: SNSTopic) -> None:
+        groups = {randstr(): [randstr() for _ in range(randint(3, 10))] for _ in range(randint(2, 5))}
+        sns_fifo_topic.publish_messages(
+            SNSMessage(message=message, deduplication_id=message, group_id=group)
+            for group, messages in groups.items()
+            for message in messages
+        )
+
+        for group, messages in groups.items():
+            assert [message['Message'] for message in sns_fifo_topic.captured.where(group_id=group)] == messages
+            assert sns_fifo_topic.captured.count(group_id=group) == len(messages)
+
     def test_receive_message_without_message_in_topic(self, sns_fifo_topic: SNSTopic) -> None:
         returned = sns_fifo_topic.receive_message()
 
@@ -237,6 +455,86 @@ class TestSnsCreateTopic:
 
             assert returned == tags
 
+    def test_lazy_arg(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        with sns_create_topic(sns_client=sns_client, sqs_client=sqs_client, lazy=True) as sut:
+            assert sqs_client.list_queues().get('QueueUrls', []) == []
+            assert sns_client.list_subscriptions()['Subscriptions'] == []
+
+            message = randstr()
+            sut.publish_message(message=message)
+
+            assert sqs_client.list_queues()['QueueUrls'] == [sut.queue.url]
+            returned = sut.receive_message()
+            assert returned is not None
+            assert returned['Message'] == message
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+        assert sns_client.list_subscriptions()['Subscriptions'] == []
+
+    def test_lazy_arg_from_threads(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        threads = 8
+        barrier = Barrier(threads)
+
+        with sns_create_topic(sns_client=sns_client, sqs_client=sqs_client, lazy=True) as sut:
+
+            def publish(message: str) -> None:
+                barrier.wait()
+                sut.publish_message(message=message)
+
+            with ThreadPoolExecutor(threads) as executor:
+                list(executor.map(publish, [randstr() for _ in range(threads)]))
+
+            assert sqs_client.list_queues()['QueueUrls'] == [sut.queue.url]
+            assert len(sns_client.list_subscriptions()['Subscriptions']) == 1
+            assert len(sut.wait_for(threads)) == threads
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+        assert sns_client.list_subscriptions()['Subscriptions'] == []
+
+    def test_skip_resource_removal(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        with skip_resource_removal(), sns_create_topic(sns_client=sns_client, sqs_client=sqs_client) as sut:
+            pass
+
+        assert sut.arn in [topic['TopicArn'] for topic in sns_client.list_topics()['Topics']]
+        assert sut.queue.url in sqs_client.list_queues()['QueueUrls']
+
+    def test_payload_bucket_arg(self, sns_client: 'SNSClient', sqs_client: 'SQSClient', s3_bucket: S3Bucket) -> None:
+        small = randstr()
+        large = randstr(length=300 * 1024)
+        attributes: dict[str, MessageAttributeValueTypeDef] = {'key': {'DataType': 'String', 'StringValue': randstr()}}
+
+        with sns_create_topic(sns_client=sns_client, sqs_client=sqs_client, payload_bucket=s3_bucket) as sut:
+            sut.publish_message(message=small)
+            sut.publish_message(message=large, attributes=attributes)
+            assert len(s3_bucket) == 1
+
+            returned = list(sut)
+
+            assert [message['Message'] for message in returned] == [small, large]
+            assert returned[1]['MessageAttributes'] == {
+                'key': {'Type': 'String', 'Value': attributes['key']['StringValue']},
+                'ExtendedPayloadSize': {'Type': 'Number', 'Value': str(len(large))},
+            }
+
+    def test_raw_message_delivery_arg(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        message = randstr()
+        text = randstr()
+        attributes: dict[str, MessageAttributeValueTypeDef] = {'text': {'DataType': 'String', 'StringValue': text}}
+
+        with sns_create_topic(sns_client=sns_client, sqs_client=sqs_client, raw_message_delivery=True) as sut:
+            sut.publish_message(message=message, attributes=attributes)
+            sut.publish_message(message=message)
+
+            first = sut.receive_message()
+            second = sut.receive_message()
+
+        assert first == {
+            'Type': 'Notification',
+            'MessageId': ANY,
+            'TopicArn': sut.arn,
+            'Message': message,
+            'MessageAttributes': {'text': {'Type': 'String', 'Value': text}},
+        }
+        assert second == {'Type': 'Notification', 'MessageId': ANY, 'TopicArn': sut.arn, 'Message': message}
+
 
 class TestSnsCreateFifoTopic:
     def test_default_args(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
@@ -281,3 +579,79 @@ class TestSnsCreateFifoTopic:
             for name, value in attributes.items():
                 assert returned[name] == value
             assert returned['FifoTopic'] == 'true'
+
+
+class TestSnsCreateTopics:
+    def test_default_args(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        count = randint(10, 30)
+
+        with sns_create_topics(sns_client=sns_client, sqs_client=sqs_client, count=count) as sut:
+            assert len(sut) == count
+            topics = sns_client.list_topics()['Topics']
+            assert sorted(topic['TopicArn'] for topic in topics) == sorted(topic.arn for topic in sut)
+            assert len(sqs_client.list_queues()['QueueUrls']) == count
+
+        assert sns_client.list_topics()['Topics'] == []
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+    def test_fifo(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        count = randint(3, 10)
+
+        with sns_create_fifo_topics(sns_client=sns_client, sqs_client=sqs_client, count=count, lazy=True) as sut:
+            assert len(sut) == count
+            assert all(topic.name.endswith('.fifo') for topic in sut)
+            assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+        assert sns_client.list_topics()['Topics'] == []
+
+
+class TestSnsCreateFanoutTopic:
+    def test_subscribers(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        subscribers = [
+            SNSSubscriber(filter_policy={'kind': ['first']}),
+            SNSSubscriber(filter_policy={'kind': ['second']}, filter_policy_scope='MessageAttributes'),
+            SNSSubscriber(),
+        ]
+
+        with sns_create_fanout_topic(sns_client=sns_client, sqs_client=sqs_client, subscribers=subscribers) as sut:
+            assert len(sut.subscribers) == len(subscribers)
+            assert all(subscriber.arn == sut.arn for subscriber in sut.subscribers)
+            assert len(sns_client.list_subscriptions_by_topic(TopicArn=sut.arn)['Subscriptions']) == len(subscribers)
+
+            for kind in ('first', 'second'):
+                sut.publish_message(message=kind, attributes={'kind': {'DataType': 'String', 'StringValue': kind}})
+
+            assert [message['Message'] for message in sut.subscribers[0]] == ['first']
+            assert [message['Message'] for message in sut.subscribers[1]] == ['second']
+            assert [message['Message'] for message in sut.subscribers[2]] == ['first', 'second']
+            assert [message['Message'] for message in sut] == ['first', 'second']
+
+        assert sns_client.list_subscriptions()['Subscriptions'] == []
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+    def test_many_subscribers(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        count = randint(20, 50)
+        message = randstr()
+
+        with sns_create_fanout_topic(
+            sns_client=sns_client, sqs_client=sqs_client, subscribers=[SNSSubscriber()] * count, max_workers=8
+        ) as sut:
+            assert len({subscriber.queue.url for subscriber in sut.subscribers}) == count
+            queues = sqs_client.list_queues()['QueueUrls']
+            assert sorted(queues) == sorted(subscriber.queue.url for subscriber in sut.subscribers)
+
+            sut.client.publish(TopicArn=sut.arn, Message=message)
+
+            assert all(subscriber.wait_for(1)[0]['Message'] == message for subscriber in sut.subscribers)
+
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+    def test_fifo(self, sns_client: 'SNSClient', sqs_client: 'SQSClient') -> None:
+        with sns_create_fanout_topic(
+            sns_client=sns_client,
+            sqs_client=sqs_client,
+            subscribers=[SNSSubscriber(), SNSSubscriber()],
+            attributes={'FifoTopic': 'true'},
+        ) as sut:
+            assert sut.name.endswith('.fifo')
+            assert all(subscriber.queue.name.endswith('.fifo') for subscriber in sut.subscribers)
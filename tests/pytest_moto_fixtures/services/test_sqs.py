@@ -1,13 +1,30 @@
 import json
+from collections.abc import Iterator
 from random import randint
+from threading import Timer
 from typing import TYPE_CHECKING
-
-from pytest_moto_fixtures.services.sqs import SQSQueue, sqs_create_fifo_queue, sqs_create_queue
-from pytest_moto_fixtures.utils import randstr
+from unittest.mock import Mock
+
+import pytest
+
+from pytest_moto_fixtures.services.s3 import S3Bucket
+from pytest_moto_fixtures.services.sqs import (
+    SQSBatchFailure,
+    SQSMessage,
+    SQSQueue,
+    SQSQueueDepth,
+    SQSQueuePool,
+    sqs_create_fifo_queue,
+    sqs_create_fifo_queues,
+    sqs_create_queue,
+    sqs_create_queues,
+)
+from pytest_moto_fixtures.utils import randstr, skip_resource_removal
 
 if TYPE_CHECKING:
     from types_boto3_sqs import SQSClient
     from types_boto3_sqs.literals import QueueAttributeNameType
+    from types_boto3_sqs.type_defs import MessageTypeDef
 
 
 class TestSQSQueue:
@@ -58,6 +75,32 @@ class TestSQSQueue:
 
             assert len(sqs_queue) == len(messages)
 
+    @pytest.mark.parametrize('from_backend', [False, True])
+    def test_depth(self, sqs_queue: SQSQueue, from_backend: bool) -> None:  # noqa: FBT001
+        sqs_queue.send_messages([*(randstr() for _ in range(5)), SQSMessage(body=randstr(), delay_seconds=10)])
+        sqs_queue.client.receive_message(QueueUrl=sqs_queue.url, MaxNumberOfMessages=2, VisibilityTimeout=10)
+        next(sqs_queue)
+
+        returned = sqs_queue.depth(from_backend=from_backend)
+
+        assert returned == SQSQueueDepth(visible=2, in_flight=2, delayed=1)
+        assert returned.total == len(sqs_queue)
+
+    def test_depth_from_backend_without_mock(self) -> None:
+        client = Mock()
+        client.get_queue_attributes.return_value = {
+            'Attributes': {
+                'ApproximateNumberOfMessages': '1',
+                'ApproximateNumberOfMessagesDelayed': '2',
+                'ApproximateNumberOfMessagesNotVisible': '3',
+            }
+        }
+        sut = SQSQueue(client=client, name=randstr(), arn=f'arn:aws:sqs:us-east-1:123456789012:{randstr()}', url='url')
+
+        returned = sut.depth(from_backend=True)
+
+        assert returned == SQSQueueDepth(visible=1, in_flight=3, delayed=2)
+
     def test_send_message_with_str(self, sqs_queue: SQSQueue) -> None:
         messages = [randstr() for _ in range(randint(3, 10))]
 
@@ -95,6 +138,74 @@ class TestSQSQueue:
         ][0]
         assert received['Body'] == message
 
+    def test_send_messages(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(3, 10))]
+        messages_dict = [{randstr(): randstr()} for _ in range(randint(3, 10))]
+
+        returned = sqs_queue.send_messages([*messages, *messages_dict])
+
+        assert sorted(returned.successful) == list(range(len(messages) + len(messages_dict)))
+        assert returned.failed == []
+        received = [message['Body'] for message in sqs_queue]
+        assert received == [*messages, *(json.dumps(message) for message in messages_dict)]
+
+    def test_send_messages_in_batches(self, sqs_queue: SQSQueue) -> None:
+        batches: list[int] = []
+        sqs_queue.client.meta.events.register(
+            'provide-client-params.sqs.SendMessageBatch', lambda params, **_: batches.append(len(params['Entries']))
+        )
+        consumed: list[int] = []
+
+        def messages() -> Iterator[str]:
+            for i in range(25):
+                consumed.append(i)
+                yield randstr(length=100 * 1024) if i < 3 else randstr()  # noqa: PLR2004
+
+        returned = sqs_queue.send_messages(messages())
+
+        assert batches == [2, 10, 10, 3]
+        assert len(returned.successful) == 25  # noqa: PLR2004
+        assert len(consumed) == 25  # noqa: PLR2004
+
+    def test_send_messages_with_too_large_message(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr(), randstr(length=256 * 1024 + 1), randstr()]
+
+        returned = sqs_queue.send_messages(messages)
+
+        assert sorted(returned.successful) == [0, 2]
+        assert returned.failed == [
+            SQSBatchFailure(
+                index=1, code='BatchRequestTooLong', message='Message larger than 262144 bytes', sender_fault=True
+            )
+        ]
+        assert [message['Body'] for message in sqs_queue] == [messages[0], messages[2]]
+
+    def test_send_messages_with_args(self, sqs_queue: SQSQueue) -> None:
+        message = randstr()
+
+        sqs_queue.send_messages([SQSMessage(body=message, delay_seconds=1)])
+
+        assert sqs_queue.receive_message() is None
+        received = sqs_queue.client.receive_message(QueueUrl=sqs_queue.url, MaxNumberOfMessages=1, WaitTimeSeconds=2)[
+            'Messages'
+        ][0]
+        assert received['Body'] == message
+
+    def test_send_messages_with_failure(self) -> None:
+        client = Mock()
+        client.send_message_batch.return_value = {
+            'Successful': [{'Id': '0', 'MessageId': 'id'}],
+            'Failed': [{'Id': '1', 'SenderFault': True, 'Code': 'InvalidParameterValue', 'Message': 'error'}],
+        }
+        sut = SQSQueue(client=client, name=randstr(), arn=randstr(), url=randstr())
+
+        returned = sut.send_messages(iter(['first', 'second']))
+
+        assert returned.successful == {0: 'id'}
+        assert returned.failed == [
+            SQSBatchFailure(index=1, code='InvalidParameterValue', message='error', sender_fault=True)
+        ]
+
     def test_receive_message_without_message_in_queue(self, sqs_queue: SQSQueue) -> None:
         returned = sqs_queue.receive_message()
 
@@ -125,6 +236,92 @@ class TestSQSQueue:
         for message, returned in zip(messages, sqs_queue, strict=True):
             assert returned['Body'] == message
 
+    def test_receive_messages(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(25)]
+        sqs_queue.send_messages(messages)
+
+        returned = sqs_queue.receive_messages(max_messages=15)
+
+        assert [message['Body'] for message in returned] == messages[:15]
+        returned = sqs_queue.receive_messages(max_messages=15)
+        assert [message['Body'] for message in returned] == messages[15:]
+        assert sqs_queue.receive_messages() == []
+
+    def test_iter_in_batches(self, sqs_queue: SQSQueue) -> None:
+        calls: list[str] = []
+        sqs_queue.client.meta.events.register('before-call.sqs', lambda model, **_: calls.append(model.name))
+        messages = [randstr() for _ in range(25)]
+        sqs_queue.send_messages(messages)
+        calls.clear()
+
+        returned = [message['Body'] for message in sqs_queue]
+
+        assert returned == messages
+        assert calls == ['ReceiveMessage', 'DeleteMessageBatch'] * 3 + ['ReceiveMessage']
+
+    def test_iter_keep_received_messages(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(5)]
+        sqs_queue.send_messages(messages)
+
+        first = next(sqs_queue)
+
+        assert first['Body'] == messages[0]
+        assert len(sqs_queue) == len(messages) - 1
+        returned = sqs_queue.receive_message()
+        assert returned is not None
+        assert returned['Body'] == messages[1]
+        assert [message['Body'] for message in sqs_queue.receive_messages()] == messages[2:]
+
+    def test_wait_for(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(3)]
+        sqs_queue.send_message(body=messages[0])
+        timer = Timer(0.5, sqs_queue.send_messages, [messages[1:]])
+        timer.start()
+
+        returned = sqs_queue.wait_for(3, timeout=5)
+
+        timer.join()
+        assert sorted(message['Body'] for message in returned) == sorted(messages)
+
+    def test_wait_for_timeout(self, sqs_queue: SQSQueue) -> None:
+        message = randstr()
+        sqs_queue.send_message(body=message)
+
+        with pytest.raises(TimeoutError, match='Received 1 of 2 messages'):
+            sqs_queue.wait_for(2, timeout=0.1)
+
+        assert [message['Body'] for message in sqs_queue] == [message]
+
+    def test_wait_for_matching(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(3)]
+        sqs_queue.send_messages(messages[:2])
+        timer = Timer(0.5, sqs_queue.send_message, kwargs={'body': messages[2]})
+        timer.start()
+
+        returned = sqs_queue.wait_for_matching(lambda message: message['Body'] == messages[2], timeout=5)
+
+        timer.join()
+        assert returned['Body'] == messages[2]
+        assert [message['Body'] for message in sqs_queue] == messages[:2]
+
+    def test_wait_for_matching_timeout(self, sqs_queue: SQSQueue) -> None:
+        message = randstr()
+        sqs_queue.send_message(body=message)
+
+        with pytest.raises(TimeoutError, match='No message matching'):
+            sqs_queue.wait_for_matching(lambda _: False, timeout=0.1)
+
+        assert [message['Body'] for message in sqs_queue] == [message]
+
+    def test_wait_for_matching_without_timeout(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(3)]
+        sqs_queue.send_messages(messages)
+
+        returned = sqs_queue.wait_for_matching(lambda message: message['Body'] == messages[1], timeout=0)
+
+        assert returned['Body'] == messages[1]
+        assert [message['Body'] for message in sqs_queue] == [messages[0], messages[2]]
+
     def test_purge_queue(self, sqs_queue: SQSQueue) -> None:
         for _ in range(randint(3, 10)):
             sqs_queue.client.send_message(QueueUrl=sqs_queue.url, MessageBody=randstr())
@@ -134,6 +331,32 @@ class TestSQSQueue:
 
         assert len(sqs_queue) == 0
 
+    def test_consume(self, sqs_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(10, 30))]
+        sqs_queue.send_messages(messages)
+        handled: list[str] = []
+
+        result = sqs_queue.consume(lambda message: handled.append(message['Body']), workers=2)
+
+        assert sorted(handled) == sorted(messages)
+        assert list(result.groups) == ['']
+        assert result.ordered is None
+        assert result.count == len(messages)
+        assert len(sqs_queue) == 0
+
+    def test_consume_with_invalid_workers(self, sqs_queue: SQSQueue) -> None:
+        with pytest.raises(ValueError, match='workers must be positive, got 0'):
+            sqs_queue.consume(Mock(), workers=0)
+
+    def test_consume_without_message_in_queue(self, sqs_queue: SQSQueue) -> None:
+        handler = Mock()
+
+        result = sqs_queue.consume(handler)
+
+        handler.assert_not_called()
+        assert result.groups == {}
+        assert result.count == 0
+
 
 class TestSQSFifoQueue:
     def test_len(self, sqs_fifo_queue: SQSQueue) -> None:
@@ -166,6 +389,72 @@ class TestSQSFifoQueue:
         ]
         assert [message['Body'] for message in received] == messages
 
+    def test_send_messages(self, sqs_fifo_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(3, 15))]
+
+        sqs_fifo_queue.send_messages(
+            SQSMessage(body=message, deduplication_id=message, group_id='group') for message in messages
+        )
+
+        assert [message['Body'] for message in sqs_fifo_queue] == messages
+
+    def test_consume(self, sqs_fifo_queue: SQSQueue) -> None:
+        groups = {randstr(): [randstr() for _ in range(randint(3, 10))] for _ in range(randint(3, 6))}
+        sqs_fifo_queue.send_messages(
+            SQSMessage(body=message, deduplication_id=message, group_id=group)
+            for group, messages in groups.items()
+            for message in messages
+        )
+        sent = {message: i for messages in groups.values() for i, message in enumerate(messages)}
+        handled: dict[str, list[str]] = {group: [] for group in groups}
+
+        result = sqs_fifo_queue.consume(
+            lambda message: handled[message['Attributes']['MessageGroupId']].append(message['Body']),
+            workers=3,
+            sequence=lambda message: sent[message['Body']],
+        )
+
+        assert handled == groups
+        assert result.ordered is True
+        assert all(stats.ordered is True for stats in result.groups.values())
+        assert result.count == sum(len(messages) for messages in groups.values())
+        assert {group: stats.count for group, stats in result.groups.items()} == {
+            group: len(messages) for group, messages in groups.items()
+        }
+        assert all(stats.max_latency >= stats.mean_latency > 0 for stats in result.groups.values())
+        assert result.throughput > 0
+        assert len(sqs_fifo_queue) == 0
+
+    def test_consume_out_of_order(self, sqs_fifo_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(3, 10))]
+        sqs_fifo_queue.send_messages(
+            SQSMessage(body=message, deduplication_id=message, group_id='group') for message in messages
+        )
+        sent = {message: i for i, message in enumerate(reversed(messages))}
+
+        result = sqs_fifo_queue.consume(Mock(), sequence=lambda message: sent[message['Body']])
+
+        assert result.groups['group'].ordered is False
+        assert result.ordered is False
+
+    def test_consume_with_handler_error(self, sqs_fifo_queue: SQSQueue) -> None:
+        messages = [randstr() for _ in range(randint(3, 10))]
+        sqs_fifo_queue.send_messages(
+            SQSMessage(body=message, deduplication_id=message, group_id='group') for message in messages
+        )
+        handled: list[str] = []
+
+        def handler(message: 'MessageTypeDef') -> None:
+            if message['Body'] == messages[0]:
+                raise ValueError(message['Body'])
+            handled.append(message['Body'])
+
+        with pytest.raises(ValueError, match=messages[0]):
+            sqs_fifo_queue.consume(handler)
+
+        assert handled == messages[1:]
+        assert len(sqs_fifo_queue) == 0
+
     def test_receive_message_without_message_in_queue(self, sqs_fifo_queue: SQSQueue) -> None:
         returned = sqs_fifo_queue.receive_message()
 
@@ -260,6 +549,79 @@ class TestSqsCreateQueue:
 
             assert returned == tags
 
+    def test_arn_without_lookup(self, sqs_client: 'SQSClient') -> None:
+        calls: list[str] = []
+        sqs_client.meta.events.register('before-call.sqs', lambda model, **_: calls.append(model.name))
+
+        with sqs_create_queue(sqs_client=sqs_client) as sut:
+            assert calls == ['CreateQueue']
+            returned = sqs_client.get_queue_attributes(QueueUrl=sut.url, AttributeNames=['QueueArn'])['Attributes']
+            assert sut.arn == returned['QueueArn']
+
+    def test_lookup_arn_arg(self, sqs_client: 'SQSClient') -> None:
+        calls: list[str] = []
+        sqs_client.meta.events.register('before-call.sqs', lambda model, **_: calls.append(model.name))
+
+        with sqs_create_queue(sqs_client=sqs_client, lookup_arn=True) as sut:
+            assert calls == ['CreateQueue', 'GetQueueAttributes']
+            assert sut.arn.endswith(f':{sut.name}')
+
+    def test_arn_with_url_without_account(self) -> None:
+        name = randstr()
+        client = Mock()
+        client.create_queue.return_value = {'QueueUrl': f'http://localhost/{name}'}
+        client.get_queue_attributes.return_value = {'Attributes': {'QueueArn': 'arn'}}
+
+        with sqs_create_queue(sqs_client=client, name=name) as sut:
+            assert sut.arn == 'arn'
+
+    def test_skip_resource_removal(self, sqs_client: 'SQSClient') -> None:
+        with skip_resource_removal(), sqs_create_queue(sqs_client=sqs_client) as sut:
+            pass
+
+        assert sut.url in sqs_client.list_queues()['QueueUrls']
+
+    def test_payload_bucket_arg(self, sqs_client: 'SQSClient', s3_bucket: S3Bucket) -> None:
+        small = randstr()
+        large = randstr(length=300 * 1024)
+
+        with sqs_create_queue(sqs_client=sqs_client, payload_bucket=s3_bucket) as sut:
+            sut.send_message(body=small)
+            sut.send_message(body=large)
+            assert len(s3_bucket) == 1
+
+            received = sqs_client.receive_message(QueueUrl=sut.url, MaxNumberOfMessages=2)['Messages']
+            sqs_client.change_message_visibility_batch(
+                QueueUrl=sut.url,
+                Entries=[
+                    {'Id': str(i), 'ReceiptHandle': message['ReceiptHandle'], 'VisibilityTimeout': 0}
+                    for i, message in enumerate(received)
+                ],
+            )
+            pointer = json.loads(next(message['Body'] for message in received if message['Body'] != small))
+            assert pointer == [
+                'software.amazon.payloadoffloading.PayloadS3Pointer',
+                {'s3BucketName': s3_bucket.name, 's3Key': next(iter(s3_bucket))['Key']},
+            ]
+
+            assert sorted(message['Body'] for message in sut) == sorted([small, large])
+
+    def test_payload_bucket_arg_with_batch(self, sqs_client: 'SQSClient', s3_bucket: S3Bucket) -> None:
+        messages = [randstr(length=100 * 1024) for _ in range(randint(3, 5))]
+
+        with sqs_create_queue(sqs_client=sqs_client, payload_bucket=s3_bucket) as sut:
+            result = sut.send_messages(messages)
+
+            assert result.failed == []
+            assert len(s3_bucket) == 0
+            assert sorted(message['Body'] for message in sut) == sorted(messages)
+
+        with sqs_create_queue(sqs_client=sqs_client, payload_bucket=s3_bucket) as sut:
+            result = sut.send_messages([randstr(length=300 * 1024) for _ in range(len(messages))])
+
+            assert result.failed == []
+            assert len(s3_bucket) == len(messages)
+
 
 class TestSqsCreateFifoQueue:
     def test_default_args(self, sqs_client: 'SQSClient') -> None:
@@ -304,3 +666,78 @@ class TestSqsCreateFifoQueue:
             for name, value in attributes.items():
                 assert returned[name] == value
             assert returned['FifoQueue'] == 'true'
+
+
+class TestSqsCreateQueues:
+    def test_default_args(self, sqs_client: 'SQSClient') -> None:
+        count = randint(10, 30)
+
+        with sqs_create_queues(sqs_client=sqs_client, count=count) as sut:
+            assert len(sut) == count
+            assert all(not queue.name.endswith('.fifo') for queue in sut)
+            assert sorted(sqs_client.list_queues()['QueueUrls']) == sorted(queue.url for queue in sut)
+
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+    def test_fifo(self, sqs_client: 'SQSClient') -> None:
+        count = randint(3, 10)
+
+        with sqs_create_fifo_queues(sqs_client=sqs_client, count=count, max_workers=2) as sut:
+            assert len(sut) == count
+            assert all(queue.name.endswith('.fifo') for queue in sut)
+
+        assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+
+class TestSQSQueuePool:
+    def test_lease_create_queue(self, sqs_client: 'SQSClient') -> None:
+        sut = SQSQueuePool()
+
+        with sut.lease(sqs_client=sqs_client) as queue:
+            assert queue.url in sqs_client.list_queues()['QueueUrls']
+            assert not queue.name.endswith('.fifo')
+
+        assert [queue.url for queue in sut] == [queue.url]
+
+    def test_lease_reuse_queue(self, sqs_client: 'SQSClient') -> None:
+        sut = SQSQueuePool()
+
+        with sut.lease(sqs_client=sqs_client) as first:
+            first.send_message(body=randstr())
+        with sut.lease(sqs_client=sqs_client) as second:
+            assert second.url == first.url
+            assert len(second) == 0
+
+        assert len(sut) == 1
+
+    def test_lease_concurrent(self, sqs_client: 'SQSClient') -> None:
+        sut = SQSQueuePool()
+
+        with sut.lease(sqs_client=sqs_client) as first, sut.lease(sqs_client=sqs_client) as second:
+            assert first.url != second.url
+
+        assert [queue.url for queue in sut] == [first.url, second.url]
+
+    def test_lease_by_settings(self, sqs_client: 'SQSClient') -> None:
+        tags = {randstr(): randstr()}
+        sut = SQSQueuePool()
+
+        with sut.lease(sqs_client=sqs_client) as first:
+            pass
+        with sut.lease(sqs_client=sqs_client, tags=tags) as second:
+            assert second.url != first.url
+            assert sqs_client.list_queue_tags(QueueUrl=second.url)['Tags'] == tags
+        with sut.lease(sqs_client=sqs_client, attributes={'FifoQueue': 'true'}) as third:
+            assert third.name.endswith('.fifo')
+
+        assert [queue.url for queue in sut] == [first.url, second.url, third.url]
+
+    def test_close(self, sqs_client: 'SQSClient') -> None:
+        sut = SQSQueuePool()
+        with sut.lease(sqs_client=sqs_client) as queue:
+            pass
+
+        sut.close()
+
+        assert queue.url not in sqs_client.list_queues().get('QueueUrls', [])
+        assert len(sut) == 0
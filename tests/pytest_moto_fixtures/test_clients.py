@@ -0,0 +1,59 @@
+import pytest
+from botocore.config import Config
+
+from pytest_moto_fixtures.clients import ClientCache
+
+
+@pytest.mark.usefixtures('aws_config')
+class TestClientCache:
+    def test_session(self) -> None:
+        sut = ClientCache()
+
+        assert sut.session is sut.session
+
+    def test_client(self) -> None:
+        sut = ClientCache()
+
+        returned = sut.client('sqs')
+
+        assert returned is sut.client('sqs')
+        assert returned.meta.region_name == 'us-east-1'
+        returned.list_queues()  # type: ignore[attr-defined]
+
+    def test_client_by_service(self) -> None:
+        sut = ClientCache()
+
+        sqs_client = sut.client('sqs')
+        sns_client = sut.client('sns')
+
+        assert sqs_client is not sns_client
+        assert sqs_client.meta.service_model.service_name == 'sqs'
+        assert sns_client.meta.service_model.service_name == 'sns'
+
+    def test_client_by_region(self) -> None:
+        sut = ClientCache()
+
+        returned = sut.client('sqs', region_name='sa-east-1')
+
+        assert returned is not sut.client('sqs')
+        assert returned.meta.region_name == 'sa-east-1'
+
+    def test_client_by_config(self) -> None:
+        config = Config(retries={'max_attempts': 1})
+        sut = ClientCache()
+
+        returned = sut.client('sqs', config=config)
+
+        assert returned is sut.client('sqs', config=config)
+        assert returned is not sut.client('sqs')
+
+    def test_clear(self) -> None:
+        sut = ClientCache()
+        session = sut.session
+        client = sut.client('sqs')
+
+        sut.clear()
+
+        assert len(sut) == 0
+        assert sut.session is not session
+        assert sut.client('sqs') is not client
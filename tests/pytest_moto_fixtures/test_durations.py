@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from pytest_moto_fixtures.durations import FixtureDuration, FixtureDurations
+
+
+class TestFixtureDuration:
+    def test_total(self) -> None:
+        sut = FixtureDuration(name='fixture', calls=1, setup=1.5, teardown=0.25)
+
+        assert sut.total == 1.75  # noqa: PLR2004
+
+
+class TestFixtureDurations:
+    def test_empty(self) -> None:
+        sut = FixtureDurations()
+
+        assert sut.summary() == []
+
+    def test_setup_and_teardown(self) -> None:
+        sut = FixtureDurations()
+
+        with patch('pytest_moto_fixtures.durations.perf_counter', side_effect=[1.0, 3.0, 10.0, 10.5]):
+            sut.start_setup()
+            sut.stop_setup('fixture')
+            sut.start_teardown(1)
+            sut.stop_teardown(1, 'fixture')
+
+        assert sut.summary() == [FixtureDuration(name='fixture', calls=1, setup=2.0, teardown=0.5)]
+
+    def test_nested_setup(self) -> None:
+        sut = FixtureDurations()
+
+        with patch('pytest_moto_fixtures.durations.perf_counter', side_effect=[0.0, 1.0, 2.0, 3.0, 4.0, 8.0]):
+            sut.start_setup()
+            sut.start_setup()
+            sut.stop_setup('inner')
+            sut.start_setup()
+            sut.stop_setup(None)
+            sut.stop_setup('outer')
+
+        assert sut.summary() == [
+            FixtureDuration(name='outer', calls=1, setup=6.0, teardown=0.0),
+            FixtureDuration(name='inner', calls=1, setup=1.0, teardown=0.0),
+        ]
+
+    def test_teardown_without_start(self) -> None:
+        sut = FixtureDurations()
+
+        sut.stop_teardown(1, 'fixture')
+
+        assert sut.summary() == []
+
+    def test_merge(self) -> None:
+        sut = FixtureDurations()
+        other = FixtureDurations()
+        with patch('pytest_moto_fixtures.durations.perf_counter', side_effect=[0.0, 1.0, 0.0, 2.0]):
+            sut.start_setup()
+            sut.stop_setup('fixture')
+            other.start_setup()
+            other.stop_setup('fixture')
+
+        sut.merge(other.to_list())
+
+        assert sut.to_list() == [{'name': 'fixture', 'calls': 2, 'setup': 3.0, 'teardown': 0.0}]
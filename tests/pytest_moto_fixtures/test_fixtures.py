@@ -1,9 +1,14 @@
+import json
 import os
-from typing import TYPE_CHECKING
+import re
+import sys
+from typing import TYPE_CHECKING, Final
 from unittest.mock import patch
 
 import boto3
+import pytest
 
+from pytest_moto_fixtures.services.aio import AsyncEventBridgeBus, AsyncS3Bucket, AsyncSNSTopic, AsyncSQSQueue
 from pytest_moto_fixtures.services.eventbridge import EventBridgeBus
 from pytest_moto_fixtures.services.s3 import S3Bucket
 from pytest_moto_fixtures.services.sns import SNSTopic
@@ -68,3 +73,370 @@ def test_s3_bucket(s3_client: 'S3Client', s3_bucket: S3Bucket) -> None:
 def test_eventbridge_bus(eventbridge_client: 'EventBridgeClient', eventbridge_bus: EventBridgeBus) -> None:
     buses = eventbridge_client.list_event_buses(NamePrefix=eventbridge_bus.name)['EventBuses']
     assert eventbridge_bus.arn in [bus['Arn'] for bus in buses]
+
+
+def test_async_fixtures(  # noqa: PLR0913
+    sqs_queue: SQSQueue,
+    sns_topic: SNSTopic,
+    s3_bucket: S3Bucket,
+    eventbridge_bus: EventBridgeBus,
+    async_sqs_queue: AsyncSQSQueue,
+    async_sns_topic: AsyncSNSTopic,
+    async_s3_bucket: AsyncS3Bucket,
+    async_eventbridge_bus: AsyncEventBridgeBus,
+) -> None:
+    assert async_sqs_queue.queue is sqs_queue
+    assert async_sns_topic.topic is sns_topic
+    assert async_s3_bucket.bucket is s3_bucket
+    assert async_eventbridge_bus.bus is eventbridge_bus
+
+
+def test_async_fifo_fixtures(
+    sqs_fifo_queue: SQSQueue,
+    sns_fifo_topic: SNSTopic,
+    async_sqs_fifo_queue: AsyncSQSQueue,
+    async_sns_fifo_topic: AsyncSNSTopic,
+) -> None:
+    assert async_sqs_fifo_queue.queue is sqs_fifo_queue
+    assert async_sns_fifo_topic.topic is sns_fifo_topic
+
+
+class TestMotoSessionMock:
+    TESTS: Final = """
+        from moto.core.models import MockAWS
+
+        def test_create(sqs_client):
+            sqs_client.create_queue(QueueName='queue')
+
+        def test_check(sqs_client):
+            assert sqs_client.list_queues().get('QueueUrls', []) == []
+
+        def test_mock_active():
+            print(f'mock active: {MockAWS._nested_count}')
+    """
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(['*mock active: 0*'])
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_session_mock = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(['*mock active: 1*'])
+
+
+class TestMotoSqsQueuePool:
+    TESTS: Final = """
+        import pytest
+
+        @pytest.mark.parametrize('run', range(3))
+        def test_queue(sqs_client, sqs_queue, run):
+            assert len(sqs_queue) == 0
+            sqs_queue.send_message(body='message')
+            print(f'queue: {sqs_queue.url}')
+            assert sqs_client.list_queues()['QueueUrls'] == [sqs_queue.url]
+    """
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_session_mock = true\nmoto_sqs_queue_pool = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=3)
+        assert len({line.split('queue: ')[-1] for line in result.outlines if 'queue: ' in line}) == 1
+
+    def test_without_session_mock(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_sqs_queue_pool = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess()
+
+        result.stderr.fnmatch_lines(['*moto_sqs_queue_pool option requires moto_session_mock option*'])
+
+
+class TestMotoLazyResources:
+    TESTS: Final = """
+        def test_resources(sqs_client, sns_topic, eventbridge_bus):
+            print(f'queues: {len(sqs_client.list_queues().get("QueueUrls", []))}')
+            sns_topic.publish_message(message='message')
+            assert sns_topic.receive_message()['Message'] == 'message'
+    """
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*queues: 2*'])
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_lazy_resources = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*queues: 0*'])
+
+
+class TestMotoSnsRawMessageDelivery:
+    TESTS: Final = """
+        def test_topic(sns_topic):
+            sns_topic.publish_message(message='message')
+            received = sns_topic.queue.receive_message()
+            print(f'body: {received["Body"]}')
+    """
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*body: {*'])
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_sns_raw_message_delivery = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*body: message'])
+
+
+class TestMotoFastTeardown:
+    TESTS: Final = """
+        import pytest
+
+        @pytest.fixture
+        def calls(s3_client):
+            calls = []
+            s3_client.meta.events.register('before-call.s3', lambda model, **kwargs: calls.append(model.name))
+            yield calls
+            print(f'calls: {calls}')
+
+        def test_bucket(calls, s3_bucket):
+            s3_bucket['key'] = b'value'
+    """
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        created = re.escape("calls: ['CreateBucket', 'PutObject', ")
+        removed = re.escape("'DeleteObject', 'DeleteBucket']")
+        result.stdout.re_match_lines([f'.*{created}.*{removed}'])
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_fast_teardown = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.re_match_lines(['.*' + re.escape("calls: ['CreateBucket', 'PutObject']")])
+
+    def test_enabled_with_module_fixture(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_fast_teardown = true\n')
+        pytester.makepyfile(
+            """
+            from unittest.mock import MagicMock
+
+            import pytest
+
+            from pytest_moto_fixtures.services.sqs import sqs_create_queue
+
+            @pytest.fixture(scope='module')
+            def server_queue():
+                client = MagicMock()
+                with sqs_create_queue(sqs_client=client, lookup_arn=True) as queue:
+                    yield queue
+                print(f'deleted: {client.delete_queue.called}')
+
+            def test_queue(server_queue, sqs_queue):
+                pass
+            """
+        )
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*deleted: True'])
+
+
+class TestMotoXdistIsolation:
+    TESTS: Final = """
+        import os
+
+        import pytest
+
+        @pytest.mark.parametrize('run', range(4))
+        def test_queue(sqs_queue, run):
+            worker = int(os.environ['PYTEST_XDIST_WORKER'].removeprefix('gw'))
+            region = ['us-east-1', 'sa-east-1'][worker]
+            account = 123456789012 + worker
+            assert sqs_queue.arn == f'arn:aws:sqs:{region}:{account}:gw{worker}-{sqs_queue.name.split("-")[1]}'
+    """
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_xdist_isolation = true\nmoto_xdist_regions =\n    us-east-1\n    sa-east-1\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-n', '2')
+
+        result.assert_outcomes(passed=4)
+
+    def test_environ(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytester.makeini('[pytest]\nmoto_xdist_isolation = true\nmoto_xdist_regions =\n    us-east-1\n    sa-east-1\n')
+        pytester.makepyfile(
+            """
+            def test_environ(aws_environ):
+                assert aws_environ['MOTO_ACCOUNT_ID'] == '123456789015'
+                assert aws_environ['AWS_DEFAULT_REGION'] == 'sa-east-1'
+            """
+        )
+
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw3')
+
+        result = pytester.runpytest_subprocess()
+
+        result.assert_outcomes(passed=1)
+
+
+class TestMotoClientCache:
+    TESTS: Final = """
+        clients = set()
+
+        def test_first(sqs_client, sns_client, s3_client, eventbridge_client):
+            clients.add(id(sqs_client))
+            sqs_client.create_queue(QueueName='queue')
+
+        def test_second(sqs_client, sns_client, s3_client, eventbridge_client):
+            clients.add(id(sqs_client))
+            assert sqs_client.list_queues().get('QueueUrls', []) == []
+            print(f'clients: {len(clients)}')
+    """
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(['*clients: 2*'])
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_client_cache = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(['*clients: 1*'])
+
+
+class TestMotoLazyImport:
+    TESTS = """
+        import sys
+
+        def test_imported():
+            print(f'moto imported: {"moto" in sys.modules}')
+    """
+
+    def test_plugin_import(self, pytester: pytest.Pytester) -> None:
+        code = 'import sys, pytest_moto_fixtures.fixtures; print(sorted({"boto3", "moto"} & set(sys.modules)))'
+
+        result = pytester.run(sys.executable, '-c', code)
+
+        assert result.ret == 0
+        assert result.outlines == ['[]']
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*moto imported: True*'])
+
+    def test_enabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini('[pytest]\nmoto_lazy_import = true\n')
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-s')
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(['*moto imported: False*'])
+
+
+class TestMotoDurations:
+    TESTS = """
+        def test_queue(sqs_queue):
+            pass
+
+        def test_topic(sns_topic):
+            pass
+    """
+
+    def test_disabled(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess()
+
+        result.assert_outcomes(passed=2)
+        result.stdout.no_fnmatch_line('*moto fixture durations*')
+
+    def test_all(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('--moto-durations=0')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(
+            ['*= moto fixture durations =*', '*total*setup*teardown*calls*fixture*', '*s  *  2  sqs_client']
+        )
+        result.stdout.fnmatch_lines(['*s  *  1  sns_topic'])
+
+    def test_slowest(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('--moto-durations=1')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(['*= slowest 1 moto fixture durations =*', '*total*', '*s  *  ?  *'])
+
+    def test_json(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('--moto-durations-json=durations.json')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.no_fnmatch_line('*moto fixture durations*')
+        durations = json.loads((pytester.path / 'durations.json').read_text())
+        fixtures = {duration['name']: duration for duration in durations['fixtures']}
+        assert fixtures['sqs_client']['calls'] == 2  # noqa: PLR2004
+        assert fixtures['sns_topic']['calls'] == 1
+        assert fixtures['sqs_queue']['setup'] > 0
+
+    def test_xdist(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(self.TESTS)
+
+        result = pytester.runpytest_subprocess('-n', '2', '--moto-durations-json=durations.json')
+
+        result.assert_outcomes(passed=2)
+        durations = json.loads((pytester.path / 'durations.json').read_text())
+        fixtures = {duration['name']: duration for duration in durations['fixtures']}
+        assert fixtures['sqs_client']['calls'] == 2  # noqa: PLR2004
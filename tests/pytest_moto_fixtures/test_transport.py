@@ -0,0 +1,112 @@
+from typing import TYPE_CHECKING, Any
+from unittest.mock import ANY
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from pytest_moto_fixtures.services.sqs import SQSQueue
+from pytest_moto_fixtures.transport import enable_fast_transport
+from pytest_moto_fixtures.utils import randstr
+
+if TYPE_CHECKING:
+    from types_boto3_sqs import SQSClient
+
+
+@pytest.fixture
+def fast_sqs_client(aws_config: None) -> 'SQSClient':
+    client = boto3.client('sqs')
+    enable_fast_transport(client)
+    return client
+
+
+def _without_metadata(response: Any) -> dict[str, Any]:  # noqa: ANN401
+    return {key: value for key, value in response.items() if key != 'ResponseMetadata'}
+
+
+class TestSQSFastTransport:
+    def test_send_message(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        attributes: Any = {
+            'text': {'DataType': 'String', 'StringValue': randstr()},
+            'blob': {'DataType': 'Binary', 'BinaryValue': randstr().encode()},
+        }
+
+        fast = fast_sqs_client.send_message(QueueUrl=sqs_queue.url, MessageBody='body', MessageAttributes=attributes)
+        http = sqs_queue.client.send_message(QueueUrl=sqs_queue.url, MessageBody='body', MessageAttributes=attributes)
+
+        assert _without_metadata(fast) == {**_without_metadata(http), 'MessageId': ANY}
+        assert fast['ResponseMetadata']['HTTPStatusCode'] == 200  # noqa: PLR2004
+
+    def test_receive_message(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        attributes: Any = {
+            'text': {'DataType': 'String', 'StringValue': randstr()},
+            'blob': {'DataType': 'Binary', 'BinaryValue': randstr().encode()},
+        }
+        for _ in range(2):
+            sqs_queue.client.send_message(QueueUrl=sqs_queue.url, MessageBody='body', MessageAttributes=attributes)
+
+        fast = fast_sqs_client.receive_message(
+            QueueUrl=sqs_queue.url, MessageAttributeNames=['All'], MessageSystemAttributeNames=['All']
+        )
+        http = sqs_queue.client.receive_message(
+            QueueUrl=sqs_queue.url, MessageAttributeNames=['All'], MessageSystemAttributeNames=['All']
+        )
+
+        assert fast['Messages'][0]['MessageAttributes'] == attributes
+        assert fast['Messages'][0].keys() == http['Messages'][0].keys()
+        assert fast['Messages'][0]['Attributes'].keys() == http['Messages'][0]['Attributes'].keys()
+
+    def test_receive_message_from_empty_queue(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        fast = fast_sqs_client.receive_message(QueueUrl=sqs_queue.url)
+
+        assert 'Messages' not in fast
+
+    def test_receive_message_from_fifo_queue(self, fast_sqs_client: 'SQSClient', sqs_fifo_queue: SQSQueue) -> None:
+        sent = fast_sqs_client.send_message(
+            QueueUrl=sqs_fifo_queue.url, MessageBody='body', MessageDeduplicationId='id', MessageGroupId='group'
+        )
+
+        fast = fast_sqs_client.receive_message(QueueUrl=sqs_fifo_queue.url, MessageSystemAttributeNames=['All'])
+
+        assert fast['Messages'][0]['Attributes']['MessageGroupId'] == 'group'
+        assert fast['Messages'][0]['Attributes']['SequenceNumber'] == sent['SequenceNumber']
+
+    def test_delete_message(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        sqs_queue.send_message(body=randstr())
+        message = fast_sqs_client.receive_message(QueueUrl=sqs_queue.url, VisibilityTimeout=0)['Messages'][0]
+
+        fast_sqs_client.delete_message(QueueUrl=sqs_queue.url, ReceiptHandle=message['ReceiptHandle'])
+
+        assert len(sqs_queue) == 0
+
+    def test_get_queue_attributes(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        sqs_queue.send_message(body=randstr())
+        sqs_queue.send_message(body=randstr(), delay_seconds=10)
+        names: Any = ['ApproximateNumberOfMessages', 'ApproximateNumberOfMessagesDelayed']
+
+        fast = fast_sqs_client.get_queue_attributes(QueueUrl=sqs_queue.url, AttributeNames=names)
+        http = sqs_queue.client.get_queue_attributes(QueueUrl=sqs_queue.url, AttributeNames=names)
+
+        expected = {'ApproximateNumberOfMessages': '1', 'ApproximateNumberOfMessagesDelayed': '1'}
+        assert fast['Attributes'] == expected
+        assert http['Attributes'] == expected
+
+    def test_get_queue_attributes_not_supported(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        fast = fast_sqs_client.get_queue_attributes(QueueUrl=sqs_queue.url, AttributeNames=['QueueArn'])
+
+        assert fast['Attributes'] == {'QueueArn': sqs_queue.arn}
+
+    def test_error_queue_does_not_exist(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        with pytest.raises(ClientError, match='The specified queue does not exist'):
+            fast_sqs_client.send_message(QueueUrl=f'{sqs_queue.url}-invalid', MessageBody='body')
+
+    def test_error_invalid_parameter(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        with pytest.raises(ClientError, match='MaxNumberOfMessages'):
+            fast_sqs_client.receive_message(QueueUrl=sqs_queue.url, MaxNumberOfMessages=11)
+
+    def test_enable_twice(self, fast_sqs_client: 'SQSClient', sqs_queue: SQSQueue) -> None:
+        enable_fast_transport(fast_sqs_client)
+
+        fast_sqs_client.send_message(QueueUrl=sqs_queue.url, MessageBody='body')
+
+        assert len(sqs_queue) == 1
@@ -1,8 +1,22 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
 from random import randint
 from string import ascii_letters, digits
+from threading import get_ident
 from typing import Final
 
-from pytest_moto_fixtures.utils import randstr
+import pytest
+
+from pytest_moto_fixtures.utils import (
+    create_concurrently,
+    is_resource_removal_skipped,
+    randname,
+    randstr,
+    skip_resource_removal,
+    xdist_worker_id,
+    xdist_worker_number,
+)
 
 
 class TestRandStr:
@@ -31,3 +45,104 @@ class TestRandStr:
         assert len(returned) == length
         for char in returned:
             assert char in self.DEFAULT_CHARS
+
+
+class TestXdistWorker:
+    def test_without_xdist(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+
+        assert xdist_worker_id() is None
+        assert xdist_worker_number() is None
+
+    def test_with_xdist(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        number = randint(0, 64)
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', f'gw{number}')
+
+        assert xdist_worker_id() == f'gw{number}'
+        assert xdist_worker_number() == number
+
+
+class TestRandName:
+    DEFAULT_LENGTH: Final = 10
+
+    def test_without_xdist(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+
+        returned = randname()
+
+        assert len(returned) == self.DEFAULT_LENGTH
+        assert '-' not in returned
+
+    def test_with_xdist(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        number = randint(0, 64)
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', f'gw{number}')
+
+        returned = randname()
+
+        prefix, name = returned.split('-')
+        assert prefix == f'gw{number}'
+        assert len(name) == self.DEFAULT_LENGTH
+
+    def test_length(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        length = randint(3, 12)
+
+        returned = randname(length=length)
+
+        assert len(returned) == length
+
+
+class TestSkipResourceRemoval:
+    def test_context(self) -> None:
+        assert not is_resource_removal_skipped()
+
+        with skip_resource_removal():
+            assert is_resource_removal_skipped()
+            with skip_resource_removal():
+                assert is_resource_removal_skipped()
+            assert is_resource_removal_skipped()
+
+        assert not is_resource_removal_skipped()
+
+
+class TestCreateConcurrently:
+    def test_context(self) -> None:
+        values = [randstr() for _ in range(randint(10, 20))]
+        entered = []
+        exited = []
+        threads = set()
+
+        @contextmanager
+        def create(value: str) -> Iterator[str]:
+            threads.add(get_ident())
+            entered.append(value)
+            yield value
+            exited.append(value)
+
+        with create_concurrently([partial(create, value) for value in values], max_workers=4) as sut:
+            assert sut == values
+            assert sorted(entered) == sorted(values)
+            assert not exited
+
+        assert sorted(exited) == sorted(values)
+        assert get_ident() not in threads
+
+    def test_error_on_create(self) -> None:
+        values = [randstr() for _ in range(randint(10, 20))]
+        failed = values[randint(0, len(values) - 1)]
+        exited = []
+
+        @contextmanager
+        def create(value: str) -> Iterator[str]:
+            if value == failed:
+                raise ValueError(value)
+            yield value
+            exited.append(value)
+
+        with (
+            pytest.raises(ValueError, match=failed),
+            create_concurrently([partial(create, value) for value in values]),
+        ):
+            pytest.fail('Context should not be entered')
+
+        assert sorted(exited) == sorted(value for value in values if value != failed)